@@ -0,0 +1,126 @@
+from collections.abc import Mapping
+from asgiref.sync import sync_to_async
+from django.contrib.auth import authenticate
+from django.contrib.auth.hashers import make_password
+from django.http import JsonResponse
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework.authtoken.models import Token
+from rest_framework.exceptions import APIException, ValidationError
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+from ..hashing import PoolSaturated, hashing_pool
+from .serializers import RegistrationSerializer
+from .views import RegistrationView
+
+
+def parse_data(request):
+    """
+    Parses the body with the configured DRF parsers (JSON, form and multipart data),
+    like the sync views. Returns (data, None) or (None, error response).
+    """
+    drf_request = Request(request, parsers=[parser() for parser in api_settings.DEFAULT_PARSER_CLASSES])
+    try:
+        data = drf_request.data
+    except APIException as error:
+        return None, JsonResponse({"detail": str(error.detail)}, status=error.status_code)
+    if not isinstance(data, Mapping):
+        message = f"Invalid data. Expected a dictionary, but got {type(data).__name__}."
+        return None, JsonResponse({"non_field_errors": [message]}, status=400)
+    return data, None
+
+
+def authenticate_credentials(request, username, password):
+    """
+    Runs authenticate() in a hashing pool worker. Process workers get no request,
+    as it cannot be pickled.
+    """
+    return authenticate(request, username=username, password=password)
+
+
+def saturated_response():
+    response = JsonResponse({"error": "Too many requests, please try again."}, status=503)
+    response['Retry-After'] = '1'
+    return response
+
+
+def token_response(user, token, status):
+    return JsonResponse({
+        "token": token.key,
+        "username": user.username,
+        "email": user.email,
+        "user_id": user.id,
+    }, status=status)
+
+
+@method_decorator(csrf_exempt, name='dispatch')
+class AsyncRegistrationView(View):
+    """
+    Async variant of RegistrationView, used when ASYNC_AUTH_VIEWS is enabled.
+
+    GET:
+        Delegates to RegistrationView.
+    POST:
+        Validates the data with RegistrationSerializer, hashes the password in the
+        bounded hashing pool and creates the user, profile and token in one transaction.
+        Returns the same payload as RegistrationView; 503 if the hashing pool is saturated.
+    """
+
+    async def get(self, request, *args, **kwargs):
+        return await sync_to_async(RegistrationView.as_view())(request, *args, **kwargs)
+
+    async def post(self, request):
+        data, error_response = parse_data(request)
+        if error_response is not None:
+            return error_response
+
+        serializer = RegistrationSerializer(data=data)
+        if not await sync_to_async(serializer.is_valid)():
+            return JsonResponse(serializer.errors, status=400)
+
+        try:
+            encoded_password = await hashing_pool.run(make_password, serializer.validated_data['password'])
+        except PoolSaturated:
+            return saturated_response()
+
+        try:
+            user = await sync_to_async(serializer.save)(encoded_password=encoded_password)
+        except ValidationError as error:
+            return JsonResponse(error.detail, status=400)
+        return token_response(user, user.auth_token, 201)
+
+
+@method_decorator(csrf_exempt, name='dispatch')
+class AsyncLoginView(View):
+    """
+    Async variant of LoginView, used when ASYNC_AUTH_VIEWS is enabled.
+
+    POST:
+        Runs authenticate() with the configured backends (including the password hash
+        and the login signals) in the bounded hashing pool. Returns the same payload
+        as LoginView; 503 if the hashing pool is saturated.
+    """
+
+    async def post(self, request):
+        data, error_response = parse_data(request)
+        if error_response is not None:
+            return error_response
+
+        username = data.get("username")
+        password = data.get("password")
+        errors = {field: ["This field is required."] for field in ("username", "password") if not data.get(field)}
+        if errors:
+            return JsonResponse(errors, status=400)
+
+        worker_request = request if hashing_pool.executor_type == 'thread' else None
+        try:
+            user = await hashing_pool.run(authenticate_credentials, worker_request, username, password)
+        except PoolSaturated:
+            return saturated_response()
+
+        if user is None:
+            return JsonResponse({"error": ["Invalid username or password"]}, status=400)
+
+        token, created = await Token.objects.aget_or_create(user=user)
+        return token_response(user, token, 200)
@@ -1,5 +1,8 @@
 from django.contrib.auth import authenticate
+from django.contrib.auth.hashers import make_password
+from django.db import IntegrityError, transaction
 from rest_framework import serializers
+from rest_framework.authtoken.models import Token
 from profile_app.models import Profile
 from ..models import CustomUser
 
@@ -14,13 +17,15 @@ class RegistrationSerializer(serializers.ModelSerializer):
     - repeated_password: confirmation of the password (write-only)
 
     Validates:
-    - Email must be unique.
     - Password and repeated_password must match.
+    - Email must be unique. This is enforced by the 'customuser_email_unique' index on insert,
+      not by a pre-check, so concurrent registrations can not both succeed.
 
     On creation:
-    - Creates a new User instance with username set to email.
-    - Sets the password securely.
-    - Creates a related UserProfile instance.
+    - Hashes the password before the insert. An already hashed password can be passed
+      as 'encoded_password' to save() (used by the async view's hashing pool).
+    - Inserts the user, its Profile and its auth Token in one transaction,
+      one INSERT per table. The token is available as user.auth_token.
     """
     password = serializers.CharField(write_only=True, min_length=8)
     repeated_password = serializers.CharField(write_only=True)
@@ -29,10 +34,10 @@ class RegistrationSerializer(serializers.ModelSerializer):
         model = CustomUser
         fields = ["id", "username","email", "password", "repeated_password", "type"]
         read_only_fields = ["id"]
+        # No UniqueValidator for email, the unique index is checked on insert instead.
+        extra_kwargs = {"email": {"validators": []}}
     
     def validate(self, attrs):
-        if CustomUser.objects.filter(email=attrs['email']).exists():
-            raise serializers.ValidationError({"email": "User with this email already excist"})
         if attrs['password'] != attrs['repeated_password']:
             raise serializers.ValidationError({"repeated_password": "Password do not match"})
         return attrs
@@ -40,26 +45,41 @@ class RegistrationSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         password = validated_data.pop('password')
         validated_data.pop('repeated_password')
+        encoded_password = validated_data.pop('encoded_password', None) or make_password(password)
 
-        user = CustomUser.objects.create(**validated_data)
-        user.set_password(password)
-        user.save()
+        try:
+            with transaction.atomic():
+                user = CustomUser.objects.create(password=encoded_password, **validated_data)
 
-        Profile.objects.create(
-            user=user,
-            username=user.username,
-            first_name="",
-            last_name="",
-            file="",
-            location="",     
-            tel="",
-            description="",
-            working_hours="",
-            type=user.type,
-            email=user.email,
-            
-        )
+                Profile.objects.create(
+                    user=user,
+                    username=user.username,
+                    first_name="",
+                    last_name="",
+                    file="",
+                    location="",     
+                    tel="",
+                    description="",
+                    working_hours="",
+                    type=user.type,
+                    email=user.email,
+                    
+                )
+                Token.objects.create(user=user)
+        except IntegrityError:
+            raise serializers.ValidationError(self.get_conflict_errors(validated_data))
         return user
+
+    def get_conflict_errors(self, validated_data):
+        """
+        Builds the error response for a failed insert. Only runs after a unique index
+        rejected the registration, so the happy path needs no lookup. The messages are
+        lists, like the errors raised during validation.
+        """
+        email = validated_data.get('email')
+        if email and CustomUser.objects.filter(email=email).exists():
+            return {"email": ["User with this email already excist"]}
+        return {"username": ["A user with that username already exists."]}
     
 
 class LoginSerializer(serializers.Serializer):
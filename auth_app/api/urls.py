@@ -1,7 +1,14 @@
+from django.conf import settings
 from django.urls import path
-from.views import RegistrationView, LoginView
+from.views import RegistrationView, LoginView, PasswordHashingStatsView, TokenCacheStatsView
+from .async_views import AsyncLoginView, AsyncRegistrationView
+
+if settings.ASYNC_AUTH_VIEWS:
+    RegistrationView, LoginView = AsyncRegistrationView, AsyncLoginView
 
 urlpatterns=[
     path('registration/', RegistrationView.as_view(), name="regsitration"),
     path('login/', LoginView.as_view(), name="login"),
+    path('auth-cache-stats/', TokenCacheStatsView.as_view(), name="auth-cache-stats"),
+    path('password-hashing-stats/', PasswordHashingStatsView.as_view(), name="password-hashing-stats"),
 ]
\ No newline at end of file
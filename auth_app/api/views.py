@@ -1,7 +1,11 @@
 from rest_framework import generics, status
 from rest_framework.authtoken.models import Token
 from rest_framework.authtoken.views import ObtainAuthToken
+from rest_framework.permissions import IsAdminUser
 from rest_framework.response import Response
+from rest_framework.views import APIView
+from ..authentication import token_cache
+from ..hashing import hashing_pool
 from ..models import CustomUser
 from .serializers import RegistrationSerializer, LoginSerializer
 
@@ -12,7 +16,8 @@ class RegistrationView(generics.ListCreateAPIView):
     GET:
         Returns a list of all users (mainly for admin/testing purposes).
     POST:
-        Registers a new user with the provided data.
+        Registers a new user with the provided data. User, profile and token are
+        created in a single transaction.
         Returns an authentication token along with basic user info.
 
     Uses:
@@ -26,10 +31,8 @@ class RegistrationView(generics.ListCreateAPIView):
         serializer.is_valid(raise_exception=True)
         user = serializer.save()
 
-        token, created = Token.objects.get_or_create(user=user)
-
         return Response({
-            "token": token.key,
+            "token": user.auth_token.key,
             "username": user.username,
             "email": user.email,
             "user_id": user.id,
@@ -62,3 +65,37 @@ class LoginView(ObtainAuthToken):
             "email": user.email,
             "user_id": user.id,
         }, status=status.HTTP_200_OK)
+
+
+class TokenCacheStatsView(APIView):
+    """
+    API endpoint exposing the counters of the token authentication cache.
+
+    GET:
+        Returns hits (local and shared), misses, evictions, hit ratio and size
+        of the in-process cache of the answering worker.
+
+    Permissions:
+    - Only admin users (is_staff).
+    """
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response(token_cache.stats(), status=status.HTTP_200_OK)
+
+
+class PasswordHashingStatsView(APIView):
+    """
+    API endpoint exposing the state of the password hashing pool used by the async auth views.
+
+    GET:
+        Returns running and queued jobs (queue depth), completed and rejected jobs
+        and the pool limits of the answering worker.
+
+    Permissions:
+    - Only admin users (is_staff).
+    """
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response(hashing_pool.stats(), status=status.HTTP_200_OK)
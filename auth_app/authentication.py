@@ -0,0 +1,165 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+
+DEFAULTS = {
+    'MAX_SIZE': 10000,
+    'TTL': 60,
+    'SHARED_CACHE': None,
+    'SHARED_TTL': 300,
+}
+SHARED_KEY_PREFIX = 'auth_token:'
+
+
+def get_setting(name):
+    return getattr(settings, 'TOKEN_AUTH_CACHE', {}).get(name, DEFAULTS[name])
+
+
+class TokenCache:
+    """
+    Thread-safe in-process LRU cache mapping token keys to (user, token) pairs.
+
+    Entries expire after 'ttl' seconds; the least recently used entry is dropped
+    when 'max_size' is reached. Hit and miss counters are kept for monitoring.
+    """
+
+    def __init__(self, max_size, ttl):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.counters = {'local_hits': 0, 'shared_hits': 0, 'misses': 0, 'evictions': 0}
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at < time.monotonic():
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            self.counters['local_hits'] += 1
+            return value
+
+    def set(self, key, value):
+        with self.lock:
+            self.entries[key] = (value, time.monotonic() + self.ttl)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+                self.counters['evictions'] += 1
+
+    def delete(self, key):
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def count(self, counter):
+        with self.lock:
+            self.counters[counter] += 1
+
+    def stats(self):
+        with self.lock:
+            stats = dict(self.counters, size=len(self.entries), max_size=self.max_size, ttl=self.ttl)
+        lookups = stats['local_hits'] + stats['shared_hits'] + stats['misses']
+        stats['hit_ratio'] = round((stats['local_hits'] + stats['shared_hits']) / lookups, 4) if lookups else 0
+        return stats
+
+
+token_cache = TokenCache(get_setting('MAX_SIZE'), get_setting('TTL'))
+
+
+def get_shared_cache():
+    alias = get_setting('SHARED_CACHE')
+    return caches[alias] if alias else None
+
+
+def invalidate_tokens(keys):
+    """
+    Removes the given token keys from the local and the shared cache.
+    """
+    keys = list(keys)
+    for key in keys:
+        token_cache.delete(key)
+    shared_cache = get_shared_cache()
+    if shared_cache is not None and keys:
+        shared_cache.delete_many([SHARED_KEY_PREFIX + key for key in keys])
+
+
+def dump_shared(user, token):
+    """
+    Returns the shared cache entry of a token: the token fields and the user fields
+    without the password hash, which must not leave the database.
+    """
+    user_fields = {field.attname: getattr(user, field.attname) for field in user._meta.concrete_fields if field.attname != 'password'}
+    token_fields = {field.attname: getattr(token, field.attname) for field in token._meta.concrete_fields}
+    return {'user': user_fields, 'token': token_fields}
+
+
+def load_shared(entry):
+    """
+    Rebuilds (user, token) from a shared cache entry. The password is a deferred field,
+    so it is loaded on access and left out when the user is saved.
+    """
+    user_model = get_user_model()
+    user = user_model.from_db(user_model.objects.db, list(entry['user']), list(entry['user'].values()))
+    token = Token.from_db(Token.objects.db, list(entry['token']), list(entry['token'].values()))
+    token.user = user
+    return user, token
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    TokenAuthentication that resolves token keys from a cache instead of the database.
+
+    Lookup order:
+    - In-process LRU with TTL (TOKEN_AUTH_CACHE['MAX_SIZE'], ['TTL']).
+    - Optional shared Django cache (TOKEN_AUTH_CACHE['SHARED_CACHE'] alias, ['SHARED_TTL']);
+      it stores the token and user fields without the password hash (dump_shared()).
+    - The Token/User query of TokenAuthentication; the result is stored in both caches.
+
+    Entries are invalidated by the signal handlers in auth_app.signals when a token
+    is deleted or its user is saved or deleted. Other processes only see the change
+    after their local TTL, so keep 'TTL' short.
+    """
+
+    def authenticate_credentials(self, key):
+        cached = token_cache.get(key)
+        if cached is None:
+            cached = self.get_shared(key)
+        if cached is None:
+            token_cache.count('misses')
+            user, token = super().authenticate_credentials(key)
+            cached = (user, token)
+            self.set_shared(key, cached)
+            token_cache.set(key, cached)
+        user, token = cached
+        return copy.copy(user), token
+
+    def get_shared(self, key):
+        shared_cache = get_shared_cache()
+        if shared_cache is None:
+            return None
+        entry = shared_cache.get(SHARED_KEY_PREFIX + key)
+        if entry is None:
+            return None
+        token_cache.count('shared_hits')
+        cached = load_shared(entry)
+        token_cache.set(key, cached)
+        return cached
+
+    def set_shared(self, key, value):
+        shared_cache = get_shared_cache()
+        if shared_cache is not None:
+            shared_cache.set(SHARED_KEY_PREFIX + key, dump_shared(*value), get_setting('SHARED_TTL'))
@@ -0,0 +1,103 @@
+import asyncio
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from django.conf import settings
+from django.db import close_old_connections
+
+DEFAULTS = {
+    'EXECUTOR': 'thread',
+    'MAX_WORKERS': 4,
+    'MAX_QUEUE': 64,
+}
+
+
+def setup_worker():
+    """
+    Initializer for process pools: with the spawn and forkserver start methods the
+    worker processes start without configured Django, so password hashers cannot run.
+    """
+    import django
+    django.setup()
+
+
+def run_job(func, *args):
+    """
+    Runs a job in a pool worker. Like a request, the job starts and ends with
+    close_old_connections(), so ORM queries of the job (e.g. authenticate()) do not
+    keep stale or expired database connections open in the worker.
+    """
+    close_old_connections()
+    try:
+        return func(*args)
+    finally:
+        close_old_connections()
+
+
+class PoolSaturated(Exception):
+    """
+    Raised when the hashing pool already holds MAX_QUEUE pending jobs.
+    """
+
+
+class HashingPool:
+    """
+    Bounded worker pool for password hashing used by the async auth views.
+
+    - At most 'max_workers' hashes run at the same time (threads or processes).
+    - At most 'max_queue' jobs may be pending (running + waiting); further jobs are
+      rejected with PoolSaturated instead of piling up.
+    - Process workers are set up with setup_worker(), so they can use Django.
+    - Counters (running, queued, completed, failed, rejected) are exposed through stats();
+      'completed' only counts jobs that returned, 'failed' the ones that raised.
+    """
+
+    def __init__(self, executor, max_workers, max_queue):
+        self.executor_type = executor
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.executor = None
+        self.lock = threading.Lock()
+        self.pending = 0
+        self.counters = {'completed': 0, 'failed': 0, 'rejected': 0}
+
+    def get_executor(self):
+        if self.executor is None:
+            if self.executor_type == 'process':
+                self.executor = ProcessPoolExecutor(max_workers=self.max_workers, initializer=setup_worker)
+            else:
+                self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='password-hashing')
+        return self.executor
+
+    async def run(self, func, *args):
+        with self.lock:
+            if self.pending >= self.max_queue:
+                self.counters['rejected'] += 1
+                raise PoolSaturated()
+            self.pending += 1
+        outcome = 'failed'
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(self.get_executor(), run_job, func, *args)
+            outcome = 'completed'
+            return result
+        finally:
+            with self.lock:
+                self.pending -= 1
+                self.counters[outcome] += 1
+
+    def stats(self):
+        with self.lock:
+            return {
+                'executor': self.executor_type,
+                'max_workers': self.max_workers,
+                'max_queue': self.max_queue,
+                'running': min(self.pending, self.max_workers),
+                'queued': max(0, self.pending - self.max_workers),
+                **self.counters,
+            }
+
+
+def get_setting(name):
+    return getattr(settings, 'PASSWORD_HASHING_POOL', {}).get(name, DEFAULTS[name])
+
+
+hashing_pool = HashingPool(get_setting('EXECUTOR'), get_setting('MAX_WORKERS'), get_setting('MAX_QUEUE'))
@@ -0,0 +1,148 @@
+import csv
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from django.contrib.auth.hashers import identify_hasher, make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError, transaction
+from auth_app.hashing import setup_worker
+from auth_app.models import CustomUser
+from base_info_app.signals import apply_delta
+from profile_app.models import Profile
+
+PROFILE_FIELDS = ['first_name', 'last_name', 'location', 'tel', 'description', 'working_hours']
+TYPES = dict(CustomUser.TYPE_CHOICES)
+
+
+def encode_password(password):
+    """
+    Hashes a raw password; already encoded Django hashes are kept, empty passwords become unusable.
+    """
+    if not password:
+        return make_password(None)
+    try:
+        identify_hasher(password)
+        return password
+    except ValueError:
+        return make_password(password)
+
+
+def read_rows(path, file_format):
+    with open(path, newline='', encoding='utf-8') as file:
+        if file_format == 'csv':
+            yield from csv.DictReader(file)
+        else:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+
+
+class Command(BaseCommand):
+    """
+    Imports users with their profiles from a CSV or JSONL file.
+
+    Columns / keys:
+    - username, email, type (customer or business), password (raw or an encoded Django hash)
+    - optional profile fields: first_name, last_name, location, tel, description, working_hours
+
+    Behavior:
+    - Rows are written in batches with bulk_create, one INSERT per table and batch,
+      each batch in its own transaction.
+    - Rows with a missing username, an unknown type or a username/email that already
+      exists (in the database or earlier in the file) are skipped and reported.
+    - Passwords are hashed in a process pool (--workers).
+    - bulk_create bypasses the model signals, so every batch updates the BaseInfo business
+      profile counter in its own transaction; an interrupted import leaves the counter in sync.
+      Tokens are created on the first login.
+    """
+    help = "Bulk imports users and profiles from a CSV or JSONL file."
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="CSV file with a header row or JSONL file with one object per line.")
+        parser.add_argument('--format', choices=['csv', 'jsonl'], help="Input format, defaults to the file extension.")
+        parser.add_argument('--batch-size', type=int, default=1000, help="Users per bulk_create batch.")
+        parser.add_argument('--workers', type=int, default=os.cpu_count(), help="Processes used for password hashing.")
+
+    def handle(self, *args, **options):
+        path = options['path']
+        file_format = options['format'] or ('csv' if path.lower().endswith('.csv') else 'jsonl')
+        if not os.path.exists(path):
+            raise CommandError(f"File not found: {path}")
+
+        self.seen_usernames = set()
+        self.seen_emails = set()
+        self.created = 0
+        self.skipped = 0
+
+        with ProcessPoolExecutor(max_workers=options['workers'], initializer=setup_worker) as executor:
+            batch = []
+            for line, row in enumerate(read_rows(path, file_format), start=1):
+                batch.append((line, row))
+                if len(batch) >= options['batch_size']:
+                    self.import_batch(batch, executor)
+                    batch = []
+            if batch:
+                self.import_batch(batch, executor)
+
+        self.stdout.write(self.style.SUCCESS(f"Imported {self.created} users, skipped {self.skipped}."))
+
+    def import_batch(self, batch, executor):
+        rows = self.clean_rows(batch)
+        if not rows:
+            return
+
+        passwords = executor.map(encode_password, [row.get('password') or '' for row in rows], chunksize=16)
+        users = [
+            CustomUser(username=row['username'], email=row['email'], type=row['type'], password=password)
+            for row, password in zip(rows, passwords)
+        ]
+        try:
+            with transaction.atomic():
+                users = CustomUser.objects.bulk_create(users)
+                Profile.objects.bulk_create([
+                    Profile(
+                        user=user, username=user.username, email=user.email, type=user.type,
+                        **{field: row.get(field) or '' for field in PROFILE_FIELDS},
+                    )
+                    for user, row in zip(users, rows)
+                ])
+                apply_delta(business_profile_count=sum(1 for user in users if user.type == 'business'))
+        except IntegrityError as error:
+            raise CommandError(f"Batch ending at line {batch[-1][0]} was rolled back: {error}")
+
+        self.created += len(users)
+
+    def clean_rows(self, batch):
+        """
+        Drops invalid and duplicated rows; existing users are looked up with one query per batch.
+        """
+        usernames = [str(row.get('username') or '').strip() for _, row in batch]
+        emails = [str(row.get('email') or '').strip() for _, row in batch]
+        existing = CustomUser.objects.filter(username__in=usernames).values_list('username', flat=True)
+        taken_usernames = set(existing) | self.seen_usernames
+        taken_emails = set(
+            CustomUser.objects.filter(email__in=[email for email in emails if email]).values_list('email', flat=True)
+        ) | self.seen_emails
+
+        rows = []
+        for (line, row), username, email in zip(batch, usernames, emails):
+            error = None
+            if not username:
+                error = "missing username"
+            elif row.get('type') not in TYPES:
+                error = f"unknown type {row.get('type')!r}"
+            elif username in taken_usernames:
+                error = f"username {username!r} already exists"
+            elif email and email in taken_emails:
+                error = f"email {email!r} already exists"
+            if error:
+                self.skipped += 1
+                self.stderr.write(f"Line {line}: skipped, {error}.")
+                continue
+            taken_usernames.add(username)
+            self.seen_usernames.add(username)
+            if email:
+                taken_emails.add(email)
+                self.seen_emails.add(email)
+            rows.append(dict(row, username=username, email=email))
+        return rows
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.7 on 2026-10-18 17:39
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def check_duplicate_emails(apps, schema_editor):
+    """
+    Users can not be merged automatically, so duplicated emails have to be fixed by hand first.
+    """
+    CustomUser = apps.get_model('auth_app', 'CustomUser')
+    duplicates = list(
+        CustomUser.objects.exclude(email='').values('email')
+        .annotate(count=Count('id')).filter(count__gt=1).values_list('email', flat=True)[:20]
+    )
+    if duplicates:
+        raise RuntimeError(
+            "Can not add the unique email constraint, these emails are used by several users: "
+            + ", ".join(duplicates)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('auth_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(check_duplicate_emails, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='customuser',
+            constraint=models.UniqueConstraint(condition=models.Q(('email', ''), _negated=True), fields=('email',), name='customuser_email_unique'),
+        ),
+    ]
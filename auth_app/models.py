@@ -8,3 +8,9 @@ class CustomUser(AbstractUser):
     )
    
     type = models.CharField(max_length=20, choices=TYPE_CHOICES)
+
+    class Meta(AbstractUser.Meta):
+        constraints = [
+            # Registration relies on this index instead of an exists() pre-check.
+            models.UniqueConstraint(fields=['email'], condition=~models.Q(email=''), name='customuser_email_unique'),
+        ]
@@ -0,0 +1,22 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+from .authentication import invalidate_tokens
+from .models import CustomUser
+
+
+@receiver(post_delete, sender=Token)
+def invalidate_deleted_token(sender, instance, **kwargs):
+    invalidate_tokens([instance.key])
+
+
+@receiver(post_save, sender=CustomUser)
+@receiver(post_delete, sender=CustomUser)
+def invalidate_user_tokens(sender, instance, **kwargs):
+    """
+    Drops the cached tokens of a changed user, so the next request loads the current user.
+    A newly created user has no tokens yet, so registration skips the lookup.
+    """
+    if kwargs.get('created'):
+        return
+    invalidate_tokens(Token.objects.filter(user_id=instance.pk).values_list('key', flat=True))
@@ -1,3 +1,263 @@
-from django.test import TestCase
+import asyncio
+import io
+import json
+import os
+import tempfile
+from urllib.parse import urlencode
+from unittest import mock
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.core.cache import cache
+from django.db import IntegrityError
+from django.test import AsyncRequestFactory, TestCase, TransactionTestCase, override_settings
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+from base_info_app.models import BaseInfo
+from profile_app.models import Profile
+from .api.async_views import AsyncLoginView, AsyncRegistrationView
+from .authentication import SHARED_KEY_PREFIX, CachedTokenAuthentication, token_cache
+from .hashing import HashingPool, PoolSaturated
+from .models import CustomUser
 
-# Create your tests here.
+
+REGISTRATION = {
+    "username": "anna", "email": "anna@example.com", "password": "secret123",
+    "repeated_password": "secret123", "type": "customer",
+}
+
+
+class RegistrationTests(APITestCase):
+    """
+    Registration creates user, profile and token in one transaction and reports
+    unique index conflicts in the usual error format.
+    """
+
+    def test_duplicate_email_returns_list_error(self):
+        self.client.post('/api/registration/', REGISTRATION, format='json')
+        response = self.client.post('/api/registration/', dict(REGISTRATION, username='anna2'), format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data, {"email": ["User with this email already excist"]})
+        self.assertEqual(CustomUser.objects.count(), 1)
+
+    def test_failed_insert_leaves_no_profile_or_token(self):
+        with mock.patch.object(Token.objects, 'create', side_effect=IntegrityError('token')):
+            response = self.client.post('/api/registration/', REGISTRATION, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data, {"username": ["A user with that username already exists."]})
+        self.assertFalse(CustomUser.objects.exists())
+        self.assertFalse(Profile.objects.exists())
+        self.assertFalse(Token.objects.exists())
+
+
+class ImportUsersTests(TestCase):
+    """
+    import_users writes users and profiles in batches and keeps the BaseInfo counter in sync.
+    """
+
+    def write_file(self, lines):
+        with tempfile.NamedTemporaryFile('w', suffix='.jsonl', delete=False, encoding='utf-8') as file:
+            file.write('\n'.join(lines) + '\n')
+        self.addCleanup(os.remove, file.name)
+        return file.name
+
+    def import_users(self, path, *args):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        call_command('import_users', path, '--workers', '1', *args, stdout=stdout, stderr=stderr)
+        return stdout.getvalue(), stderr.getvalue()
+
+    def test_import_creates_users_and_profiles(self):
+        CustomUser.objects.create_user(username='taken', email='taken@example.com', password='pw', type='customer')
+        business_count = BaseInfo.load().business_profile_count
+        path = self.write_file([
+            '{"username": "shop", "email": "shop@example.com", "type": "business", "password": "secret123", "location": "Berlin"}',
+            '{"username": "buyer", "email": "buyer@example.com", "type": "customer", "password": ""}',
+            '{"username": "taken", "email": "other@example.com", "type": "customer"}',
+            '{"username": "nobody", "type": "admin"}',
+        ])
+
+        stdout, stderr = self.import_users(path, '--batch-size', '2')
+
+        self.assertIn('Imported 2 users, skipped 2', stdout)
+        self.assertIn("Line 3: skipped, username 'taken' already exists.", stderr)
+        self.assertIn("Line 4: skipped, unknown type 'admin'.", stderr)
+        shop = CustomUser.objects.get(username='shop')
+        self.assertTrue(shop.check_password('secret123'))
+        self.assertFalse(CustomUser.objects.get(username='buyer').has_usable_password())
+        self.assertEqual(Profile.objects.get(user=shop).location, 'Berlin')
+        self.assertEqual(BaseInfo.load().business_profile_count, business_count + 1)
+
+    def test_failed_batch_keeps_counter_of_committed_batches(self):
+        business_count = BaseInfo.load().business_profile_count
+        path = self.write_file([
+            '{"username": "shop1", "email": "shop1@example.com", "type": "business", "password": "pbkdf2_sha256$1$salt$hash"}',
+            '{"username": "shop2", "email": "shop2@example.com", "type": "business", "password": "pbkdf2_sha256$1$salt$hash"}',
+        ])
+        bulk_create = Profile.objects.bulk_create
+
+        def fail_second_batch(profiles, *args, **kwargs):
+            if profiles[0].username == 'shop2':
+                raise IntegrityError('profile')
+            return bulk_create(profiles, *args, **kwargs)
+
+        with mock.patch.object(Profile.objects, 'bulk_create', side_effect=fail_second_batch):
+            with self.assertRaises(CommandError):
+                self.import_users(path, '--batch-size', '1')
+
+        self.assertEqual(list(CustomUser.objects.values_list('username', flat=True)), ['shop1'])
+        self.assertEqual(BaseInfo.load().business_profile_count, business_count + 1)
+
+
+class HashingPoolTests(APITestCase):
+    """
+    The pool bounds pending jobs and counts completed, failed and rejected jobs.
+    """
+
+    def test_counts_completed_and_failed_jobs(self):
+        pool = HashingPool('thread', 2, 4)
+
+        async def run_jobs():
+            self.assertEqual(await pool.run(pow, 2, 3), 8)
+            with self.assertRaises(ZeroDivisionError):
+                await pool.run(divmod, 1, 0)
+
+        asyncio.run(run_jobs())
+        stats = pool.stats()
+        self.assertEqual((stats['completed'], stats['failed'], stats['rejected']), (1, 1, 0))
+        self.assertEqual((stats['running'], stats['queued']), (0, 0))
+
+    def test_rejects_jobs_beyond_max_queue(self):
+        pool = HashingPool('thread', 1, 0)
+        with self.assertRaises(PoolSaturated):
+            asyncio.run(pool.run(pow, 2, 3))
+        self.assertEqual(pool.stats()['rejected'], 1)
+
+    def test_stats_view_is_admin_only(self):
+        admin = CustomUser.objects.create_user(username='admin', password='pw', is_staff=True)
+        user = CustomUser.objects.create_user(username='user', password='pw', type='customer')
+        self.client.force_authenticate(user)
+        self.assertEqual(self.client.get('/api/password-hashing-stats/').status_code, 403)
+        self.client.force_authenticate(admin)
+        response = self.client.get('/api/password-hashing-stats/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            set(response.data),
+            {'executor', 'max_workers', 'max_queue', 'running', 'queued', 'completed', 'failed', 'rejected'},
+        )
+
+
+class AsyncAuthViewTests(TransactionTestCase):
+    """
+    The async auth views accept the same request formats as the DRF views and return
+    their payloads. Transactional, as the hashing pool threads use their own connections.
+    """
+
+    def setUp(self):
+        self.factory = AsyncRequestFactory()
+        CustomUser.objects.create_user(username='anna', email='anna@example.com', password='secret123', type='customer')
+
+    def login(self, data, **kwargs):
+        request = self.factory.post('/api/login/', data, **kwargs)
+        return asyncio.run(AsyncLoginView.as_view()(request))
+
+    def test_login_with_json_and_form_data(self):
+        credentials = {'username': 'anna', 'password': 'secret123'}
+        for response in (
+            self.login(credentials, content_type='application/json'),
+            self.login(urlencode(credentials), content_type='application/x-www-form-urlencoded'),
+            self.login(credentials),
+        ):
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(json.loads(response.content)['token'], Token.objects.get(user__username='anna').key)
+
+    def test_login_errors(self):
+        response = self.login({'username': 'anna', 'password': 'wrong'}, content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(json.loads(response.content), {"error": ["Invalid username or password"]})
+
+        response = self.login('{"username": ', content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('detail', json.loads(response.content))
+
+        response = self.login({'username': 'anna'}, content_type='application/json')
+        self.assertEqual(json.loads(response.content), {"password": ["This field is required."]})
+
+    def test_saturated_pool_returns_503(self):
+        with mock.patch('auth_app.api.async_views.hashing_pool', HashingPool('thread', 1, 0)):
+            response = self.login({'username': 'anna', 'password': 'secret123'}, content_type='application/json')
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response['Retry-After'], '1')
+
+    def test_registration_with_multipart_data(self):
+        request = self.factory.post('/api/registration/', dict(REGISTRATION, username='ben', email='ben@example.com'))
+        response = asyncio.run(AsyncRegistrationView.as_view()(request))
+        self.assertEqual(response.status_code, 201)
+        user = CustomUser.objects.get(username='ben')
+        self.assertEqual(json.loads(response.content)['token'], user.auth_token.key)
+        self.assertTrue(Profile.objects.filter(user=user).exists())
+
+    def test_registration_conflict_returns_list_error(self):
+        request = self.factory.post('/api/registration/', dict(REGISTRATION, username='ben'), content_type='application/json')
+        response = asyncio.run(AsyncRegistrationView.as_view()(request))
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(json.loads(response.content), {"email": ["User with this email already excist"]})
+
+
+class TokenCacheTests(APITestCase):
+    """
+    Token lookups are served from the caches until the token or its user changes.
+    """
+
+    def setUp(self):
+        token_cache.clear()
+        cache.clear()
+        self.user = CustomUser.objects.create_user(username='anna', password='secret123', type='customer', is_staff=True)
+        self.token = Token.objects.create(user=self.user)
+        self.authentication = CachedTokenAuthentication()
+
+    def authenticate(self):
+        return self.authentication.authenticate_credentials(self.token.key)
+
+    def test_second_lookup_is_a_local_hit(self):
+        misses = token_cache.stats()['misses']
+        with self.assertNumQueries(1):
+            self.authenticate()
+        with self.assertNumQueries(0):
+            user, token = self.authenticate()
+        self.assertEqual((user.pk, token.key), (self.user.pk, self.token.key))
+        self.assertEqual(token_cache.stats()['misses'], misses + 1)
+
+    def test_deleted_token_is_invalidated(self):
+        self.authenticate()
+        self.token.delete()
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
+
+    def test_saved_user_is_invalidated(self):
+        self.authenticate()
+        self.user.first_name = 'Anna'
+        self.user.save()
+        with self.assertNumQueries(1):
+            user, _ = self.authenticate()
+        self.assertEqual(user.first_name, 'Anna')
+
+    @override_settings(TOKEN_AUTH_CACHE={'SHARED_CACHE': 'default'})
+    def test_shared_cache_stores_no_password_hash(self):
+        self.authenticate()
+        entry = cache.get(SHARED_KEY_PREFIX + self.token.key)
+        self.assertNotIn('password', entry['user'])
+        self.assertNotIn(self.user.password, repr(entry))
+
+        token_cache.clear()
+        with self.assertNumQueries(0):
+            user, token = self.authenticate()
+        self.assertEqual((user.pk, user.username, token.user_id), (self.user.pk, 'anna', self.user.pk))
+        self.assertTrue(user.check_password('secret123'))
+
+    def test_stats_endpoint(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        self.client.get('/api/auth-cache-stats/')
+        response = self.client.get('/api/auth-cache-stats/')
+        self.assertEqual(response.status_code, 200)
+        self.assertGreaterEqual(response.data['local_hits'], 1)
+        self.assertEqual(response.data['size'], 1)
@@ -1,11 +1,7 @@
-from django.db.models import Avg
 from rest_framework import serializers
 from ..models import BaseInfo
-from reviews_app.models import Review
-from profile_app.models import Profile
-from offers_app.models import Offer
 
-class BaseInfoSerializer(serializers.Serializer):
+class BaseInfoSerializer(serializers.ModelSerializer):
     """
     Serializer for aggregated platform statistics.
 
@@ -18,29 +14,11 @@ class BaseInfoSerializer(serializers.Serializer):
     - offer_count: Total number of offers created on the platform.
 
     Notes:
-    - This serializer does not rely on a single model instance.
+    - Reads the single, incrementally maintained BaseInfo row, no aggregation is done here.
     - Intended for use in dashboard or overview endpoints (e.g. /api/base-info/).
     """
-    review_count = serializers.SerializerMethodField()
-    average_rating = serializers.SerializerMethodField()
-    business_profile_count = serializers.SerializerMethodField()
-    offer_count = serializers.SerializerMethodField()
+    average_rating = serializers.ReadOnlyField()
 
-    def get_review_count(self, obj):
-        count = Review.objects.count() or 0
-        return count
-    
-    def get_average_rating(self, obj):
-        avg = Review.objects.aggregate(avg_rating=Avg('rating'))['avg_rating']
-        if avg is None:
-            return 0
-        return round(avg, 1)
-    
-    def get_business_profile_count(self, obj):
-        count = Profile.objects.filter(type='business').count() or 0
-
-        return count 
-
-    def get_offer_count(self, obj):
-        count =Offer.objects.count() or 0
-        return count
\ No newline at end of file
+    class Meta:
+        model = BaseInfo
+        fields = ['review_count', 'average_rating', 'business_profile_count', 'offer_count']
@@ -1,6 +1,10 @@
+from django.conf import settings
+from django.core.cache import cache
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from ..models import BaseInfo
+from ..signals import CACHE_KEY
 from .serializers import BaseInfoSerializer
 
 
@@ -13,7 +17,13 @@ class BaseInfoView(APIView):
     - Average rating across all reviews
     - Total number of business profiles
     - Total number of offers
+
+    The data is read from the BaseInfo row through a read-through cache.
+    The cache TTL is configured with the BASE_INFO_CACHE_TTL setting (seconds).
     """
     def get(self, request):
-        serializer = BaseInfoSerializer(instance={})
-        return Response(serializer.data, status=status.HTTP_200_OK)
\ No newline at end of file
+        data = cache.get(CACHE_KEY)
+        if data is None:
+            data = BaseInfoSerializer(BaseInfo.load()).data
+            cache.set(CACHE_KEY, data, getattr(settings, 'BASE_INFO_CACHE_TTL', 60))
+        return Response(data, status=status.HTTP_200_OK)
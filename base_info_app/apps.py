@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class BaseInfoAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'base_info_app'
+
+    def ready(self):
+        from . import signals  # noqa: F401
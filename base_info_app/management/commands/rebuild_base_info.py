@@ -0,0 +1,18 @@
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from base_info_app.models import BaseInfo
+from base_info_app.signals import CACHE_KEY
+
+
+class Command(BaseCommand):
+    """
+    Recomputes the BaseInfo counters from the source tables.
+
+    Needed after writes that bypass model signals, e.g. bulk_create or queryset updates.
+    """
+    help = "Recomputes the platform statistics row used by /api/base-info/."
+
+    def handle(self, *args, **options):
+        info = BaseInfo.recompute()
+        cache.delete(CACHE_KEY)
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt base info: {info}"))
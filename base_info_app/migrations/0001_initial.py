@@ -0,0 +1,45 @@
+# Generated by Django 5.2.7 on 2026-10-18 17:29
+
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def seed_base_info(apps, schema_editor):
+    BaseInfo = apps.get_model('base_info_app', 'BaseInfo')
+    Offer = apps.get_model('offers_app', 'Offer')
+    Profile = apps.get_model('profile_app', 'Profile')
+    Review = apps.get_model('reviews_app', 'Review')
+
+    reviews = Review.objects.aggregate(review_count=Count('id'), rating_sum=Sum('rating'))
+    BaseInfo.objects.create(
+        pk=1,
+        review_count=reviews['review_count'],
+        rating_sum=reviews['rating_sum'] or 0,
+        business_profile_count=Profile.objects.filter(type='business').count(),
+        offer_count=Offer.objects.count(),
+    )
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('offers_app', '0014_offer_search_index'),
+        ('profile_app', '0003_remove_profile_uploaded_at'),
+        ('reviews_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BaseInfo',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('review_count', models.IntegerField(default=0)),
+                ('rating_sum', models.BigIntegerField(default=0)),
+                ('business_profile_count', models.IntegerField(default=0)),
+                ('offer_count', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(seed_base_info, migrations.RunPython.noop),
+    ]
@@ -1,7 +1,64 @@
 from django.db import models
+from django.db.models import Count, F, Sum
+
 
 class BaseInfo(models.Model):
-    review_count = models.IntegerField()
-    average_rating = models.IntegerField()
-    business_profile_count = models.IntegerField()
-    offer_count = models.IntegerField()
+    """
+    Single-row table holding the platform statistics shown on /api/base-info/.
+
+    The counters are maintained incrementally by the signal handlers in base_info_app.signals.
+    The average rating is derived from the running rating_sum / review_count pair.
+    """
+    review_count = models.IntegerField(default=0)
+    rating_sum = models.BigIntegerField(default=0)
+    business_profile_count = models.IntegerField(default=0)
+    offer_count = models.IntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.review_count} reviews - {self.business_profile_count} business profiles - {self.offer_count} offers"
+
+    @property
+    def average_rating(self):
+        if not self.review_count:
+            return 0
+        return round(self.rating_sum / self.review_count, 1)
+
+    @classmethod
+    def load(cls):
+        """
+        Returns the statistics row, computing it from scratch if it does not exist yet.
+        """
+        info = cls.objects.filter(pk=1).first()
+        if info is None:
+            info = cls.recompute()
+        return info
+
+    @classmethod
+    def apply_delta(cls, **deltas):
+        """
+        Adds the given deltas to the counters in a single UPDATE statement.
+        """
+        deltas = {field: value for field, value in deltas.items() if value}
+        if not deltas:
+            return
+        updated = cls.objects.filter(pk=1).update(**{field: F(field) + value for field, value in deltas.items()})
+        if not updated:
+            cls.recompute()
+
+    @classmethod
+    def recompute(cls):
+        """
+        Recomputes all counters from the source tables and stores them in the single row.
+        """
+        from offers_app.models import Offer
+        from profile_app.models import Profile
+        from reviews_app.models import Review
+
+        reviews = Review.objects.aggregate(review_count=Count('id'), rating_sum=Sum('rating'))
+        info, _ = cls.objects.update_or_create(pk=1, defaults={
+            'review_count': reviews['review_count'],
+            'rating_sum': reviews['rating_sum'] or 0,
+            'business_profile_count': Profile.objects.filter(type='business').count(),
+            'offer_count': Offer.objects.count(),
+        })
+        return info
@@ -0,0 +1,65 @@
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from core.signals import get_previous, stash_previous
+from offers_app.models import Offer
+from profile_app.models import Profile
+from reviews_app.models import Review
+from .models import BaseInfo
+
+CACHE_KEY = 'base_info'
+
+
+def apply_delta(**deltas):
+    """
+    Adds the deltas to the BaseInfo row. The cached response is dropped once the
+    transaction commits, so a concurrent read cannot cache the old row again.
+    """
+    if any(deltas.values()):
+        BaseInfo.apply_delta(**deltas)
+        transaction.on_commit(lambda: cache.delete(CACHE_KEY))
+
+
+@receiver(post_save, sender=Review)
+def count_review_on_save(sender, instance, created, **kwargs):
+    previous = get_previous(instance, 'review')
+    if created or previous is None:
+        apply_delta(review_count=1, rating_sum=instance.rating)
+    else:
+        apply_delta(rating_sum=instance.rating - previous['rating'])
+
+
+@receiver(post_delete, sender=Review)
+def count_review_on_delete(sender, instance, **kwargs):
+    apply_delta(review_count=-1, rating_sum=-instance.rating)
+
+
+@receiver(pre_save, sender=Profile)
+def stash_previous_profile(sender, instance, **kwargs):
+    stash_previous(sender, instance, ['type'], 'base_info')
+
+
+@receiver(post_save, sender=Profile)
+def count_profile_on_save(sender, instance, created, **kwargs):
+    previous = get_previous(instance, 'base_info')
+    was_business = previous is not None and previous['type'] == 'business'
+    is_business = instance.type == 'business'
+    apply_delta(business_profile_count=int(is_business) - int(was_business))
+
+
+@receiver(post_delete, sender=Profile)
+def count_profile_on_delete(sender, instance, **kwargs):
+    if instance.type == 'business':
+        apply_delta(business_profile_count=-1)
+
+
+@receiver(post_save, sender=Offer)
+def count_offer_on_save(sender, instance, created, **kwargs):
+    if created:
+        apply_delta(offer_count=1)
+
+
+@receiver(post_delete, sender=Offer)
+def count_offer_on_delete(sender, instance, **kwargs):
+    apply_delta(offer_count=-1)
@@ -1,3 +1,27 @@
-from django.test import TestCase
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from auth_app.models import CustomUser
+from offers_app.models import Offer
 
-# Create your tests here.
+
+class BaseInfoCacheTests(APITestCase):
+    """
+    The cached base info is only invalidated after the counter update is committed.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.business = CustomUser.objects.create_user(username='business', password='pw', type='business')
+
+    def test_cache_is_dropped_on_commit(self):
+        self.assertEqual(self.client.get(reverse('base-info')).data['offer_count'], 0)
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            Offer.objects.create(user=self.business, title='Offer', description='Offer')
+            # Not committed yet: the cached response stays until the commit.
+            self.assertEqual(self.client.get(reverse('base-info')).data['offer_count'], 0)
+        for callback in callbacks:
+            callback()
+
+        self.assertEqual(self.client.get(reverse('base-info')).data['offer_count'], 1)
@@ -0,0 +1,269 @@
+import json
+import math
+import time
+import tracemalloc
+from contextlib import contextmanager
+from django.core.cache import caches
+from django.db import connection, transaction
+from django.db.models import Prefetch
+from django.test.utils import CaptureQueriesContext, setup_test_environment, teardown_test_environment
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+from auth_app.authentication import token_cache
+from offers_app.api.serializers import FastOfferListSerializer, OfferListSerializer
+from offers_app.models import Feature, Offer, OfferDetail
+from orders_app.api.serializers import FastOrderSerializer, OrderSerializer
+from orders_app.models import Order
+from reviews_app.api.serializers import FastReviewSerializer, ReviewSerializer
+from reviews_app.models import Review
+from .generator import PASSWORD
+
+
+@contextmanager
+def test_database():
+    """
+    Creates a throwaway test database for a benchmark run and destroys it afterwards.
+    """
+    setup_test_environment(debug=False)
+    old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+def percentile(values, percent):
+    """
+    Nearest-rank percentile of a list of numbers.
+    """
+    ordered = sorted(values)
+    index = max(0, math.ceil(percent / 100 * len(ordered)) - 1)
+    return ordered[index]
+
+
+def get_endpoints(data):
+    """
+    Returns the benchmarked requests as (name, method, path, token, body) tuples.
+
+    Covers every URL in core/urls.py except the admin, using ids from the generated data.
+    """
+    business = data.business_users[0]
+    customer = data.customers[0]
+    offer = data.offers[0]
+    detail = data.details[0]
+    order = data.orders[0]
+    review = data.reviews[0]
+    card_ids = ','.join(str(user.id) for user in data.business_users[:30])
+    tokens = data.tokens
+
+    return [
+        ('registration-list', 'get', '/api/registration/', None, None),
+        ('login', 'post', '/api/login/', None, {'username': customer.username, 'password': PASSWORD}),
+        ('profile-detail', 'get', f'/api/profile/{business.id}/', tokens['customer'], None),
+        ('profiles-business', 'get', '/api/profiles/business/', tokens['customer'], None),
+        ('profiles-customer', 'get', '/api/profiles/customer/', tokens['business'], None),
+        ('profiles-business-cursor', 'get', '/api/profiles/business/?cursor=', tokens['customer'], None),
+        ('offers-list', 'get', '/api/offers/', None, None),
+        ('offers-filtered', 'get', '/api/offers/?min_price=100&max_delivery_time=5&ordering=min_price', None, None),
+        ('offers-search', 'get', '/api/offers/?search=django api', None, None),
+        ('offers-deep-page', 'get', '/api/offers/?page=20&page_size=10&ordering=-updated_at', None, None),
+        ('offers-cursor', 'get', '/api/offers/?cursor=&ordering=-updated_at', None, None),
+        ('offer-detail', 'get', f'/api/offers/{offer.id}/', tokens['customer'], None),
+        ('offerdetail-detail', 'get', f'/api/offerdetails/{detail.id}/', tokens['customer'], None),
+        ('orders-list', 'get', '/api/orders/', tokens['business'], None),
+        ('orders-create', 'post', '/api/orders/', tokens['customer'], {'offer_detail_id': detail.id}),
+        ('orders-bulk-create', 'post', '/api/orders/bulk/', tokens['customer'], {'offer_detail_ids': [d.id for d in data.details[:5]]}),
+        ('order-detail', 'get', f'/api/orders/{order.id}/', tokens['business'], None),
+        ('order-count', 'get', f'/api/order-count/{business.id}/', tokens['customer'], None),
+        ('completed-order-count', 'get', f'/api/completed-order-count/{business.id}/', tokens['customer'], None),
+        ('order-stats', 'get', f'/api/order-stats/{business.id}/', tokens['customer'], None),
+        ('business-stats', 'get', f'/api/business-stats/?ids={card_ids}', tokens['customer'], None),
+        ('reviews-list', 'get', '/api/reviews/', tokens['customer'], None),
+        ('reviews-business', 'get', f'/api/reviews/?business_user_id={business.id}&ordering=-rating', tokens['customer'], None),
+        ('reviews-business-cursor', 'get', f'/api/reviews/?business_user_id={business.id}&ordering=-rating&cursor=', tokens['customer'], None),
+        ('reviews-stream', 'get', '/api/reviews/?stream=ndjson', tokens['customer'], None),
+        ('review-detail', 'get', f'/api/reviews/{review.id}/', tokens['customer'], None),
+        ('base-info', 'get', '/api/base-info/', None, None),
+    ]
+
+
+def send(client, method, path, token, body):
+    client.credentials(**({'HTTP_AUTHORIZATION': f'Token {token}'} if token else {}))
+    response = getattr(client, method)(path, body, format='json') if body is not None else getattr(client, method)(path)
+    if response.status_code >= 400:
+        raise RuntimeError(f'{method.upper()} {path} returned {response.status_code}')
+    if hasattr(response, 'streaming_content'):
+        b''.join(response.streaming_content)
+    return response
+
+
+def clear_caches():
+    """
+    Empties every configured cache and the in-process token cache.
+    """
+    for cache in caches.all():
+        cache.clear()
+    token_cache.clear()
+
+
+def send_isolated(client, method, path, token, body):
+    """
+    Like send(), but writes run in a transaction that is rolled back, so every
+    request sees the same data set.
+    """
+    if method == 'get':
+        return send(client, method, path, token, body)
+    with transaction.atomic():
+        response = send(client, method, path, token, body)
+        transaction.set_rollback(True)
+    return response
+
+
+def run_benchmarks(data, iterations=20, warmup=2, names=None):
+    """
+    Runs every endpoint and returns {name: metrics}.
+
+    Every request starts with empty caches (clear_caches()), so the metrics describe
+    the uncached path and do not depend on the order of the endpoints. Writes are
+    rolled back (send_isolated()).
+
+    Metrics per endpoint:
+    - queries: number of SQL queries of one request
+    - p50_ms / p95_ms: request latency over 'iterations' timed runs
+    - cached_p50_ms: request latency when the caches are filled by the previous request
+    - peak_kb: peak Python memory allocated during one request (tracemalloc)
+    """
+    client = APIClient()
+    results = {}
+    for name, method, path, token, body in get_endpoints(data):
+        if names and name not in names:
+            continue
+
+        for _ in range(warmup):
+            clear_caches()
+            send_isolated(client, method, path, token, body)
+
+        timings = []
+        for _ in range(iterations):
+            clear_caches()
+            start = time.perf_counter()
+            send_isolated(client, method, path, token, body)
+            timings.append((time.perf_counter() - start) * 1000)
+
+        cached_timings = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            send_isolated(client, method, path, token, body)
+            cached_timings.append((time.perf_counter() - start) * 1000)
+
+        clear_caches()
+        with CaptureQueriesContext(connection) as queries:
+            send_isolated(client, method, path, token, body)
+        query_count = len(queries)
+
+        clear_caches()
+        tracemalloc.start()
+        send_isolated(client, method, path, token, body)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        results[name] = {
+            'queries': query_count,
+            'p50_ms': round(percentile(timings, 50), 3),
+            'p95_ms': round(percentile(timings, 95), 3),
+            'cached_p50_ms': round(percentile(cached_timings, 50), 3),
+            'peak_kb': round(peak / 1024, 1),
+        }
+    return results
+
+
+def get_serializer_cases():
+    """
+    Returns (name, model serializer class, fast serializer class, queryset, prefetched queryset) tuples.
+    The prefetched queryset is what the list views used before the fast serializers.
+    """
+    offers = Offer.objects.order_by('-updated_at', '-id')
+    orders = Order.objects.order_by('-created_at', '-id')
+    reviews = Review.objects.order_by('-updated_at', '-id')
+    return [
+        ('offers', OfferListSerializer, FastOfferListSerializer, offers,
+         offers.prefetch_related(Prefetch('details', queryset=OfferDetail.objects.order_by('id')), 'user')),
+        ('orders', OrderSerializer, FastOrderSerializer, orders,
+         orders.prefetch_related(Prefetch('features', queryset=Feature.objects.order_by('id')))),
+        ('reviews', ReviewSerializer, FastReviewSerializer, reviews, reviews),
+    ]
+
+
+def run_serializer_benchmarks(rows=100, iterations=20):
+    """
+    Times one page of 'rows' rows with the model serializer and the fast serializer.
+
+    Both variants include their queries and the JSON rendering. Metrics per list:
+    - model_cpu_ms / fast_cpu_ms: median process CPU time per page
+    - speedup: model_cpu_ms / fast_cpu_ms
+    - identical: whether both rendered byte-identical JSON
+    """
+    context = {'request': Request(APIRequestFactory().get('/'))}
+    renderer = JSONRenderer()
+
+    def model_page(serializer_class, queryset):
+        return renderer.render(serializer_class(queryset[:rows], many=True, context=context).data)
+
+    def fast_page(serializer_class, queryset):
+        serializer = serializer_class(context=context)
+        return renderer.render(serializer.serialize(serializer.get_rows(queryset)[:rows]))
+
+    def measure(func, *args):
+        timings = []
+        for _ in range(iterations):
+            start = time.process_time()
+            output = func(*args)
+            timings.append((time.process_time() - start) * 1000)
+        return output, percentile(timings, 50)
+
+    results = {}
+    for name, serializer_class, fast_class, queryset, prefetched in get_serializer_cases():
+        model_output, model_ms = measure(model_page, serializer_class, prefetched)
+        fast_output, fast_ms = measure(fast_page, fast_class, queryset)
+        results[name] = {
+            'model_cpu_ms': round(model_ms, 3),
+            'fast_cpu_ms': round(fast_ms, 3),
+            'speedup': round(model_ms / fast_ms, 2) if fast_ms else None,
+            'identical': model_output == fast_output,
+        }
+    return results
+
+
+def compare(baseline, current, latency_tolerance=0.5, memory_tolerance=0.25):
+    """
+    Compares a run with a baseline and returns a list of regression messages.
+
+    - Any increase of the query count is a regression.
+    - Latency (p95) and peak memory may grow by the given relative tolerance.
+    - Endpoints missing from the baseline are ignored.
+    """
+    regressions = []
+    for name, metrics in current.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if metrics['queries'] > base['queries']:
+            regressions.append(f"{name}: queries {base['queries']} -> {metrics['queries']}")
+        if metrics['p95_ms'] > base['p95_ms'] * (1 + latency_tolerance):
+            regressions.append(f"{name}: p95 {base['p95_ms']}ms -> {metrics['p95_ms']}ms")
+        if metrics['peak_kb'] > base['peak_kb'] * (1 + memory_tolerance):
+            regressions.append(f"{name}: peak memory {base['peak_kb']}KB -> {metrics['peak_kb']}KB")
+    return regressions
+
+
+def load_baseline(path):
+    with open(path) as file:
+        return json.load(file)
+
+
+def save_baseline(path, scale, results):
+    with open(path, 'w') as file:
+        json.dump({'scale': scale, 'endpoints': results}, file, indent=2, sort_keys=True)
+        file.write('\n')
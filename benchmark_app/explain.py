@@ -0,0 +1,106 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import resolve
+from rest_framework.filters import OrderingFilter, SearchFilter
+from rest_framework.test import APIClient
+from .benchmarks import send
+
+
+def get_list_endpoints(data):
+    """
+    Returns the list endpoints as (path, token) pairs.
+    """
+    return [
+        ('/api/offers/', None),
+        ('/api/orders/', data.tokens['business']),
+        ('/api/reviews/', data.tokens['customer']),
+        ('/api/profiles/business/', data.tokens['customer']),
+        ('/api/profiles/customer/', data.tokens['business']),
+    ]
+
+
+def get_sample_values(data):
+    """
+    Values for the FilterSet params, taken from the generated data.
+    """
+    return {
+        'creator_id': data.business_users[0].id,
+        'business_user_id': data.business_users[0].id,
+        'reviewer_id': data.customers[0].id,
+        'min_price': 100,
+        'max_delivery_time': 5,
+        'search': 'django',
+    }
+
+
+def get_query_variants(view_class, sample_values):
+    """
+    Returns every combination of one filter (or none) with one ordering (or none) the view supports,
+    plus the same orderings with the 'cursor' param if the pagination class has one.
+    """
+    filters = [{}]
+    filterset_class = getattr(view_class, 'filterset_class', None)
+    if filterset_class is not None:
+        filters += [{name: sample_values[name]} for name in filterset_class.base_filters]
+    backends = getattr(view_class, 'filter_backends', [])
+    if any(issubclass(backend, SearchFilter) for backend in backends):
+        filters.append({'search': sample_values['search']})
+
+    orderings = [{}]
+    if any(issubclass(backend, OrderingFilter) for backend in backends):
+        for field in getattr(view_class, 'ordering_fields', None) or []:
+            orderings += [{'ordering': field}, {'ordering': f'-{field}'}]
+
+    pages = [{}]
+    pagination_class = getattr(view_class, 'pagination_class', None)
+    if getattr(pagination_class, 'cursor_query_param', None):
+        pages.append({pagination_class.cursor_query_param: ''})
+
+    return [{**filter_params, **ordering, **page} for filter_params in filters for ordering in orderings for page in pages]
+
+
+def explain(sql):
+    """
+    Returns (plan lines, full table scan lines) of a SELECT statement.
+    """
+    with connection.cursor() as cursor:
+        if connection.vendor == 'sqlite':
+            cursor.execute('EXPLAIN QUERY PLAN ' + sql)
+            plan = [row[-1] for row in cursor.fetchall()]
+            scans = [line for line in plan if line.startswith('SCAN ') and ' USING ' not in line and 'VIRTUAL TABLE' not in line]
+        else:
+            cursor.execute('EXPLAIN ' + sql)
+            plan = [row[0] for row in cursor.fetchall()]
+            scans = [line.strip() for line in plan if 'Seq Scan' in line]
+    return plan, scans
+
+
+def explain_list_endpoints(data):
+    """
+    Requests every list endpoint variant and explains each SELECT it issues.
+
+    Returns a list of {'url', 'queries', 'scans': [(sql, scan lines)]} dicts.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute('ANALYZE')
+
+    sample_values = get_sample_values(data)
+    client = APIClient()
+    reports = []
+    for path, token in get_list_endpoints(data):
+        view_class = resolve(path).func.view_class
+        for params in get_query_variants(view_class, sample_values):
+            query = '&'.join(f'{name}={value}' for name, value in params.items())
+            url = f'{path}?{query}' if query else path
+            cache.clear()
+            with CaptureQueriesContext(connection) as queries:
+                send(client, 'get', url, token, None)
+            selects = [query['sql'] for query in queries.captured_queries if query['sql'].lstrip().upper().startswith('SELECT')]
+            scans = []
+            for sql in selects:
+                _, scan_lines = explain(sql)
+                if scan_lines:
+                    scans.append((sql, scan_lines))
+            reports.append({'url': url, 'queries': len(selects), 'scans': scans})
+    return reports
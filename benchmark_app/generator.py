@@ -0,0 +1,143 @@
+import io
+import random
+from decimal import Decimal
+from django.contrib.auth.hashers import make_password
+from django.core.management import call_command
+from rest_framework.authtoken.models import Token
+from auth_app.models import CustomUser
+from base_info_app.models import BaseInfo
+from offers_app.models import Feature, Offer, OfferDetail
+from orders_app.models import BusinessOrderStats, Order
+from profile_app.models import Profile
+from reviews_app.models import BusinessRatingSummary, Review
+
+SCALES = {
+    'tiny': {'users': 100, 'offers': 300, 'orders': 1000, 'reviews': 500},
+    'small': {'users': 1000, 'offers': 5000, 'orders': 20000, 'reviews': 10000},
+    'full': {'users': 10000, 'offers': 50000, 'orders': 200000, 'reviews': 100000},
+}
+
+BUSINESS_SHARE = 0.3
+BATCH_SIZE = 2000
+PASSWORD = 'benchmark-password'
+WORDS = [
+    'web', 'design', 'logo', 'django', 'react', 'api', 'shop', 'mobile', 'app', 'backend',
+    'frontend', 'seo', 'cloud', 'docker', 'data', 'python', 'wordpress', 'landing', 'page', 'branding',
+]
+FEATURES = [f'Feature {i}' for i in range(50)]
+DETAIL_TYPES = [('basic', 1), ('standard', 2), ('premium', 3)]
+ORDER_STATUSES = ['in_progress', 'delivered', 'completed']
+
+
+class BenchmarkData:
+    """
+    Deterministic data set for the benchmark suite.
+
+    All rows are created with bulk_create, so the denormalized data that is usually
+    maintained by signals (offer min values, search index, base info, order stats)
+    is rebuilt at the end. The same seed and counts always produce the same rows.
+    """
+
+    def __init__(self, users, offers, orders, reviews, seed=42):
+        self.counts = {'users': users, 'offers': offers, 'orders': orders, 'reviews': reviews}
+        self.random = random.Random(seed)
+
+    def sentence(self, length):
+        return ' '.join(self.random.choice(WORDS) for _ in range(length))
+
+    def generate(self):
+        self.create_users()
+        self.create_offers()
+        self.create_orders()
+        self.create_reviews()
+        self.rebuild_denormalized_data()
+        return self
+
+    def create_users(self):
+        password = make_password(PASSWORD)
+        business_total = max(1, int(self.counts['users'] * BUSINESS_SHARE))
+        users = [
+            CustomUser(
+                username=f'bench_user_{i}',
+                email=f'bench_user_{i}@example.com',
+                password=password,
+                type='business' if i < business_total else 'customer',
+                is_staff=i == self.counts['users'] - 1,
+            )
+            for i in range(self.counts['users'])
+        ]
+        users = CustomUser.objects.bulk_create(users, batch_size=BATCH_SIZE)
+        Profile.objects.bulk_create([
+            Profile(
+                user=user, username=user.username, email=user.email, type=user.type,
+                first_name=self.random.choice(WORDS).title(), last_name=self.random.choice(WORDS).title(),
+                location=self.random.choice(WORDS).title(), description=self.sentence(5),
+            )
+            for user in users
+        ], batch_size=BATCH_SIZE)
+        self.business_users = [user for user in users if user.type == 'business']
+        self.customers = [user for user in users if user.type == 'customer']
+        self.staff_user = users[-1]
+        self.tokens = {
+            'business': Token.objects.create(user=self.business_users[0]).key,
+            'customer': Token.objects.create(user=self.customers[0]).key,
+            'staff': Token.objects.create(user=self.staff_user).key,
+        }
+
+    def create_offers(self):
+        offers = Offer.objects.bulk_create([
+            Offer(user=self.random.choice(self.business_users), title=self.sentence(3).title(), description=self.sentence(20))
+            for _ in range(self.counts['offers'])
+        ], batch_size=BATCH_SIZE)
+        details = []
+        for offer in offers:
+            base_price = self.random.randint(20, 500)
+            for offer_type, level in DETAIL_TYPES:
+                details.append(OfferDetail(
+                    offer=offer, title=f'{offer_type.title()} package', revisions=level,
+                    delivery_time_in_days=self.random.randint(1, 10) + 3 - level,
+                    price=Decimal(base_price * level), offer_type=offer_type,
+                    features=self.random.sample(FEATURES, level + 1),
+                ))
+        self.details = OfferDetail.objects.bulk_create(details, batch_size=BATCH_SIZE)
+        self.offers = offers
+
+    def create_orders(self):
+        offer_users = dict(Offer.objects.values_list('id', 'user_id'))
+        features = {feature.name: feature for feature in Feature.get_or_create_many(FEATURES)}
+        orders = []
+        for _ in range(self.counts['orders']):
+            detail = self.random.choice(self.details)
+            orders.append(Order(
+                customer_user=self.random.choice(self.customers), business_user_id=offer_users[detail.offer_id],
+                offer_detail=detail, title=detail.title, revisions=detail.revisions,
+                delivery_time_in_days=detail.delivery_time_in_days, price=detail.price,
+                offer_type=detail.offer_type, status=self.random.choice(ORDER_STATUSES),
+            ))
+        orders = Order.objects.bulk_create(orders, batch_size=BATCH_SIZE)
+        Order.features.through.objects.bulk_create([
+            Order.features.through(order_id=order.id, feature_id=features[name].id)
+            for order in orders
+            for name in order.offer_detail.features
+        ], batch_size=BATCH_SIZE)
+        self.orders = orders
+
+    def create_reviews(self):
+        total = min(self.counts['reviews'], len(self.customers) * len(self.business_users))
+        pairs = set()
+        while len(pairs) < total:
+            pairs.add((self.random.randrange(len(self.customers)), self.random.randrange(len(self.business_users))))
+        self.reviews = Review.objects.bulk_create([
+            Review(
+                reviewer=self.customers[reviewer], business_user=self.business_users[business_user],
+                rating=self.random.randint(1, 5), description=self.sentence(8),
+            )
+            for reviewer, business_user in sorted(pairs)
+        ], batch_size=BATCH_SIZE)
+
+    def rebuild_denormalized_data(self):
+        call_command('backfill_offer_min_values', stdout=io.StringIO())
+        call_command('rebuild_offer_search_index', stdout=io.StringIO())
+        BaseInfo.recompute()
+        BusinessOrderStats.rebuild_all()
+        BusinessRatingSummary.rebuild_all()
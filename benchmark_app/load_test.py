@@ -0,0 +1,100 @@
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from django.db import connection
+from rest_framework.test import APIClient
+from .benchmarks import percentile, test_database
+
+# Django's SQLite defaults: rollback journal, 5 s busy timeout, deferred transactions.
+STOCK_SQLITE_OPTIONS = {}
+
+
+@contextmanager
+def file_test_database(options=None):
+    """
+    Like test_database(), but SQLite test databases are created as a file in a temporary
+    directory, so that connections of several threads share (and lock) the same database.
+
+    options replaces the OPTIONS of the connection for the run; None keeps the configured ones.
+    """
+    settings_dict = connection.settings_dict
+    saved_options = settings_dict['OPTIONS']
+    saved_test_name = settings_dict['TEST'].get('NAME')
+    with tempfile.TemporaryDirectory() as directory:
+        if connection.vendor == 'sqlite':
+            settings_dict['TEST']['NAME'] = os.path.join(directory, 'load_test.sqlite3')
+        if options is not None:
+            settings_dict['OPTIONS'] = options
+        try:
+            with test_database():
+                yield
+        finally:
+            settings_dict['OPTIONS'] = saved_options
+            settings_dict['TEST']['NAME'] = saved_test_name
+
+
+def run_worker(customer, detail_ids, requests, read_share, barrier, results):
+    """
+    Sends 'requests' order POSTs and order list GETs as one customer.
+    The share of reads is spread evenly over the run.
+    """
+    client = APIClient()
+    client.force_authenticate(customer)
+    reads = 0.0
+    barrier.wait()
+    try:
+        for i in range(requests):
+            reads += read_share
+            is_read = reads >= 1
+            if is_read:
+                reads -= 1
+            start = time.perf_counter()
+            try:
+                if is_read:
+                    response = client.get('/api/orders/', {'page_size': 10})
+                else:
+                    response = client.post('/api/orders/', {'offer_detail_id': detail_ids[i % len(detail_ids)]}, format='json')
+                error = None if response.status_code < 400 else f'HTTP {response.status_code}'
+            except Exception as exc:
+                error = f'{type(exc).__name__}: {exc}'
+            results.append(('read' if is_read else 'write', (time.perf_counter() - start) * 1000, error))
+    finally:
+        connection.close()
+
+
+def run_load_test(data, workers=8, requests=50, read_share=0.5):
+    """
+    Runs 'workers' threads, each with its own database connection and customer, that
+    create orders and read their order lists concurrently.
+
+    Returns the totals, the number of failed requests with up to five distinct error
+    messages, the throughput and the p50/p95 latency of reads and writes.
+    """
+    detail_ids = [detail.id for detail in data.details[:50]]
+    barrier = threading.Barrier(workers + 1)
+    results = []
+    threads = [
+        threading.Thread(target=run_worker, args=(customer, detail_ids, requests, read_share, barrier, results))
+        for customer in data.customers[:workers]
+    ]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    report = {
+        'requests': len(results),
+        'errors': sum(1 for _, _, error in results if error),
+        'error_samples': sorted({error for _, _, error in results if error})[:5],
+        'requests_per_second': round(len(results) / elapsed, 1),
+    }
+    for kind in ('read', 'write'):
+        timings = [ms for result_kind, ms, error in results if result_kind == kind and not error]
+        report[f'{kind}_p50_ms'] = round(percentile(timings, 50), 1) if timings else None
+        report[f'{kind}_p95_ms'] = round(percentile(timings, 95), 1) if timings else None
+    return report
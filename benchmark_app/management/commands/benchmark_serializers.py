@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand, CommandError
+from benchmark_app.benchmarks import run_serializer_benchmarks, test_database
+from benchmark_app.generator import SCALES, BenchmarkData
+
+
+class Command(BaseCommand):
+    """
+    Microbenchmark of the list serializers: model serializers against the fast .values() serializers.
+
+    Seeds a test database, renders one page per list with both variants and reports
+    the CPU time per page and the speedup. Fails if the JSON output differs.
+    """
+    help = "Compares CPU time and output of the model and fast list serializers."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scale', choices=SCALES.keys(), default='tiny', help="Preset data set size.")
+        parser.add_argument('--seed', type=int, default=42, help="Random seed of the data generator.")
+        parser.add_argument('--rows', type=int, default=100, help="Rows per page.")
+        parser.add_argument('--iterations', type=int, default=20, help="Timed pages per serializer.")
+
+    def handle(self, *args, **options):
+        with test_database():
+            BenchmarkData(seed=options['seed'], **SCALES[options['scale']]).generate()
+            results = run_serializer_benchmarks(options['rows'], options['iterations'])
+
+        self.stdout.write(f"{'list':<10}{'model ms':>10}{'fast ms':>10}{'speedup':>10}{'identical':>11}")
+        for name, metrics in results.items():
+            self.stdout.write(
+                f"{name:<10}{metrics['model_cpu_ms']:>10.2f}{metrics['fast_cpu_ms']:>10.2f}"
+                f"{metrics['speedup']:>9.2f}x{str(metrics['identical']):>11}"
+            )
+        different = [name for name, metrics in results.items() if not metrics['identical']]
+        if different:
+            raise CommandError(f"Fast serializer output differs for: {', '.join(different)}")
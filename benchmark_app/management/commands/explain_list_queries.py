@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand, CommandError
+from benchmark_app.benchmarks import test_database
+from benchmark_app.explain import explain_list_endpoints
+from benchmark_app.generator import SCALES, BenchmarkData
+
+
+class Command(BaseCommand):
+    """
+    Explains the SQL of every list endpoint and reports full table scans.
+
+    Seeds a test database, requests each list endpoint with every FilterSet param,
+    ordering field and cursor variant, and runs EXPLAIN QUERY PLAN (SQLite) or
+    EXPLAIN (PostgreSQL) on each SELECT. Scans without an index are reported.
+    """
+    help = "Reports full table scans in the queries of the list endpoints."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scale', choices=SCALES.keys(), default='tiny', help="Preset data set size.")
+        parser.add_argument('--seed', type=int, default=42, help="Random seed of the data generator.")
+        parser.add_argument('--verbose-sql', action='store_true', help="Print the SQL of queries with full scans.")
+        parser.add_argument('--fail-on-scan', action='store_true', help="Exit with an error if any full scan is found.")
+
+    def handle(self, *args, **options):
+        with test_database():
+            data = BenchmarkData(seed=options['seed'], **SCALES[options['scale']]).generate()
+            reports = explain_list_endpoints(data)
+
+        scan_count = 0
+        for report in reports:
+            status = self.style.WARNING('FULL SCAN') if report['scans'] else self.style.SUCCESS('ok')
+            self.stdout.write(f"{report['url']:<72}{report['queries']:>3} queries  {status}")
+            for sql, lines in report['scans']:
+                scan_count += 1
+                for line in lines:
+                    self.stdout.write(f"    {line}")
+                if options['verbose_sql']:
+                    self.stdout.write(f"    {sql}")
+
+        self.stdout.write(f"{len(reports)} requests explained, {scan_count} queries with full scans.")
+        if scan_count and options['fail_on_scan']:
+            raise CommandError("Full table scans found.")
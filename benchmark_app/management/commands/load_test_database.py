@@ -0,0 +1,49 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from benchmark_app.generator import SCALES, BenchmarkData
+from benchmark_app.load_test import STOCK_SQLITE_OPTIONS, file_test_database, run_load_test
+
+
+class Command(BaseCommand):
+    """
+    Concurrent write load test of the database configuration.
+
+    Seeds a file based test database, then lets --workers threads (one connection and
+    customer each) create orders and read their order lists at the same time.
+    Reports failed requests (e.g. "database is locked"), throughput and latencies.
+
+    On SQLite the run is repeated per profile: 'stock' uses Django's default connection
+    options, 'configured' the OPTIONS from core/database.py (WAL, busy timeout,
+    immediate transactions).
+    """
+    help = "Runs concurrent order writes against the configured database."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=8, help="Concurrent threads.")
+        parser.add_argument('--requests', type=int, default=50, help="Requests per thread.")
+        parser.add_argument('--read-share', type=float, default=0.5, help="Share of order list reads, 0 to 1.")
+        parser.add_argument('--scale', choices=SCALES.keys(), default='tiny', help="Preset data set size.")
+        parser.add_argument('--profiles', nargs='+', choices=['stock', 'configured'], default=['stock', 'configured'],
+                            help="SQLite connection options to compare.")
+        parser.add_argument('--fail-on-errors', action='store_true', help="Exit with an error if a 'configured' request failed.")
+
+    def handle(self, *args, **options):
+        profiles = options['profiles'] if connection.vendor == 'sqlite' else ['configured']
+        failed = False
+        for profile in profiles:
+            with file_test_database(STOCK_SQLITE_OPTIONS if profile == 'stock' else None):
+                data = BenchmarkData(**SCALES[options['scale']]).generate()
+                report = run_load_test(data, options['workers'], options['requests'], options['read_share'])
+
+            self.stdout.write(self.style.MIGRATE_HEADING(f"{profile} ({connection.vendor})"))
+            self.stdout.write(
+                f"  {report['requests']} requests, {report['errors']} failed, {report['requests_per_second']} req/s\n"
+                f"  writes p50 {report['write_p50_ms']} ms, p95 {report['write_p95_ms']} ms\n"
+                f"  reads  p50 {report['read_p50_ms']} ms, p95 {report['read_p95_ms']} ms"
+            )
+            for error in report['error_samples']:
+                self.stdout.write(self.style.WARNING(f"  {error}"))
+            failed = failed or (profile == 'configured' and report['errors'] > 0)
+
+        if failed and options['fail_on_errors']:
+            raise CommandError("Requests failed under concurrent load.")
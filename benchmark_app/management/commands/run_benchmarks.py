@@ -0,0 +1,65 @@
+import time
+from django.core.management.base import BaseCommand, CommandError
+from benchmark_app.benchmarks import compare, load_baseline, run_benchmarks, save_baseline, test_database
+from benchmark_app.generator import SCALES, BenchmarkData
+
+
+class Command(BaseCommand):
+    """
+    Runs the API benchmark suite against a freshly seeded test database.
+
+    Records query count, p50/p95 latency and peak memory per endpoint, with the caches
+    emptied before every request; cached_p50 is the latency with filled caches.
+    Writes are rolled back after each request, so all runs see the seeded data.
+    With --output the results are written as a JSON baseline; with --baseline the run
+    is compared against an existing baseline and the command fails on regressions.
+    """
+    help = "Seeds a test database, benchmarks every API endpoint and compares the results with a baseline."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scale', choices=SCALES.keys(), default='tiny', help="Preset data set size.")
+        for name in ('users', 'offers', 'orders', 'reviews'):
+            parser.add_argument(f'--{name}', type=int, help=f"Number of {name}, overrides the scale preset.")
+        parser.add_argument('--seed', type=int, default=42, help="Random seed of the data generator.")
+        parser.add_argument('--iterations', type=int, default=20, help="Timed requests per endpoint.")
+        parser.add_argument('--warmup', type=int, default=2, help="Untimed requests per endpoint.")
+        parser.add_argument('--endpoint', action='append', dest='endpoints', help="Only run the given endpoint (repeatable).")
+        parser.add_argument('--output', help="Write the results as a JSON baseline to this path.")
+        parser.add_argument('--baseline', help="Compare the results with the JSON baseline at this path.")
+        parser.add_argument('--latency-tolerance', type=float, default=0.5, help="Allowed relative p95 growth.")
+        parser.add_argument('--memory-tolerance', type=float, default=0.25, help="Allowed relative peak memory growth.")
+
+    def handle(self, *args, **options):
+        counts = dict(SCALES[options['scale']])
+        for name in counts:
+            if options[name] is not None:
+                counts[name] = options[name]
+
+        baseline = load_baseline(options['baseline']) if options['baseline'] else None
+
+        with test_database():
+            start = time.perf_counter()
+            data = BenchmarkData(seed=options['seed'], **counts).generate()
+            self.stdout.write(f"Seeded {counts} in {time.perf_counter() - start:.1f}s")
+            results = run_benchmarks(data, options['iterations'], options['warmup'], options['endpoints'])
+
+        self.stdout.write(f"{'endpoint':<26}{'queries':>8}{'p50 ms':>10}{'p95 ms':>10}{'cached p50':>12}{'peak KB':>10}")
+        for name, metrics in results.items():
+            self.stdout.write(
+                f"{name:<26}{metrics['queries']:>8}{metrics['p50_ms']:>10.2f}{metrics['p95_ms']:>10.2f}"
+                f"{metrics['cached_p50_ms']:>12.2f}{metrics['peak_kb']:>10.1f}"
+            )
+
+        if options['output']:
+            save_baseline(options['output'], counts, results)
+            self.stdout.write(self.style.SUCCESS(f"Baseline written to {options['output']}"))
+
+        if baseline is not None:
+            if baseline.get('scale') != counts:
+                self.stdout.write(self.style.WARNING(f"Baseline was recorded with {baseline.get('scale')}, this run used {counts}."))
+            regressions = compare(
+                baseline['endpoints'], results, options['latency_tolerance'], options['memory_tolerance'],
+            )
+            if regressions:
+                raise CommandError("Benchmark regressions:\n" + "\n".join(regressions))
+            self.stdout.write(self.style.SUCCESS("No regressions against the baseline."))
@@ -0,0 +1,23 @@
+from django.test import TestCase
+from orders_app.models import Order
+from .benchmarks import get_endpoints, run_benchmarks
+from .generator import SCALES, BenchmarkData
+
+
+class RunBenchmarksTests(TestCase):
+    """
+    Smoke test of the benchmark suite at the tiny scale.
+    """
+
+    def test_tiny_run_covers_every_endpoint_and_rolls_back_writes(self):
+        data = BenchmarkData(**SCALES['tiny']).generate()
+        order_count = Order.objects.count()
+
+        results = run_benchmarks(data, iterations=1, warmup=0)
+
+        self.assertEqual(list(results), [endpoint[0] for endpoint in get_endpoints(data)])
+        self.assertEqual(Order.objects.count(), order_count)
+        for metrics in results.values():
+            self.assertEqual(set(metrics), {'queries', 'p50_ms', 'p95_ms', 'cached_p50_ms', 'peak_kb'})
+        # The cache is cleared before the measured request, so the offer list runs its queries.
+        self.assertGreater(results['offers-list']['queries'], 0)
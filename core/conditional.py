@@ -0,0 +1,85 @@
+import hashlib
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework.response import Response
+
+
+def make_etag(parts):
+    return hashlib.md5(repr(parts).encode('utf-8'), usedforsecurity=False).hexdigest()
+
+
+def set_validators(response, etag, last_modified):
+    response['ETag'] = quote_etag(etag)
+    if last_modified is not None:
+        response['Last-Modified'] = http_date(last_modified.timestamp())
+    return response
+
+
+def conditional_response(request, etag, last_modified, get_response):
+    """
+    Returns 304 if If-None-Match / If-Modified-Since match the validators, otherwise
+    the response of get_response(). Both carry the ETag and Last-Modified headers.
+    """
+    timestamp = int(last_modified.timestamp()) if last_modified is not None else None
+    not_modified = get_conditional_response(request, etag=quote_etag(etag), last_modified=timestamp)
+    response = not_modified if not_modified is not None else get_response()
+    return set_validators(response, etag, last_modified)
+
+
+def request_parts(request):
+    """
+    Parts of the request that change the body for the same data: path with query string,
+    user (permissions and fields can depend on it) and the negotiated media type.
+    """
+    accepted_media_type = getattr(request, 'accepted_media_type', None)
+    return [request.get_full_path(), request.user.pk, accepted_media_type]
+
+
+class ConditionalListMixin:
+    """
+    ETag support for list views.
+
+    Behavior:
+    - The ETag is a hash of the response data (the page for paginated lists) and the
+      negotiated media type, so it changes with every visible change, including deletes,
+      denormalized columns and related rows. No extra query is issued.
+    - A matching If-None-Match is answered with 304 and an empty body; the list is still
+      queried and serialized, the client saves the transfer and its own processing.
+    - Lists send no Last-Modified: deletes and queryset updates move no timestamp, so
+      If-Modified-Since could not be answered reliably.
+    - Streamed responses get no ETag. The ETag of the last response is kept in self.etag.
+    """
+
+    def list(self, request, *args, **kwargs):
+        response = super().list(request, *args, **kwargs)
+        self.etag = None
+        if response.status_code != 200 or not hasattr(response, 'data'):
+            return response
+        self.etag = make_etag([getattr(request, 'accepted_media_type', None), response.data])
+        return conditional_response(request, self.etag, None, lambda: response)
+
+
+class ConditionalRetrieveMixin:
+    """
+    ETag and Last-Modified support for detail views.
+
+    Behavior:
+    - The object is loaded with get_object() as usual (object permissions still apply),
+      the ETag is a hash of its column values (get_etag_parts) and nothing is serialized for a 304.
+    - Last-Modified is taken from 'last_modified_field' if the model has it.
+    """
+    last_modified_field = 'updated_at'
+
+    def get_etag_parts(self, instance):
+        return [getattr(instance, field.attname) for field in instance._meta.concrete_fields]
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        etag = make_etag([*request_parts(request), *self.get_etag_parts(instance)])
+        last_modified = getattr(instance, self.last_modified_field, None)
+        return conditional_response(
+            request, etag, last_modified, lambda: self.get_retrieve_response(instance),
+        )
+
+    def get_retrieve_response(self, instance):
+        return Response(self.get_serializer(instance).data)
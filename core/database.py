@@ -0,0 +1,121 @@
+"""
+Environment driven database configuration for core/settings.py.
+
+DB_ENGINE selects the backend: 'sqlite' (default) or 'postgresql'.
+
+SQLite (DB_NAME defaults to db.sqlite3 in the project directory):
+- SQLITE_JOURNAL_MODE (WAL): readers no longer block the writer and vice versa.
+- SQLITE_SYNCHRONOUS (NORMAL): with WAL only the checkpoints are fsynced.
+- SQLITE_MMAP_SIZE (268435456 bytes), SQLITE_CACHE_SIZE (-64000, i.e. 64 MB per connection).
+- SQLITE_BUSY_TIMEOUT (20 seconds): a writer waits for the lock instead of failing
+  with "database is locked".
+- SQLITE_TRANSACTION_MODE (IMMEDIATE): transactions take the write lock on BEGIN, so
+  a read-then-write transaction never fails on the lock upgrade, where the busy
+  timeout does not apply.
+The PRAGMAs are executed on every new connection (OPTIONS 'init_command').
+
+PostgreSQL (DB_NAME, DB_USER, DB_PASSWORD, DB_HOST, DB_PORT):
+- DB_CONN_MAX_AGE (60 seconds, None for unlimited) with health checks keeps connections
+  open across requests.
+- DB_POOL=1 enables Django's native connection pool (requires psycopg[pool]) sized by
+  DB_POOL_MIN_SIZE, DB_POOL_MAX_SIZE and DB_POOL_TIMEOUT; CONN_MAX_AGE is then 0,
+  as the pool manages the connection lifetime.
+- DB_STATEMENT_TIMEOUT (milliseconds, 0 disables) aborts runaway queries server side.
+"""
+import os
+from django.core.exceptions import ImproperlyConfigured
+
+SQLITE_DEFAULTS = {
+    'SQLITE_JOURNAL_MODE': 'WAL',
+    'SQLITE_SYNCHRONOUS': 'NORMAL',
+    'SQLITE_MMAP_SIZE': '268435456',
+    'SQLITE_CACHE_SIZE': '-64000',
+    'SQLITE_BUSY_TIMEOUT': '20',
+    'SQLITE_TRANSACTION_MODE': 'IMMEDIATE',
+}
+
+POSTGRES_DEFAULTS = {
+    'DB_HOST': 'localhost',
+    'DB_PORT': '5432',
+    'DB_CONN_MAX_AGE': '60',
+    'DB_POOL': '0',
+    'DB_POOL_MIN_SIZE': '2',
+    'DB_POOL_MAX_SIZE': '10',
+    'DB_POOL_TIMEOUT': '10',
+    'DB_STATEMENT_TIMEOUT': '30000',
+}
+
+
+def get_env(environ, name, defaults):
+    return environ.get(name, defaults.get(name))
+
+
+def get_sqlite_options(environ=os.environ):
+    """
+    Returns the OPTIONS of a tuned SQLite connection.
+    """
+    def value(name):
+        return get_env(environ, name, SQLITE_DEFAULTS)
+
+    pragmas = [
+        f"PRAGMA journal_mode={value('SQLITE_JOURNAL_MODE')}",
+        f"PRAGMA synchronous={value('SQLITE_SYNCHRONOUS')}",
+        f"PRAGMA mmap_size={int(value('SQLITE_MMAP_SIZE'))}",
+        f"PRAGMA cache_size={int(value('SQLITE_CACHE_SIZE'))}",
+    ]
+    return {
+        'init_command': ';'.join(pragmas),
+        'timeout': float(value('SQLITE_BUSY_TIMEOUT')),
+        'transaction_mode': value('SQLITE_TRANSACTION_MODE') or None,
+    }
+
+
+def get_postgres_config(environ=os.environ):
+    """
+    Returns the DATABASES entry of a PostgreSQL connection.
+    """
+    def value(name):
+        return get_env(environ, name, POSTGRES_DEFAULTS)
+
+    options = {}
+    statement_timeout = int(value('DB_STATEMENT_TIMEOUT'))
+    if statement_timeout:
+        options['options'] = f'-c statement_timeout={statement_timeout}'
+
+    conn_max_age = value('DB_CONN_MAX_AGE')
+    conn_max_age = None if conn_max_age.lower() == 'none' else int(conn_max_age)
+    if value('DB_POOL') == '1':
+        options['pool'] = {
+            'min_size': int(value('DB_POOL_MIN_SIZE')),
+            'max_size': int(value('DB_POOL_MAX_SIZE')),
+            'timeout': float(value('DB_POOL_TIMEOUT')),
+        }
+        conn_max_age = 0
+
+    return {
+        'ENGINE': 'django.db.backends.postgresql',
+        'NAME': value('DB_NAME') or 'coderr',
+        'USER': value('DB_USER') or '',
+        'PASSWORD': value('DB_PASSWORD') or '',
+        'HOST': value('DB_HOST'),
+        'PORT': value('DB_PORT'),
+        'CONN_MAX_AGE': conn_max_age,
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': options,
+    }
+
+
+def get_database_config(base_dir, environ=os.environ):
+    """
+    Returns the 'default' entry of DATABASES for the DB_ENGINE environment variable.
+    """
+    engine = environ.get('DB_ENGINE', 'sqlite').lower()
+    if engine in ('sqlite', 'sqlite3'):
+        return {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': environ.get('DB_NAME') or base_dir / 'db.sqlite3',
+            'OPTIONS': get_sqlite_options(environ),
+        }
+    if engine in ('postgresql', 'postgres'):
+        return get_postgres_config(environ)
+    raise ImproperlyConfigured(f"Unsupported DB_ENGINE {engine!r}, use 'sqlite' or 'postgresql'.")
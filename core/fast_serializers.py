@@ -0,0 +1,115 @@
+from itertools import islice
+from rest_framework import serializers
+from rest_framework.response import Response
+from .streaming import StreamingListMixin, dump_row
+
+# Fields whose to_representation returns database values unchanged.
+PASSTHROUGH_FIELDS = (
+    serializers.BooleanField, serializers.CharField, serializers.IntegerField,
+    serializers.PrimaryKeyRelatedField, serializers.ReadOnlyField,
+)
+
+
+class FastSerializer:
+    """
+    Read-only list serializer producing the same output as 'serializer_class' from .values() rows.
+
+    Behavior:
+    - The field map (output key, column, converter) is compiled once from the fields of
+      'serializer_class', so key order and value formats (dates, decimals, files) match.
+    - Plain columns that DRF passes through unchanged are copied without a converter call.
+    - Keys listed in 'related_fields' are filled by load_related(), which may run one
+      extra query per page; 'extra_values' are additional columns needed for them.
+    - None stays None, like in Serializer.to_representation.
+    """
+    serializer_class = None
+    related_fields = ()
+    extra_values = ()
+
+    def __init__(self, context=None):
+        self.context = context or {}
+        serializer = self.serializer_class(context=self.context)
+        self.model = serializer.Meta.model
+        self.fields = [self.compile_field(name, field) for name, field in serializer.fields.items()]
+
+    def compile_field(self, name, field):
+        if name in self.related_fields:
+            return name, None, None
+        if isinstance(field, PASSTHROUGH_FIELDS):
+            return name, field.source, None
+        if isinstance(field, serializers.FileField):
+            return name, field.source, self.get_file_converter(field)
+        return name, field.source, field.to_representation
+
+    def get_file_converter(self, field):
+        """
+        FileField.to_representation for a stored file name instead of a FieldFile.
+        """
+        storage = self.model._meta.get_field(field.source).storage
+        request = self.context.get('request')
+
+        def convert(name):
+            if not name:
+                return None
+            url = storage.url(name)
+            return request.build_absolute_uri(url) if request is not None else url
+        return convert
+
+    def get_rows(self, queryset):
+        columns = [column for _, column, _ in self.fields if column is not None]
+        return queryset.prefetch_related(None).values(*dict.fromkeys(['id', *columns, *self.extra_values]))
+
+    def load_related(self, rows):
+        """
+        Returns {key: function(row)} for every key in 'related_fields'.
+        """
+        return {}
+
+    def serialize(self, rows):
+        rows = list(rows)
+        related = self.load_related(rows)
+        data = []
+        for row in rows:
+            item = {}
+            for name, column, convert in self.fields:
+                if column is None:
+                    item[name] = related[name](row)
+                    continue
+                value = row[column]
+                item[name] = value if convert is None or value is None else convert(value)
+            data.append(item)
+        return data
+
+
+class FastListMixin(StreamingListMixin):
+    """
+    Serves list requests with 'fast_serializer_class' instead of the regular serializer.
+
+    - Works with the configured filters and pagination; paginators receive the .values() queryset.
+    - Streaming (see StreamingListMixin) serializes each chunk with the fast serializer.
+    - Create requests keep using get_serializer_class().
+    """
+    fast_serializer_class = None
+
+    def get_fast_serializer(self):
+        return self.fast_serializer_class(context=self.get_serializer_context())
+
+    def list(self, request, *args, **kwargs):
+        if self.get_stream_format(request) is not None:
+            return super().list(request, *args, **kwargs)
+
+        serializer = self.get_fast_serializer()
+        rows = serializer.get_rows(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(serializer.serialize(page))
+        return Response(serializer.serialize(rows))
+
+    def stream_rows(self, queryset):
+        serializer = self.get_fast_serializer()
+        rows = serializer.get_rows(queryset).iterator(chunk_size=self.stream_chunk_size)
+        while True:
+            chunk = list(islice(rows, self.stream_chunk_size))
+            if not chunk:
+                return
+            yield [dump_row(item) for item in serializer.serialize(chunk)]
@@ -0,0 +1,180 @@
+import base64
+import binascii
+import json
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (cursor) pagination over a single ordering field plus 'id'.
+
+    Behavior:
+    - The ordering is taken from the 'ordering' query param (first entry only) and must be
+      one of 'ordering_fields', otherwise 'default_ordering' is used.
+    - 'id' is appended as tie-breaker, so the order is stable even for duplicate values.
+    - The next cursor encodes the ordering and the (value, id) of the last row of the page,
+      the previous cursor the first row and the direction. Pages are fetched with a range
+      condition instead of an OFFSET; previous pages by walking the order backwards.
+    - NULL values of nullable fields are always sorted last.
+    - No COUNT query is issued; one extra row is fetched to detect the next (or, walking
+      backwards, the previous) page. The first page has no previous link.
+    - Works with model instances and with .values() rows that contain 'id' and the ordering field.
+
+    Response format:
+    - {"next": <url or null>, "previous": <url or null>, "results": [...]}
+    """
+    page_size = 10
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    cursor_query_param = 'cursor'
+    ordering_query_param = 'ordering'
+    ordering_fields = []
+    default_ordering = '-id'
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.ordering = self.get_ordering(request)
+        self.field_name = self.ordering.lstrip('-')
+        self.descending = self.ordering.startswith('-')
+        self.model = queryset.model
+
+        cursor = self.decode_cursor(request)
+        reverse = cursor is not None and cursor[2]
+        queryset = queryset.order_by(*self.get_order_by(reverse))
+        if cursor is not None:
+            queryset = queryset.filter(self.get_keyset_filter(cursor[0], cursor[1], reverse))
+
+        results = list(queryset[:self.page_size + 1])
+        has_more = len(results) > self.page_size
+        self.page = results[:self.page_size]
+        if reverse:
+            self.page.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, cursor is not None
+        return self.page
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def get_ordering(self, request):
+        params = request.query_params.get(self.ordering_query_param, '')
+        for term in params.split(','):
+            term = term.strip()
+            if term.lstrip('-') in self.ordering_fields:
+                return term
+        return self.default_ordering
+
+    def get_order_by(self, reverse=False):
+        """
+        Returns the page order; reverse walks it backwards, with the NULLs first.
+        """
+        descending = self.descending != reverse
+        field = F(self.field_name)
+        if self.get_model_field().null:
+            nulls = {'nulls_first': True} if reverse else {'nulls_last': True}
+            field = field.desc(**nulls) if descending else field.asc(**nulls)
+        else:
+            field = field.desc() if descending else field.asc()
+        return [field, '-id' if descending else 'id']
+
+    def get_keyset_filter(self, value, pk, reverse=False):
+        """
+        Returns the rows after (value, pk) in the page order, or before it if reverse is set.
+        """
+        lookup = 'lt' if self.descending != reverse else 'gt'
+        id_lookup = f'id__{lookup}'
+        nullable = self.get_model_field().null
+        if value is None:
+            keyset = Q(**{f'{self.field_name}__isnull': True, id_lookup: pk})
+            if reverse:
+                keyset |= Q(**{f'{self.field_name}__isnull': False})
+            return keyset
+
+        keyset = Q(**{f'{self.field_name}__{lookup}': value}) | Q(**{self.field_name: value, id_lookup: pk})
+        if nullable and not reverse:
+            keyset |= Q(**{f'{self.field_name}__isnull': True})
+        return keyset
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            data = json.loads(base64.urlsafe_b64decode(encoded.encode('ascii')))
+            ordering, value, pk, reverse = data['o'], data['v'], int(data['id']), bool(data.get('r'))
+        except (binascii.Error, UnicodeError, ValueError, TypeError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+        if ordering != self.ordering:
+            raise NotFound(self.invalid_cursor_message)
+
+        if value is not None:
+            field = self.get_model_field()
+            try:
+                value = field.to_python(value)
+            except (TypeError, ValueError, DjangoValidationError):
+                raise NotFound(self.invalid_cursor_message)
+        return value, pk, reverse
+
+    def encode_cursor(self, obj, reverse=False):
+        if isinstance(obj, dict):
+            value, pk = obj[self.field_name], obj['id']
+        else:
+            value, pk = getattr(obj, self.field_name), obj.pk
+        if value is not None:
+            field = self.get_model_field()
+            value = field.value_to_string(self.model(**{field.attname: value}))
+        data = {'o': self.ordering, 'v': value, 'id': pk}
+        if reverse:
+            data['r'] = 1
+        data = json.dumps(data)
+        return base64.urlsafe_b64encode(data.encode('ascii')).decode('ascii')
+
+    def get_model_field(self):
+        return self.model._meta.get_field(self.field_name)
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.get_cursor_link(self.encode_cursor(self.page[-1]))
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self.get_cursor_link(self.encode_cursor(self.page[0], reverse=True))
+
+    def get_cursor_link(self, cursor):
+        url = self.request.build_absolute_uri()
+        url = remove_query_param(url, 'page')
+        return replace_query_param(url, self.cursor_query_param, cursor)
@@ -10,7 +10,9 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
 from pathlib import Path
+from .database import get_database_config
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -53,6 +55,7 @@ INSTALLED_APPS = [
     'orders_app',
     'reviews_app',
     'base_info_app',
+    'benchmark_app',
 
 ]
 
@@ -90,11 +93,12 @@ WSGI_APPLICATION = 'core.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# Configured through environment variables, see core/database.py:
+# DB_ENGINE=sqlite (WAL, busy timeout, immediate transactions) or postgresql
+# (persistent connections or the native pool, statement timeout).
+
 DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
-    }
+    'default': get_database_config(BASE_DIR),
 }
 
 
@@ -140,9 +144,44 @@ STATIC_URL = 'static/'
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 
+# Seconds the /api/base-info/ statistics are kept in the cache
+BASE_INFO_CACHE_TTL = 60
+
+
+# Token -> user cache used by auth_app.authentication.CachedTokenAuthentication.
+# SHARED_CACHE is an optional alias from CACHES shared between processes.
+TOKEN_AUTH_CACHE = {
+    'MAX_SIZE': 10000,
+    'TTL': 60,
+    'SHARED_CACHE': None,
+    'SHARED_TTL': 300,
+}
+
+
+# Response cache of GET /api/offers/ (offers_app.cache.OfferListCache).
+# CACHE is an alias from CACHES; use a shared backend when running several processes.
+# VERSIONING is 'creator' (per-creator and global version counters) or 'global'.
+OFFER_LIST_CACHE = {
+    'CACHE': 'default',
+    'TTL': 60,
+    'VERSIONING': 'creator',
+}
+
+
+# Serve login and registration through the async views in auth_app.api.async_views.
+# Enabled by core/asgi.py; the password hashes then run in the bounded pool below.
+ASYNC_AUTH_VIEWS = os.environ.get('ASYNC_AUTH_VIEWS') == '1'
+
+PASSWORD_HASHING_POOL = {
+    'EXECUTOR': 'thread',
+    'MAX_WORKERS': 4,
+    'MAX_QUEUE': 64,
+}
+
+
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework.authentication.TokenAuthentication",
+        "auth_app.authentication.CachedTokenAuthentication",
     ],
 
     'DEFAULT_FILTER_BACKENDS': [
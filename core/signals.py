@@ -0,0 +1,17 @@
+def stash_previous(sender, instance, fields, name):
+    """
+    Reads the stored values of `fields` before a save (call it from a pre_save receiver)
+    and keeps them on the instance; None for a new instance. All post_save handlers of
+    the save read them with get_previous(instance, name), so the row is read once.
+    """
+    previous = None
+    if instance.pk:
+        previous = sender.objects.filter(pk=instance.pk).values(*fields).first()
+    setattr(instance, f'_previous_{name}', previous)
+
+
+def get_previous(instance, name):
+    """
+    Returns the values stored by stash_previous(), or None for a new instance.
+    """
+    return getattr(instance, f'_previous_{name}', None)
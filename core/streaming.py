@@ -0,0 +1,91 @@
+import json
+from django.http import StreamingHttpResponse
+from rest_framework.renderers import JSONRenderer
+from rest_framework.settings import api_settings
+from rest_framework.utils import encoders
+
+
+class NDJSONRenderer(JSONRenderer):
+    """
+    Renderer for 'application/x-ndjson'. It only exists so that content negotiation accepts
+    the media type; list responses are streamed by StreamingListMixin, any other
+    response (errors, single objects) is written as one JSON line.
+    """
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+
+
+def dump_row(data):
+    """
+    Encodes one serialized row the same way as DRF's JSONRenderer.
+    """
+    return json.dumps(
+        data, cls=encoders.JSONEncoder, ensure_ascii=not api_settings.UNICODE_JSON,
+        allow_nan=not api_settings.STRICT_JSON, separators=(',', ':') if api_settings.COMPACT_JSON else None,
+    ).encode('utf-8')
+
+
+class StreamingListMixin:
+    """
+    Opt-in streaming mode for list views.
+
+    Behavior:
+    - '?stream=1' streams the list as one JSON array, '?stream=ndjson' or an
+      'Accept: application/x-ndjson' header streams one JSON object per line.
+    - The filtered queryset is read with .iterator(chunk_size=stream_chunk_size) and
+      serialized row by row, so memory stays flat regardless of the result size.
+      Prefetches are resolved per chunk.
+    - Pagination is skipped; the output has the same rows as the unpaginated list.
+    - Without the opt-in the view behaves as before.
+
+    Under ASGI Django buffers synchronous streaming responses, serve exports through WSGI.
+    """
+    stream_query_param = 'stream'
+    stream_chunk_size = 500
+
+    def get_renderers(self):
+        return super().get_renderers() + [NDJSONRenderer()]
+
+    def get_stream_format(self, request):
+        value = request.query_params.get(self.stream_query_param, '').lower()
+        if value == 'ndjson' or isinstance(request.accepted_renderer, NDJSONRenderer):
+            return 'ndjson'
+        if value in ('1', 'true', 'json'):
+            return 'json'
+        return None
+
+    def list(self, request, *args, **kwargs):
+        stream_format = self.get_stream_format(request)
+        if stream_format is None:
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        if stream_format == 'ndjson':
+            return StreamingHttpResponse(self.stream_ndjson(queryset), content_type=NDJSONRenderer.media_type)
+        return StreamingHttpResponse(self.stream_json_array(queryset), content_type='application/json')
+
+    def stream_rows(self, queryset):
+        """
+        Yields lists of encoded rows, one list per chunk of the queryset iterator.
+        """
+        serializer = self.get_serializer()
+        chunk = []
+        for obj in queryset.iterator(chunk_size=self.stream_chunk_size):
+            chunk.append(dump_row(serializer.to_representation(obj)))
+            if len(chunk) >= self.stream_chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def stream_ndjson(self, queryset):
+        for chunk in self.stream_rows(queryset):
+            yield b'\n'.join(chunk) + b'\n'
+
+    def stream_json_array(self, queryset):
+        yield b'['
+        separator = b''
+        for chunk in self.stream_rows(queryset):
+            yield separator + b','.join(chunk)
+            separator = b','
+        yield b']'
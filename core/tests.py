@@ -0,0 +1,69 @@
+from pathlib import Path
+from django.core.exceptions import ImproperlyConfigured
+from django.test import SimpleTestCase
+from .database import get_database_config, get_postgres_config, get_sqlite_options
+
+BASE_DIR = Path('/srv/coderr')
+
+
+class DatabaseConfigTests(SimpleTestCase):
+    """
+    DATABASES['default'] is built from the environment; each test passes its own environ.
+    """
+
+    def test_sqlite_defaults(self):
+        config = get_database_config(BASE_DIR, {})
+        self.assertEqual(config['ENGINE'], 'django.db.backends.sqlite3')
+        self.assertEqual(config['NAME'], BASE_DIR / 'db.sqlite3')
+        self.assertEqual(config['OPTIONS'], {
+            'init_command': 'PRAGMA journal_mode=WAL;PRAGMA synchronous=NORMAL;'
+                            'PRAGMA mmap_size=268435456;PRAGMA cache_size=-64000',
+            'timeout': 20.0,
+            'transaction_mode': 'IMMEDIATE',
+        })
+
+    def test_sqlite_options_from_environment(self):
+        options = get_sqlite_options({
+            'SQLITE_JOURNAL_MODE': 'DELETE', 'SQLITE_MMAP_SIZE': '0', 'SQLITE_BUSY_TIMEOUT': '5',
+            'SQLITE_TRANSACTION_MODE': '',
+        })
+        self.assertIn('PRAGMA journal_mode=DELETE', options['init_command'])
+        self.assertIn('PRAGMA mmap_size=0', options['init_command'])
+        self.assertEqual((options['timeout'], options['transaction_mode']), (5.0, None))
+        config = get_database_config(BASE_DIR, {'DB_ENGINE': 'SQLite3', 'DB_NAME': '/tmp/test.sqlite3'})
+        self.assertEqual(config['NAME'], '/tmp/test.sqlite3')
+
+    def test_postgres_defaults(self):
+        config = get_database_config(BASE_DIR, {'DB_ENGINE': 'postgres'})
+        self.assertEqual(config, {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': 'coderr',
+            'USER': '',
+            'PASSWORD': '',
+            'HOST': 'localhost',
+            'PORT': '5432',
+            'CONN_MAX_AGE': 60,
+            'CONN_HEALTH_CHECKS': True,
+            'OPTIONS': {'options': '-c statement_timeout=30000'},
+        })
+
+    def test_postgres_from_environment(self):
+        config = get_postgres_config({
+            'DB_NAME': 'shop', 'DB_USER': 'app', 'DB_PASSWORD': 'secret', 'DB_HOST': 'db',
+            'DB_PORT': '6432', 'DB_CONN_MAX_AGE': 'None', 'DB_STATEMENT_TIMEOUT': '0',
+        })
+        self.assertEqual(
+            [config[key] for key in ('NAME', 'USER', 'PASSWORD', 'HOST', 'PORT')],
+            ['shop', 'app', 'secret', 'db', '6432'],
+        )
+        self.assertIsNone(config['CONN_MAX_AGE'])
+        self.assertEqual(config['OPTIONS'], {})
+
+    def test_postgres_pool_disables_conn_max_age(self):
+        config = get_postgres_config({'DB_POOL': '1', 'DB_POOL_MAX_SIZE': '20', 'DB_CONN_MAX_AGE': '600'})
+        self.assertEqual(config['CONN_MAX_AGE'], 0)
+        self.assertEqual(config['OPTIONS']['pool'], {'min_size': 2, 'max_size': 20, 'timeout': 10.0})
+
+    def test_unsupported_engine(self):
+        with self.assertRaises(ImproperlyConfigured):
+            get_database_config(BASE_DIR, {'DB_ENGINE': 'mysql'})
@@ -1,6 +1,8 @@
 import django_filters
-from django.db.models import Min
+from rest_framework import filters
+from rest_framework.settings import api_settings
 from ..models import Offer
+from ..search import get_search_backend
 
 class OfferFilter(django_filters.FilterSet):
     """
@@ -10,6 +12,8 @@ class OfferFilter(django_filters.FilterSet):
     - creator_id: Filters offers by the user ID of the creator (`user__id`).
     - min_price: Filters offers where the minimum price across all related details is greater than or equal to the given value.
     - max_delivery_time: Filters offers where the minimum delivery time across all related details is less than or equal to the given value.
+
+    Both filters read the denormalized Offer.min_price and Offer.min_delivery_time columns.
     
     """
 
@@ -22,7 +26,32 @@ class OfferFilter(django_filters.FilterSet):
         fields = ['creator_id']
 
     def filter_min_price(self, queryset, name, value):
-        return queryset.annotate(min_price=Min('details__price')).filter(min_price__gte=value)
+        return queryset.filter(min_price__gte=value)
 
     def filter_max_delivery_time(self, queryset, name, value):
-        return queryset.annotate(min_delivery_time=Min('details__delivery_time_in_days')).filter(min_delivery_time__lte=value)
+        return queryset.filter(min_delivery_time__lte=value)
+
+
+
+class OfferSearchFilter(filters.SearchFilter):
+    """
+    SearchFilter for offers backed by the configured full-text search backend.
+
+    Behavior:
+    - Keeps the 'search' query param of DRF's SearchFilter.
+    - All search terms must match title or description.
+    - Results are ordered by relevance ('search_rank'), unless the request has an 'ordering' param;
+      the view's default ordering is replaced. Cursor pages use the keyset ordering instead
+      (see OfferKeysetPagination).
+
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        search_terms = self.get_search_terms(request)
+        if not search_terms:
+            return queryset
+
+        queryset = get_search_backend().search(queryset, search_terms)
+        if not request.query_params.get(api_settings.ORDERING_PARAM):
+            queryset = queryset.order_by('-search_rank', '-id')
+        return queryset
@@ -1,6 +1,10 @@
+from django.db import transaction
 from rest_framework import serializers
+from core.fast_serializers import FastSerializer
 from ..models import Offer, OfferDetail, Feature
 from profile_app.models import Profile
+from reviews_app.api.serializers import get_rating_summary, rating_summary_data
+from reviews_app.models import BusinessRatingSummary
 
 
 
@@ -24,8 +28,10 @@ class OfferSerializer(serializers.ModelSerializer):
     - Ensures that exactly 3 detail objects are provided.
 
     Creation:
-    - Creates an Offer instance linked to the currently authenticated user.
-    - Creates associated OfferDetail instances after the Offer is created.
+    - Creates an Offer instance linked to the currently authenticated user, with the
+      denormalized min_price and min_delivery_time computed from the submitted details.
+    - Inserts the associated OfferDetail instances with one bulk_create.
+    - Both writes run in one transaction.
 
     """
     details = OfferDetailSerializer(many=True)
@@ -42,9 +48,12 @@ class OfferSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         details_data = validated_data.pop('details')
         user = self.context['request'].user
-        offer = Offer.objects.create(user=user, **validated_data)
-        for detail in details_data:
-            OfferDetail.objects.create(offer=offer, **detail)
+        offer = Offer(user=user, **validated_data)
+        details = [OfferDetail(offer=offer, **detail) for detail in details_data]
+        offer.set_min_values(details)
+        with transaction.atomic():
+            offer.save()
+            OfferDetail.objects.bulk_create(details)
         return offer
 
 
@@ -54,17 +63,28 @@ class UserSummarySerializer(serializers.ModelSerializer):
 
     Note:
     - All fields are read-only and retrieved via the Profile relationship.
+    - rating_summary is read from the BusinessRatingSummary of the user.
     - The serializer is based on the Profile model.
 
     """
     first_name = serializers.CharField(source="profile.first_name", read_only=True)
     last_name = serializers.CharField(source="profile.last_name", read_only=True)
     username = serializers.CharField(source="profile.username", read_only=True)
+    rating_summary = serializers.SerializerMethodField()
 
     class Meta:
         model = Profile
-        fields = ["first_name", "last_name", "username"]
+        fields = ["first_name", "last_name", "username", "rating_summary"]
 
+    def get_rating_summary(self, obj):
+        return get_rating_summary(obj)
+
+
+def get_offer_detail_url(detail_id):
+    """
+    Returns the relative URL of an offer detail as shown in the offer lists.
+    """
+    return f"/offerdetails/{detail_id}/"
 
 
 class OfferDetailURLSerializer(serializers.ModelSerializer):
@@ -73,7 +93,7 @@ class OfferDetailURLSerializer(serializers.ModelSerializer):
     Serializer for OfferDetail model that provides a URL to the detail instance.
 
     Note:
-    - The URL is constructed manually using the object's ID.
+    - The URL is built by get_offer_detail_url() from the object's ID.
 
     """
     url = serializers.SerializerMethodField()
@@ -83,20 +103,19 @@ class OfferDetailURLSerializer(serializers.ModelSerializer):
         fields = ["id", "url"]
 
     def get_url(self, obj):
-        return f"/offerdetails/{obj.id}/"
+        return get_offer_detail_url(obj.id)
 
 class OfferListSerializer(serializers.ModelSerializer):
     """
     Serializer for listing Offer instances with summarized details and user information.
 
-    Methods:
-    - get_min_price(obj): Calculates and returns the lowest price from the related OfferDetails.
-    - get_min_delivery_time(obj): Calculates and returns the shortest delivery time from the related OfferDetails.
+    Note:
+    - min_price and min_delivery_time are read from the denormalized Offer columns.
 
     """
     details = OfferDetailURLSerializer(many=True, read_only=True)
-    min_price = serializers.SerializerMethodField()
-    min_delivery_time = serializers.SerializerMethodField()
+    min_price = serializers.ReadOnlyField()
+    min_delivery_time = serializers.ReadOnlyField()
     user_details = UserSummarySerializer(source="user", read_only=True)
 
     class Meta:
@@ -107,31 +126,54 @@ class OfferListSerializer(serializers.ModelSerializer):
             "min_price", "min_delivery_time", "user_details"
         ]
 
-    def get_min_price(self, obj):
-        details = obj.details.all()
-        prices = [detail.price for detail in details if detail.price is not None]
-        return min(prices) if prices else None
 
-    def get_min_delivery_time(self, obj):
-        details = obj.details.all()
-        delivery_times = [detail.delivery_time_in_days for detail in details if detail.delivery_time_in_days is not None]
-        return min(delivery_times) if delivery_times else None
+class FastOfferListSerializer(FastSerializer):
+    """
+    Fast read-only variant of OfferListSerializer for the offer list.
+
+    - user_details is read from the joined profile and rating summary columns of the
+      same query (null names for users without a profile, like the nested serializer).
+    - details are loaded with one values_list() query per page, ordered by id.
+
+    """
+    serializer_class = OfferListSerializer
+    related_fields = ('details', 'user_details')
+    extra_values = (
+        'user__profile__first_name', 'user__profile__last_name', 'user__profile__username',
+        *(f'user__rating_summary__{field}' for field in BusinessRatingSummary.counter_fields()),
+    )
+
+    def load_related(self, rows):
+        details = {}
+        detail_rows = OfferDetail.objects.filter(offer_id__in=[row['id'] for row in rows]).order_by('id')
+        for offer_id, detail_id in detail_rows.values_list('offer_id', 'id'):
+            details.setdefault(offer_id, []).append({'id': detail_id, 'url': get_offer_detail_url(detail_id)})
+        return {
+            'details': lambda row: details.get(row['id'], []),
+            'user_details': self.get_user_details,
+        }
+
+    def get_user_details(self, row):
+        return {
+            'first_name': row['user__profile__first_name'],
+            'last_name': row['user__profile__last_name'],
+            'username': row['user__profile__username'],
+            'rating_summary': rating_summary_data({
+                field: row[f'user__rating_summary__{field}'] for field in BusinessRatingSummary.counter_fields()
+            }),
+        }
 
 
 class SingleOfferSerializer(serializers.ModelSerializer):
     """
 
     Serializer for a single Offer instance with summarized OfferDetail URLs
-    and computed fields for minimum price and minimum delivery time.
-
-    Methods:
-    - get_min_price(obj): Returns the lowest price from the related OfferDetails.
-    - get_min_delivery_time(obj): Returns the shortest delivery time from the related OfferDetails.
+    and the denormalized minimum price and minimum delivery time.
 
     """
     details = OfferDetailURLSerializer(many=True, read_only=True)
-    min_price = serializers.SerializerMethodField()
-    min_delivery_time = serializers.SerializerMethodField()
+    min_price = serializers.ReadOnlyField()
+    min_delivery_time = serializers.ReadOnlyField()
     
 
     class Meta:
@@ -142,16 +184,6 @@ class SingleOfferSerializer(serializers.ModelSerializer):
             "min_price", "min_delivery_time"
         ]
 
-    def get_min_price(self, obj):
-        details = obj.details.all()
-        prices = [detail.price for detail in details if detail.price is not None]
-        return min(prices) if prices else None
-
-    def get_min_delivery_time(self, obj):
-        details = obj.details.all()
-        delivery_times = [detail.delivery_time_in_days for detail in details if detail.delivery_time_in_days is not None]
-        return min(delivery_times) if delivery_times else None
-
 
 
 
@@ -188,6 +220,11 @@ class OfferUpdateSerializer(serializers.ModelSerializer):
         - If a matching OfferDetail exists, it will be updated with the provided data.
         - If no matching OfferDetail exists, a new OfferDetail will be created.
     - Details without 'offer_type' are skipped (can be changed to raise validation error).
+    - Changed details are written with one bulk_update of the changed fields only,
+      new details with one bulk_create; unchanged details are not written.
+    - Refreshes the denormalized min_price and min_delivery_time when details are given,
+      computed from the loaded details and saved with the offer.
+    - All writes run in one transaction.
 
     """
     details = OfferDetailUpdateSerializer(many=True, required=False)
@@ -204,34 +241,47 @@ class OfferUpdateSerializer(serializers.ModelSerializer):
 
 
     def update(self, instance, validated_data):
-       
         for attr, value in validated_data.items():
             if attr != 'details':
                 setattr(instance, attr, value)
-        instance.save()
 
-      
         details_data = validated_data.get('details')
-        if details_data is not None:
-            existing_details = {d.offer_type: d for d in instance.details.all()}
-
-            for detail_data in details_data:
-                offer_type = detail_data.get('offer_type')
-                if not offer_type:
-                    continue 
-
-                detail_instance = existing_details.get(offer_type)
-                if detail_instance:
-                 
-                    for attr, value in detail_data.items():
-                        setattr(detail_instance, attr, value)
-                    detail_instance.save()
-                else:
-                   
-                    OfferDetail.objects.create(offer=instance, **detail_data)
-
+        with transaction.atomic():
+            if details_data is not None:
+                self.update_details(instance, details_data)
+            instance.save()
         return instance
 
+    def update_details(self, instance, details_data):
+        existing_details = {d.offer_type: d for d in instance.details.all()}
+        changed_details = []
+        changed_fields = set()
+        new_details = []
+
+        for detail_data in details_data:
+            offer_type = detail_data.get('offer_type')
+            if not offer_type:
+                continue
+
+            detail_instance = existing_details.get(offer_type)
+            if detail_instance:
+                fields = [attr for attr, value in detail_data.items() if getattr(detail_instance, attr) != value]
+                for attr in fields:
+                    setattr(detail_instance, attr, detail_data[attr])
+                if fields and detail_instance.pk is not None and detail_instance not in changed_details:
+                    changed_details.append(detail_instance)
+                changed_fields.update(fields)
+            else:
+                detail_instance = OfferDetail(offer=instance, **detail_data)
+                new_details.append(detail_instance)
+                existing_details[offer_type] = detail_instance
+
+        if changed_details:
+            OfferDetail.objects.bulk_update(changed_details, sorted(changed_fields))
+        if new_details:
+            OfferDetail.objects.bulk_create(new_details)
+        instance.set_min_values(existing_details.values())
+
 
 class FeatureSerializer(serializers.StringRelatedField):
     """
@@ -1,12 +1,17 @@
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters, generics, status
 from rest_framework.pagination import PageNumberPagination
-from rest_framework.permissions import IsAuthenticated, SAFE_METHODS, AllowAny
+from rest_framework.permissions import IsAdminUser, IsAuthenticated, SAFE_METHODS, AllowAny
 from rest_framework.response import Response
+from rest_framework.views import APIView
+from core.pagination import KeysetPagination
+from core.conditional import ConditionalListMixin, ConditionalRetrieveMixin, conditional_response
+from core.fast_serializers import FastListMixin
+from ..cache import offer_list_cache
 from ..models import Offer, OfferDetail
-from .filters import OfferFilter
+from .filters import OfferFilter, OfferSearchFilter
 from .permissions import PublicOfferListPermission, AuthenticatedOfferDetailPermission
-from .serializers import (OfferDetailSerializer, OfferListSerializer, OfferSerializer, OfferUpdateSerializer, SingleOfferSerializer,)
+from .serializers import (FastOfferListSerializer, OfferDetailSerializer, OfferListSerializer, OfferSerializer, OfferUpdateSerializer, SingleOfferSerializer,)
 
 class OfferPagination(PageNumberPagination):
     """
@@ -15,36 +20,77 @@ class OfferPagination(PageNumberPagination):
     - Default page size: 10
     - Client can specify page size with 'page_size' query param
     - Maximum allowed page size: 100
+    - Passing 'cursor' (empty for the first page) switches to OfferKeysetPagination;
+      cursor pages are never ordered by search relevance (see OfferKeysetPagination)
 
     """
     page_size = 10
     page_size_query_param = 'page_size'
     max_page_size = 100
+    cursor_query_param = 'cursor'
 
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.cursor_query_param in request.query_params:
+            self.keyset_paginator = OfferKeysetPagination()
+            return self.keyset_paginator.paginate_queryset(queryset, request, view)
+        self.keyset_paginator = None
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.keyset_paginator:
+            return self.keyset_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+
+class OfferKeysetPagination(KeysetPagination):
+    """
+
+    Keyset pagination for the offer list, used when the 'cursor' query param is present.
+    - Ordering: 'updated_at' or 'min_price' (ascending or descending), 'id' as tie-breaker
+    - Default ordering: newest updated_at first
+    - No COUNT query and no OFFSET scan, so every page costs the same
+    - With 'search' the pages keep this ordering, the relevance order of OfferSearchFilter
+      is replaced: search_rank is computed per query and can not be used as a keyset
 
-class OfferListCreateAPIView(generics.ListCreateAPIView):
+    """
+    page_size = 10
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering_fields = ['updated_at', 'min_price']
+    default_ordering = '-updated_at'
+
+
+class OfferListCreateAPIView(ConditionalListMixin, FastListMixin, generics.ListCreateAPIView):
     """
 
     API endpoint for listing all offers and creating new offers.
 
     Features:
-    - Queryset optimized with prefetch_related for 'details' and 'user'
+    - Queryset optimized with prefetch_related for 'details', 'user' and the user's rating summary
     - Permissions: authenticated users with OfferPermission
-    - Supports filtering (via OfferFilter), ordering, and search
+    - Supports filtering (via OfferFilter), ordering, and full-text search (via OfferSearchFilter)
+    - Default ordering: newest updated_at first (served by the (updated_at, id) index)
     - Pagination with OfferPagination
+    - Streaming export with '?stream=1' or '?stream=ndjson' (see StreamingListMixin)
+    - ETag for conditional GETs (see ConditionalListMixin); cache hits answer a matching
+      If-None-Match with 304 without any query
+    - GET responses are cached in offer_list_cache, keyed on the normalized query string;
+      hits answer without database queries (see OfferListCache). Streamed lists are not cached
     - Serializer:
         - POST requests use OfferSerializer for creation
-        - GET requests use OfferListSerializer for listing
+        - GET requests use OfferListSerializer for listing, served by FastOfferListSerializer
 
     """
-    queryset = Offer.objects.all().prefetch_related('details', 'user')
+    queryset = Offer.objects.all().prefetch_related('details', 'user__rating_summary')
     permission_classes = [PublicOfferListPermission]
 
-    filter_backends = [DjangoFilterBackend, filters.OrderingFilter, filters.SearchFilter]
+    filter_backends = [DjangoFilterBackend, filters.OrderingFilter, OfferSearchFilter]
     filterset_class = OfferFilter
     ordering_fields = ['updated_at', 'min_price']
+    ordering = ['-updated_at', '-id']
     search_fields = ['title', 'description']
     pagination_class = OfferPagination
+    fast_serializer_class = FastOfferListSerializer
 
     def get_serializer_class(self):
         if self.request.method == 'POST':
@@ -54,8 +100,26 @@ class OfferListCreateAPIView(generics.ListCreateAPIView):
     def perform_create(self, serializer):
         serializer.save()
 
+    def list(self, request, *args, **kwargs):
+        # Streamed responses (?stream or an accepted NDJSONRenderer) have no .data to cache.
+        if self.get_stream_format(request) is not None:
+            return super().list(request, *args, **kwargs)
+        key = offer_list_cache.get_key(request)
+        if key is None:
+            return super().list(request, *args, **kwargs)
+
+        entry = offer_list_cache.get(key)
+        if entry is not None:
+            data, etag = entry
+            return conditional_response(request, etag, None, lambda: Response(data))
+
+        response = super().list(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK and hasattr(response, 'data'):
+            offer_list_cache.set(key, (response.data, self.etag))
+        return response
+
 
-class OfferRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIView):
+class OfferRetrieveUpdateDestroyAPIView(ConditionalRetrieveMixin, generics.RetrieveUpdateDestroyAPIView):
     """
 
     API endpoint for retrieving, updating, or deleting a single offer.
@@ -65,6 +129,7 @@ class OfferRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIView):
     - Serializer:
         - PATCH/PUT requests use OfferUpdateSerializer for updates
         - GET requests use SingleOfferSerializer for detail retrieval
+    - ETag / Last-Modified for conditional GETs (see ConditionalRetrieveMixin)
 
     """
     queryset = Offer.objects.all()
@@ -75,7 +140,7 @@ class OfferRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIView):
             return OfferUpdateSerializer
         return SingleOfferSerializer
 
-class SingleDetailView(generics.RetrieveAPIView):
+class SingleDetailView(ConditionalRetrieveMixin, generics.RetrieveAPIView):
     """
 
     API endpoint to retrieve a single OfferDetail instance.
@@ -83,6 +148,7 @@ class SingleDetailView(generics.RetrieveAPIView):
     Features:
     - Requires authentication
     - Uses OfferDetailSerializer for serialization
+    - ETag for conditional GETs (OfferDetail has no timestamp, so no Last-Modified)
 
     """
     queryset = OfferDetail.objects.all()
@@ -90,4 +156,18 @@ class SingleDetailView(generics.RetrieveAPIView):
     permission_classes = [IsAuthenticated]
 
 
+class OfferListCacheStatsView(APIView):
+    """
+    API endpoint exposing the counters of the offer list response cache.
+
+    GET:
+        Returns hits, misses, bypassed requests, invalidations and the hit ratio
+        of the answering worker, plus the cache configuration.
+
+    Permissions:
+    - Only admin users (is_staff).
+    """
+    permission_classes = [IsAdminUser]
 
+    def get(self, request):
+        return Response(offer_list_cache.stats(), status=status.HTTP_200_OK)
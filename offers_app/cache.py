@@ -0,0 +1,128 @@
+import hashlib
+import threading
+import time
+from django.conf import settings
+from django.core.cache import caches
+
+DEFAULTS = {
+    'CACHE': 'default',
+    'TTL': 60,
+    'VERSIONING': 'creator',
+}
+KEY_PREFIX = 'offer_list:'
+CREATOR_PARAM = 'creator_id'
+# Query params that select the offer list page; requests with other params are not cached.
+CACHEABLE_PARAMS = {CREATOR_PARAM, 'min_price', 'max_delivery_time', 'ordering', 'search', 'page', 'page_size', 'cursor'}
+
+
+def get_setting(name):
+    return getattr(settings, 'OFFER_LIST_CACHE', {}).get(name, DEFAULTS[name])
+
+
+def version_key(scope):
+    return f'{KEY_PREFIX}{scope}:version'
+
+
+class OfferListCache:
+    """
+    Response cache for GET /api/offers/ with version counter invalidation.
+
+    Behavior:
+    - The key is built from the normalized query string (CACHEABLE_PARAMS sorted, empty
+      filters dropped), the host and the media type; any other param bypasses the cache.
+    - Every key contains the current version. Offer, OfferDetail and Profile changes bump
+      the global version and the version of the offer creator, so old entries are never
+      read again and expire with 'TTL'.
+    - With VERSIONING 'creator', lists filtered by creator_id only use that creator's version
+      and survive changes of other creators; with 'global' every change invalidates all lists.
+    - Versions live in the configured cache, so all processes sharing that cache see the
+      bumps. With the local-memory backend each process has its own versions; keep 'TTL' short.
+    - A missing version starts at the current time in nanoseconds, so an evicted counter
+      never falls back to a version that old entries were stored under.
+    - Hit, miss, bypass and invalidation counters are kept per process for stats().
+    """
+
+    def __init__(self, alias, ttl, versioning):
+        self.alias = alias
+        self.ttl = ttl
+        self.versioning = versioning
+        self.lock = threading.Lock()
+        self.counters = {'hits': 0, 'misses': 0, 'bypassed': 0, 'invalidations': 0}
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def count(self, counter):
+        with self.lock:
+            self.counters[counter] += 1
+
+    def normalize_params(self, query_params):
+        """
+        Returns the sorted (name, value) pairs of the request, or None if it is not cacheable.
+        """
+        if not set(query_params) <= CACHEABLE_PARAMS:
+            return None
+        pairs = []
+        for name in sorted(query_params):
+            for value in query_params.getlist(name):
+                if value or name == 'cursor':
+                    pairs.append((name, value.strip()))
+        return pairs
+
+    def get_version(self, scope):
+        key = version_key(scope)
+        version = self.cache.get(key)
+        if version is None:
+            self.cache.add(key, time.time_ns(), None)
+            version = self.cache.get(key)
+        return version
+
+    def get_key(self, request):
+        pairs = self.normalize_params(request.query_params)
+        if pairs is None:
+            self.count('bypassed')
+            return None
+        digest = hashlib.md5(
+            repr([request.get_host(), request.accepted_media_type, pairs]).encode('utf-8'), usedforsecurity=False,
+        ).hexdigest()
+        scope = self.get_scope(pairs)
+        return f'{KEY_PREFIX}{scope}:{self.get_version(scope)}:{digest}'
+
+    def get_scope(self, pairs):
+        creator_ids = [value for name, value in pairs if name == CREATOR_PARAM]
+        if self.versioning == 'creator' and len(creator_ids) == 1 and creator_ids[0].isdigit():
+            return f'creator:{int(creator_ids[0])}'
+        return 'all'
+
+    def get(self, key):
+        entry = self.cache.get(key)
+        self.count('misses' if entry is None else 'hits')
+        return entry
+
+    def set(self, key, entry):
+        self.cache.set(key, entry, self.ttl)
+
+    def bump(self, user_id=None):
+        """
+        Invalidates all cached lists (global version) and the lists of the given creator.
+        """
+        scopes = ['all']
+        if self.versioning == 'creator' and user_id is not None:
+            scopes.append(f'creator:{user_id}')
+        for scope in scopes:
+            try:
+                self.cache.incr(version_key(scope))
+            except ValueError:
+                self.cache.add(version_key(scope), time.time_ns(), None)
+        self.count('invalidations')
+
+    def stats(self):
+        with self.lock:
+            stats = dict(self.counters, cache=self.alias, ttl=self.ttl, versioning=self.versioning)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_ratio'] = round(stats['hits'] / lookups, 4) if lookups else 0
+        return stats
+
+
+offer_list_cache = OfferListCache(get_setting('CACHE'), get_setting('TTL'), get_setting('VERSIONING'))
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Min, OuterRef, Subquery
+from offers_app.models import Offer, OfferDetail
+
+
+class Command(BaseCommand):
+    """
+    Recomputes Offer.min_price and Offer.min_delivery_time for all offers.
+
+    Runs as a single UPDATE with correlated subqueries over OfferDetail.
+    """
+    help = "Backfills the denormalized min_price and min_delivery_time columns on Offer."
+
+    def handle(self, *args, **options):
+        details = OfferDetail.objects.filter(offer=OuterRef('pk')).values('offer')
+        updated = Offer.objects.update(
+            min_price=Subquery(details.annotate(value=Min('price')).values('value')),
+            min_delivery_time=Subquery(details.annotate(value=Min('delivery_time_in_days')).values('value')),
+        )
+        self.stdout.write(self.style.SUCCESS(f"Updated {updated} offers."))
@@ -0,0 +1,61 @@
+import sys
+import time
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Prefetch
+from core.streaming import dump_row
+from offers_app.api.serializers import OfferSerializer
+from offers_app.models import Offer, OfferDetail
+
+
+class Command(BaseCommand):
+    """
+    Exports offers with their details as JSONL in the OfferSerializer shape.
+
+    Behavior:
+    - Offers are read in id order with .iterator(chunk_size), the details are prefetched
+      per chunk, so memory stays constant regardless of the number of offers.
+    - Each line is OfferSerializer output encoded like the API responses; --with-user
+      adds the owner id as 'user', which import_offers uses as the owner.
+    - Progress is reported in rows per second on stderr.
+    """
+    help = "Exports offers to a JSONL file."
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="Output file, '-' for stdout.")
+        parser.add_argument('--user', type=int, help="Only export the offers of this user id.")
+        parser.add_argument('--with-user', action='store_true', help="Add the owner id as 'user' to every line.")
+        parser.add_argument('--chunk-size', type=int, default=2000, help="Offers fetched (and details prefetched) per query.")
+
+    def handle(self, *args, **options):
+        path = options['path']
+        chunk_size = options['chunk_size']
+        queryset = Offer.objects.order_by('id').prefetch_related(
+            Prefetch('details', queryset=OfferDetail.objects.order_by('id'))
+        )
+        if options['user'] is not None:
+            queryset = queryset.filter(user_id=options['user'])
+
+        try:
+            file = sys.stdout.buffer if path == '-' else open(path, 'wb')
+        except OSError as error:
+            raise CommandError(f"Cannot open {path}: {error}")
+
+        serializer = OfferSerializer()
+        started = time.monotonic()
+        exported = 0
+        try:
+            for offer in queryset.iterator(chunk_size=chunk_size):
+                data = serializer.to_representation(offer)
+                if options['with_user']:
+                    data['user'] = offer.user_id
+                file.write(dump_row(data) + b'\n')
+                exported += 1
+                if exported % chunk_size == 0:
+                    self.stderr.write(f"{exported} offers exported ({exported / (time.monotonic() - started):.0f} rows/s).")
+        finally:
+            if file is not sys.stdout.buffer:
+                file.close()
+
+        elapsed = time.monotonic() - started
+        rate = exported / elapsed if elapsed else 0
+        self.stderr.write(self.style.SUCCESS(f"Exported {exported} offers ({rate:.0f} rows/s)."))
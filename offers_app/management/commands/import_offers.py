@@ -0,0 +1,156 @@
+import json
+import sys
+import time
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError, transaction
+from rest_framework.exceptions import ValidationError
+from auth_app.models import CustomUser
+from base_info_app.signals import apply_delta
+from offers_app.api.serializers import OfferSerializer
+from offers_app.cache import offer_list_cache
+from offers_app.models import Offer, OfferDetail
+from offers_app.search import get_search_backend
+
+
+def read_rows(file):
+    for line, text in enumerate(file, start=1):
+        if text.strip():
+            yield line, text
+
+
+def get_image_name(value):
+    """
+    Returns the stored file name for an exported image URL (storage base URL stripped).
+    """
+    if not value:
+        return None
+    base_url = Offer._meta.get_field('image').storage.base_url or ''
+    return value[len(base_url):] if base_url and value.startswith(base_url) else value
+
+
+class Command(BaseCommand):
+    """
+    Imports offers with their details from a JSONL file in the OfferSerializer shape,
+    as written by export_offers.
+
+    Behavior:
+    - Every line is validated with one OfferSerializer instance (including validate_details);
+      'id', 'created_at' and 'updated_at' are ignored, 'image' is taken as the stored file name.
+    - The owner is the 'user' key of the line (a user id) or --user; it must be a business user.
+    - Offers and details are written in batches with one bulk_create per table and batch,
+      each batch in its own transaction. min_price and min_delivery_time are computed
+      from the details before the insert.
+    - bulk_create bypasses the model signals, so every batch also adds its offers to the
+      search index and the BaseInfo offer counter in the same transaction, and bumps the
+      offer list cache versions; an interrupted import leaves the counter in sync.
+    - Invalid lines are skipped and reported; progress is reported in rows per second.
+    """
+    help = "Bulk imports offers from a JSONL file."
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="JSONL file with one offer per line, '-' for stdin.")
+        parser.add_argument('--user', type=int, help="Id of the business user owning offers without a 'user' key.")
+        parser.add_argument('--batch-size', type=int, default=1000, help="Offers per bulk_create batch.")
+
+    def handle(self, *args, **options):
+        path = options['path']
+        self.default_user = options['user']
+        self.business_users = set()
+        self.created = 0
+        self.skipped = 0
+        self.started = time.monotonic()
+        # One instance for all lines, so the (nested) fields are only built once.
+        self.serializer = OfferSerializer()
+
+        try:
+            file = sys.stdin if path == '-' else open(path, encoding='utf-8')
+        except OSError as error:
+            raise CommandError(f"Cannot open {path}: {error}")
+
+        with file:
+            batch = []
+            for line, text in read_rows(file):
+                batch.append((line, text))
+                if len(batch) >= options['batch_size']:
+                    self.import_batch(batch)
+                    batch = []
+            if batch:
+                self.import_batch(batch)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {self.created} offers, skipped {self.skipped} ({self.get_rate():.0f} rows/s)."
+        ))
+
+    def get_rate(self):
+        elapsed = time.monotonic() - self.started
+        return (self.created + self.skipped) / elapsed if elapsed else 0
+
+    def import_batch(self, batch):
+        rows = self.clean_rows(batch)
+        if not rows:
+            return
+
+        offers = []
+        details = []
+        for user_id, data in rows:
+            details_data = data.pop('details')
+            offer = Offer(user_id=user_id, **data)
+            offer_details = [OfferDetail(offer=offer, **detail) for detail in details_data]
+            offer.set_min_values(offer_details)
+            offers.append(offer)
+            details += offer_details
+
+        try:
+            with transaction.atomic():
+                Offer.objects.bulk_create(offers)
+                OfferDetail.objects.bulk_create(details)
+                get_search_backend().index_many(offers)
+                apply_delta(offer_count=len(offers))
+        except IntegrityError as error:
+            raise CommandError(f"Batch ending at line {batch[-1][0]} was rolled back: {error}")
+
+        for user_id in {offer.user_id for offer in offers}:
+            offer_list_cache.bump(user_id)
+        self.created += len(offers)
+        self.stdout.write(f"Line {batch[-1][0]}: {self.created} offers imported ({self.get_rate():.0f} rows/s).")
+
+    def clean_rows(self, batch):
+        """
+        Returns (user id, validated data) for the valid lines; owners are looked up with one query per batch.
+        """
+        parsed = []
+        for line, text in batch:
+            try:
+                row = json.loads(text)
+            except ValueError as error:
+                self.skip(line, f"invalid JSON ({error})")
+                continue
+            if not isinstance(row, dict):
+                self.skip(line, "not a JSON object")
+                continue
+            parsed.append((line, row))
+
+        user_ids = {row.get('user', self.default_user) for _, row in parsed} - self.business_users - {None}
+        self.business_users |= set(
+            CustomUser.objects.filter(id__in=[user_id for user_id in user_ids if isinstance(user_id, int)], type='business')
+            .values_list('id', flat=True)
+        )
+
+        rows = []
+        for line, row in parsed:
+            user_id = row.get('user', self.default_user)
+            if user_id not in self.business_users:
+                self.skip(line, f"no business user {user_id!r}")
+                continue
+            image = get_image_name(row.pop('image', None))
+            try:
+                data = self.serializer.run_validation(row)
+            except ValidationError as error:
+                self.skip(line, json.dumps(error.detail))
+                continue
+            rows.append((user_id, dict(data, image=image)))
+        return rows
+
+    def skip(self, line, error):
+        self.skipped += 1
+        self.stderr.write(f"Line {line}: skipped, {error}.")
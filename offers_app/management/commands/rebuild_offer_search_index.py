@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+from offers_app.search import get_search_backend
+
+
+class Command(BaseCommand):
+    """
+    Rebuilds the full-text search index of the configured offer search backend.
+
+    Needed after writes that bypass the Offer signals, e.g. bulk_create or queryset updates.
+    """
+    help = "Rebuilds the offer full-text search index."
+
+    def handle(self, *args, **options):
+        backend = get_search_backend()
+        backend.rebuild()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt search index with {type(backend).__name__}."))
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.7 on 2026-10-18 17:30
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def merge_duplicate_features(apps, schema_editor):
+    Feature = apps.get_model('offers_app', 'Feature')
+    Order = apps.get_model('orders_app', 'Order')
+    OrderFeature = Order.features.through
+
+    duplicates = Feature.objects.values('name').annotate(keep_id=Min('id'), total=Count('id')).filter(total__gt=1)
+    for duplicate in duplicates:
+        keep_id = duplicate['keep_id']
+        drop_ids = list(Feature.objects.filter(name=duplicate['name']).exclude(id=keep_id).values_list('id', flat=True))
+        for row in OrderFeature.objects.filter(feature_id__in=drop_ids):
+            OrderFeature.objects.get_or_create(order_id=row.order_id, feature_id=keep_id)
+        OrderFeature.objects.filter(feature_id__in=drop_ids).delete()
+        Feature.objects.filter(id__in=drop_ids).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers_app', '0014_offer_search_index'),
+        ('orders_app', '0003_alter_order_offer_detail_alter_order_status'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_features, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='feature',
+            name='name',
+            field=models.CharField(max_length=255, unique=True),
+        ),
+    ]
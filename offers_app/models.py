@@ -1,18 +1,54 @@
 from django.db import models
+from django.db.models import Min
 from django.conf import settings
 
 class Offer(models.Model):
-    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='offers')
+    # Indexed by the composite (user, ...) indexes below.
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='offers', db_index=False)
     title = models.CharField(max_length=255)
     image = models.ImageField(upload_to='offers/', null=True, blank=True)
     description = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    min_price = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
+    min_delivery_time = models.IntegerField(null=True, blank=True, db_index=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['updated_at', 'id'], name='offer_updated_at_id_idx'),
+            models.Index(fields=['min_price', 'id'], name='offer_min_price_id_idx'),
+            # creator_id filter combined with each ordering field
+            models.Index(fields=['user', 'updated_at', 'id'], name='offer_user_updated_idx'),
+            models.Index(fields=['user', 'min_price', 'id'], name='offer_user_min_price_idx'),
+        ]
+
     def __str__(self):
         created_str = self.created_at.strftime("%d.%m.%Y %H:%M")
         updated_str = self.updated_at.strftime("%d.%m.%Y %H:%M")
         return f"{created_str} - {self.title} created by {self.user.username} - last update: {updated_str}"
 
+    def refresh_min_values(self):
+        """
+        Recomputes min_price and min_delivery_time from the related OfferDetails.
+
+        The values are written with a queryset update so that updated_at is not touched.
+        """
+        values = self.details.aggregate(
+            min_price=Min('price'),
+            min_delivery_time=Min('delivery_time_in_days'),
+        )
+        Offer.objects.filter(pk=self.pk).update(**values)
+        self.min_price = values['min_price']
+        self.min_delivery_time = values['min_delivery_time']
+
+    def set_min_values(self, details):
+        """
+        Sets min_price and min_delivery_time from the given OfferDetails without a query;
+        the values are stored with the next save() of the offer.
+        """
+        self.min_price = min((detail.price for detail in details), default=None)
+        self.min_delivery_time = min((detail.delivery_time_in_days for detail in details), default=None)
+
 
 class OfferDetail(models.Model):
     TYPE_CHOICES = (
@@ -35,7 +71,25 @@ class OfferDetail(models.Model):
 
 
 class Feature(models.Model):
-    name = models.CharField(max_length=255)
+    name = models.CharField(max_length=255, unique=True)
 
     def __str__(self):
-        return self.name
\ No newline at end of file
+        return self.name
+
+    @classmethod
+    def get_or_create_many(cls, names):
+        """
+        Returns the Feature instances for the given names, in the same order, creating missing ones.
+
+        Existing names are fetched with a single query; missing names are inserted with one
+        bulk_create that ignores conflicts from concurrent inserts, then fetched again.
+        """
+        names = list(dict.fromkeys(names))
+        if not names:
+            return []
+        features = {feature.name: feature for feature in cls.objects.filter(name__in=names)}
+        missing = [name for name in names if name not in features]
+        if missing:
+            cls.objects.bulk_create([cls(name=name) for name in missing], ignore_conflicts=True)
+            features.update({feature.name: feature for feature in cls.objects.filter(name__in=missing)})
+        return [features[name] for name in names]
\ No newline at end of file
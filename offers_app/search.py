@@ -0,0 +1,159 @@
+from django.conf import settings
+from django.db import connection
+from django.db.models import FloatField, Q, Value
+from django.db.models.expressions import RawSQL
+from django.utils.module_loading import import_string
+
+
+class BaseSearchBackend:
+    """
+    Base class for offer search backends.
+
+    A backend filters an Offer queryset by a list of search terms (all terms must match)
+    and annotates it with 'search_rank', where a higher value means a better match.
+    Backends with their own index keep it in sync through index() and remove(),
+    which are called from the Offer post_save and post_delete signals, and through
+    index_many() for bulk inserts that bypass the signals.
+    """
+
+    def search(self, queryset, terms):
+        raise NotImplementedError
+
+    def index(self, offer):
+        pass
+
+    def index_many(self, offers):
+        for offer in offers:
+            self.index(offer)
+
+    def remove(self, offer_id):
+        pass
+
+    def rebuild(self):
+        pass
+
+
+class SimpleSearchBackend(BaseSearchBackend):
+    """
+    Fallback backend using icontains lookups on title and description, without an index.
+    """
+
+    def search(self, queryset, terms):
+        for term in terms:
+            queryset = queryset.filter(Q(title__icontains=term) | Q(description__icontains=term))
+        return queryset.annotate(search_rank=Value(0.0, output_field=FloatField()))
+
+
+class SQLiteFTSSearchBackend(BaseSearchBackend):
+    """
+    SQLite backend using the FTS5 virtual table created in migration 0014.
+
+    Each term is matched as a prefix, results are ranked by bm25 with title weighted
+    above description. Searches without a matchable term return no results.
+    """
+    table = 'offers_app_offer_fts'
+
+    def build_match(self, terms):
+        """
+        Returns the MATCH expression with one prefix phrase per term. Terms without a
+        letter or digit are dropped, as the tokenizer yields no token for them.
+        """
+        terms = [term.replace('"', '') for term in terms]
+        return ' '.join(f'"{term}"*' for term in terms if any(char.isalnum() for char in term))
+
+    def search(self, queryset, terms):
+        match = self.build_match(terms)
+        if not match:
+            return queryset.annotate(search_rank=Value(0.0, output_field=FloatField())).none()
+        # The matching ids come from one FTS query; bm25() needs a MATCH in the same query,
+        # so the rank is a correlated lookup by rowid, which FTS5 answers without a scan.
+        offer_table = queryset.model._meta.db_table
+        matched_ids = RawSQL(f'SELECT rowid FROM {self.table} WHERE {self.table} MATCH %s', [match])
+        rank = RawSQL(
+            f'SELECT -bm25({self.table}, 10.0, 1.0) FROM {self.table} '
+            f'WHERE {self.table} MATCH %s AND {self.table}.rowid = "{offer_table}"."id"',
+            [match],
+            output_field=FloatField(),
+        )
+        return queryset.filter(id__in=matched_ids).annotate(search_rank=rank)
+
+    def index(self, offer):
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {self.table} WHERE rowid = %s', [offer.pk])
+            cursor.execute(
+                f'INSERT INTO {self.table} (rowid, title, description) VALUES (%s, %s, %s)',
+                [offer.pk, offer.title, offer.description],
+            )
+
+    def index_many(self, offers):
+        with connection.cursor() as cursor:
+            cursor.executemany(f'DELETE FROM {self.table} WHERE rowid = %s', [[offer.pk] for offer in offers])
+            cursor.executemany(
+                f'INSERT INTO {self.table} (rowid, title, description) VALUES (%s, %s, %s)',
+                [[offer.pk, offer.title, offer.description] for offer in offers],
+            )
+
+    def remove(self, offer_id):
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {self.table} WHERE rowid = %s', [offer_id])
+
+    def rebuild(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {self.table}')
+            cursor.execute(
+                f'INSERT INTO {self.table} (rowid, title, description) '
+                f'SELECT id, title, description FROM offers_app_offer'
+            )
+
+
+class PostgresSearchBackend(BaseSearchBackend):
+    """
+    PostgreSQL backend using a weighted SearchVector over title and description.
+
+    The vector expression is backed by the GIN index created in migration 0014,
+    so no separate sync is needed.
+    """
+    config = 'english'
+
+    def search(self, queryset, terms):
+        from django.contrib.postgres.search import SearchQuery, SearchRank
+
+        vector = get_search_vector()
+        query = SearchQuery(' '.join(terms), config=self.config)
+        return queryset.annotate(
+            search=vector,
+            search_rank=SearchRank(vector, query),
+        ).filter(search=query)
+
+
+def get_search_vector():
+    """
+    Returns the weighted search vector used for the PostgreSQL GIN index and queries.
+    """
+    from django.contrib.postgres.search import SearchVector
+
+    return (
+        SearchVector('title', weight='A', config=PostgresSearchBackend.config)
+        + SearchVector('description', weight='B', config=PostgresSearchBackend.config)
+    )
+
+
+_backends = {}
+
+
+def get_search_backend():
+    """
+    Returns the configured offer search backend.
+
+    Uses the OFFER_SEARCH_BACKEND setting (dotted path) if present,
+    otherwise picks the backend matching the database vendor.
+    """
+    path = getattr(settings, 'OFFER_SEARCH_BACKEND', None)
+    if path is None:
+        path = {
+            'sqlite': 'offers_app.search.SQLiteFTSSearchBackend',
+            'postgresql': 'offers_app.search.PostgresSearchBackend',
+        }.get(connection.vendor, 'offers_app.search.SimpleSearchBackend')
+    if path not in _backends:
+        _backends[path] = import_string(path)()
+    return _backends[path]
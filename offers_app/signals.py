@@ -0,0 +1,109 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+from core.signals import get_previous
+from profile_app.models import Profile
+from reviews_app.models import Review
+from .cache import offer_list_cache
+from .models import Offer, OfferDetail
+from .search import get_search_backend
+
+
+@receiver(pre_delete, sender=Offer)
+def mark_offer_deleted_with_origin(sender, instance, origin=None, **kwargs):
+    """
+    Records the offer on the origin of the deletion (the deleted object or queryset).
+    Django sends all pre_delete signals before the first row is deleted, so the detail
+    handlers below know which offers go away in the same deletion, also in cascades
+    from a deleted user.
+    """
+    if origin is not None:
+        if not hasattr(origin, '_deleted_offer_ids'):
+            origin._deleted_offer_ids = set()
+        origin._deleted_offer_ids.add(instance.pk)
+
+
+def is_offer_deleted_with(offer_id, origin):
+    return offer_id in getattr(origin, '_deleted_offer_ids', ())
+
+
+@receiver(post_delete, sender=OfferDetail)
+def refresh_offer_min_values_on_detail_delete(sender, instance, origin=None, **kwargs):
+    """
+    Keeps Offer.min_price and Offer.min_delivery_time in sync when a detail is deleted.
+
+    Skipped when the offer is removed in the same deletion.
+    """
+    if is_offer_deleted_with(instance.offer_id, origin):
+        return
+    offer = Offer.objects.filter(pk=instance.offer_id).first()
+    if offer:
+        offer.refresh_min_values()
+
+
+@receiver(post_save, sender=Offer)
+def index_offer_on_save(sender, instance, **kwargs):
+    """
+    Keeps the offer search index in sync with title and description.
+    """
+    get_search_backend().index(instance)
+
+
+@receiver(post_delete, sender=Offer)
+def remove_offer_from_index_on_delete(sender, instance, **kwargs):
+    """
+    Removes a deleted offer from the search index.
+    """
+    get_search_backend().remove(instance.pk)
+
+
+def invalidate_offer_lists(user_id):
+    transaction.on_commit(lambda: offer_list_cache.bump(user_id))
+
+
+@receiver(post_save, sender=Offer)
+@receiver(post_delete, sender=Offer)
+def invalidate_offer_lists_on_offer_change(sender, instance, **kwargs):
+    """
+    Bumps the offer list cache versions after the transaction commits.
+    """
+    invalidate_offer_lists(instance.user_id)
+
+
+@receiver(post_save, sender=OfferDetail)
+@receiver(post_delete, sender=OfferDetail)
+def invalidate_offer_lists_on_detail_change(sender, instance, origin=None, **kwargs):
+    """
+    Detail changes alter min_price / min_delivery_time and the detail links of the list.
+    Skipped when the offer is removed in the same deletion, its own handler invalidates.
+    """
+    if is_offer_deleted_with(instance.offer_id, origin):
+        return
+    if OfferDetail.offer.is_cached(instance):
+        user_id = instance.offer.user_id
+    else:
+        user_id = Offer.objects.filter(pk=instance.offer_id).values_list('user_id', flat=True).first()
+    if user_id is not None:
+        invalidate_offer_lists(user_id)
+
+
+@receiver(post_save, sender=Profile)
+@receiver(post_delete, sender=Profile)
+def invalidate_offer_lists_on_profile_change(sender, instance, **kwargs):
+    """
+    The offer list shows the creator's names in user_details.
+    """
+    invalidate_offer_lists(instance.user_id)
+
+
+@receiver(post_save, sender=Review)
+@receiver(post_delete, sender=Review)
+def invalidate_offer_lists_on_review_change(sender, instance, **kwargs):
+    """
+    The offer list shows the creator's rating summary in user_details. A review moved to
+    another business user (see reviews_app.signals) changes the summaries of both users.
+    """
+    previous = get_previous(instance, 'review')
+    if previous is not None and previous['business_user_id'] != instance.business_user_id:
+        invalidate_offer_lists(previous['business_user_id'])
+    invalidate_offer_lists(instance.business_user_id)
@@ -1,3 +1,387 @@
+import io
+import os
+import tempfile
+from decimal import Decimal
+from unittest import mock
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import IntegrityError, connection, transaction
+from django.db.models import F, Prefetch
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory, APITestCase
+from auth_app.models import CustomUser
+from base_info_app.models import BaseInfo
+from profile_app.models import Profile
+from reviews_app.models import Review
+from .cache import offer_list_cache
+from .models import Feature, Offer, OfferDetail
+from .api.serializers import FastOfferListSerializer, OfferListSerializer, OfferSerializer
 
-# Create your tests here.
+
+class FastOfferListSerializerTests(APITestCase):
+    """
+    The fast offer list serializer must render byte-identical JSON to OfferListSerializer.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        business = CustomUser.objects.create_user(username='business', password='pw', type='business')
+        Profile.objects.create(user=business, username='business', first_name='Bea', last_name='Müller', type='business')
+        without_profile = CustomUser.objects.create_user(username='no_profile', password='pw', type='business')
+        for i, user in enumerate([business, business, without_profile]):
+            offer = Offer.objects.create(
+                user=user, title=f'Offer {i}', description='Beschreibung ä', image='offers/logo.png' if i == 0 else None,
+            )
+            for level, offer_type in enumerate(('basic', 'standard', 'premium'), start=1):
+                OfferDetail.objects.create(
+                    offer=offer, title=offer_type, revisions=level, delivery_time_in_days=10 - level,
+                    price=f'{level * 49}.90', features=['a'], offer_type=offer_type,
+                )
+            offer.refresh_min_values()
+        Offer.objects.create(user=business, title='Without details', description='-')
+        customer = CustomUser.objects.create_user(username='customer', password='pw', type='customer')
+        Review.objects.create(business_user=business, reviewer=customer, rating=4, description='Gut')
+
+    def setUp(self):
+        # The offer list response cache is invalidated on commit, which never happens in a TestCase.
+        cache.clear()
+
+    def render_both(self, queryset):
+        request = Request(APIRequestFactory().get('/api/offers/'))
+        context = {'request': request}
+        slow_queryset = queryset.prefetch_related(Prefetch('details', queryset=OfferDetail.objects.order_by('id')))
+        slow = JSONRenderer().render(OfferListSerializer(slow_queryset, many=True, context=context).data)
+        fast_serializer = FastOfferListSerializer(context=context)
+        fast = JSONRenderer().render(fast_serializer.serialize(fast_serializer.get_rows(queryset)))
+        return slow, fast
+
+    def test_output_is_byte_identical(self):
+        slow, fast = self.render_both(Offer.objects.order_by('id'))
+        self.assertEqual(slow, fast)
+
+    def test_list_endpoint_matches_model_serializer(self):
+        response = self.client.get(reverse('offer-create'), {'ordering': 'updated_at'})
+        slow, _ = self.render_both(Offer.objects.order_by('updated_at'))
+        self.assertEqual(response.content, b'{"count":4,"next":null,"previous":null,"results":' + slow + b'}')
+
+    def test_ndjson_accept_header_streams_without_cache(self):
+        hits = offer_list_cache.stats()['hits']
+        for _ in range(2):
+            response = self.client.get(reverse('offer-create'), HTTP_ACCEPT='application/x-ndjson')
+            self.assertEqual(response.status_code, 200)
+            lines = b''.join(response.streaming_content).splitlines()
+            self.assertEqual(len(lines), 4)
+        self.assertEqual(offer_list_cache.stats()['hits'], hits)
+
+    def test_etag_changes_when_min_price_changes(self):
+        etag = self.client.get(reverse('offer-create')).headers['ETag']
+        # The detail delete updates min_price with a queryset update, updated_at stays.
+        OfferDetail.objects.filter(offer__title='Offer 0', offer_type='basic').delete()
+        cache.clear()
+        response = self.client.get(reverse('offer-create'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_page_has_constant_query_count(self):
+        with self.assertNumQueries(3):
+            self.client.get(reverse('offer-create'))
+
+
+class OfferPayloadMixin:
+    """
+    Creates offers through the API as an authenticated business user.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.business = CustomUser.objects.create_user(username='business', password='pw', type='business')
+
+    def setUp(self):
+        self.client.force_authenticate(self.business)
+
+    def detail(self, offer_type, days, price):
+        return {
+            'title': offer_type, 'revisions': 1, 'delivery_time_in_days': days, 'price': price,
+            'features': ['Logo'], 'offer_type': offer_type,
+        }
+
+    def create_offer(self):
+        return self.client.post(reverse('offer-create'), {
+            'title': 'Logo', 'description': 'Design',
+            'details': [self.detail('basic', 5, '50.00'), self.detail('standard', 3, '80.00'), self.detail('premium', 7, '120.00')],
+        }, format='json')
+
+
+class OfferWriteTests(OfferPayloadMixin, APITestCase):
+    """
+    Offer create and update write the details in bulk inside one transaction.
+    """
+
+    def test_create_query_budget(self):
+        # savepoint, offer insert, search index (2), base info counter, details bulk insert,
+        # release savepoint, details of the response
+        with self.assertNumQueries(8):
+            response = self.create_offer()
+        self.assertEqual(response.status_code, 201)
+        offer = Offer.objects.get(pk=response.data['id'])
+        self.assertEqual((offer.min_price, offer.min_delivery_time), (Decimal('50.00'), 3))
+        self.assertEqual(offer.details.count(), 3)
+
+    def test_patch_query_budget_and_changed_fields(self):
+        offer_id = self.create_offer().data['id']
+        url = f'/api/offers/{offer_id}/'
+        details = [{'offer_type': 'basic', 'price': '20.00'}, {'offer_type': 'premium', 'price': '120.00'}]
+        # offer, offer owner (permission), savepoint, details, details bulk update, offer update,
+        # search index (2), release savepoint, details of the response
+        with self.assertNumQueries(10), CaptureQueriesContext(connection) as queries:
+            response = self.client.patch(url, {'title': 'Logo 2', 'details': details}, format='json')
+        self.assertEqual(response.status_code, 200)
+        detail_updates = [query['sql'] for query in queries.captured_queries if query['sql'].startswith('UPDATE "offers_app_offerdetail"')]
+        self.assertEqual(len(detail_updates), 1)
+        self.assertIn('"price"', detail_updates[0])
+        self.assertNotIn('"title"', detail_updates[0])
+        offer = Offer.objects.get(pk=offer_id)
+        self.assertEqual((offer.title, offer.min_price), ('Logo 2', Decimal('20.00')))
+
+
+class OfferMinValuesTests(OfferPayloadMixin, APITestCase):
+    """
+    Offer.min_price and Offer.min_delivery_time follow every change of the details.
+    """
+
+    def min_values(self, offer_id):
+        return tuple(Offer.objects.filter(pk=offer_id).values_list('min_price', 'min_delivery_time').get())
+
+    def test_min_values_after_detail_create_patch_and_delete(self):
+        offer_id = self.create_offer().data['id']
+        self.assertEqual(self.min_values(offer_id), (Decimal('50.00'), 3))
+
+        details = [{'offer_type': 'standard', 'price': '30.00'}, {'offer_type': 'premium', 'delivery_time_in_days': 1}]
+        self.client.patch(f'/api/offers/{offer_id}/', {'details': details}, format='json')
+        self.assertEqual(self.min_values(offer_id), (Decimal('30.00'), 1))
+
+        OfferDetail.objects.filter(offer_id=offer_id, offer_type='standard').delete()
+        self.assertEqual(self.min_values(offer_id), (Decimal('50.00'), 1))
+        OfferDetail.objects.filter(offer_id=offer_id).delete()
+        self.assertEqual(self.min_values(offer_id), (None, None))
+
+    def test_cascade_from_user_skips_refresh(self):
+        for _ in range(2):
+            self.create_offer()
+        with CaptureQueriesContext(connection) as queries:
+            self.business.delete()
+        offer_updates = [query['sql'] for query in queries.captured_queries if query['sql'].startswith('UPDATE "offers_app_offer"')]
+        self.assertEqual(offer_updates, [])
+        self.assertFalse(Offer.objects.exists())
+
+    def test_backfill_command(self):
+        offer_id = self.create_offer().data['id']
+        empty = Offer.objects.create(user=self.business, title='Empty', description='-')
+        Offer.objects.filter(pk=offer_id).update(min_price=None, min_delivery_time=None)
+        Offer.objects.filter(pk=empty.pk).update(min_price=Decimal('1.00'), min_delivery_time=1)
+        stdout = io.StringIO()
+        call_command('backfill_offer_min_values', stdout=stdout)
+        self.assertIn('Updated 2 offers.', stdout.getvalue())
+        self.assertEqual(self.min_values(offer_id), (Decimal('50.00'), 3))
+        self.assertEqual(self.min_values(empty.pk), (None, None))
+
+
+class OfferListInvalidationTests(OfferPayloadMixin, APITestCase):
+    """
+    Detail changes bump the creator's offer list version with one lookup of the offer owner.
+    """
+
+    def test_detail_save_reads_only_the_owner(self):
+        offer_id = self.create_offer().data['id']
+        detail = OfferDetail.objects.filter(offer_id=offer_id).first()
+        version = offer_list_cache.get_version(f'creator:{self.business.id}')
+        detail.price = Decimal('10.00')
+        with self.captureOnCommitCallbacks(execute=True), CaptureQueriesContext(connection) as queries:
+            detail.save()
+        offer_reads = [query['sql'] for query in queries.captured_queries if query['sql'].startswith('SELECT "offers_app_offer"."user_id"')]
+        self.assertEqual(len(offer_reads), 1)
+        self.assertEqual(len(queries.captured_queries), 2)
+        self.assertNotEqual(offer_list_cache.get_version(f'creator:{self.business.id}'), version)
+
+    def test_offer_delete_skips_detail_lookups(self):
+        offer_id = self.create_offer().data['id']
+        with CaptureQueriesContext(connection) as queries:
+            Offer.objects.get(pk=offer_id).delete()
+        offer_reads = [query['sql'] for query in queries.captured_queries if query['sql'].startswith('SELECT "offers_app_offer"."user_id"')]
+        self.assertEqual(offer_reads, [])
+
+
+class OfferImportExportTests(APITestCase):
+    """
+    export_offers writes JSONL that import_offers reads back, keeping the derived data in sync.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.business = CustomUser.objects.create_user(username='business', password='pw', type='business')
+        cls.importer = CustomUser.objects.create_user(username='importer', password='pw', type='business')
+        for i in range(5):
+            offer = Offer.objects.create(user=cls.business, title=f'Logo {i}', description='Design', image='offers/logo.png' if i == 0 else None)
+            for level, offer_type in enumerate(('basic', 'standard', 'premium'), start=1):
+                OfferDetail.objects.create(
+                    offer=offer, title=offer_type, revisions=level, delivery_time_in_days=10 - level - i,
+                    price=f'{level * 49 + i}.90', features=['a', 'b'], offer_type=offer_type,
+                )
+            offer.refresh_min_values()
+
+    def setUp(self):
+        cache.clear()
+
+    def export(self, *args):
+        with tempfile.NamedTemporaryFile(suffix='.jsonl', delete=False) as file:
+            path = file.name
+        self.addCleanup(os.remove, path)
+        call_command('export_offers', path, *args, stderr=io.StringIO())
+        return path
+
+    def test_export_matches_offer_serializer(self):
+        path = self.export()
+        with open(path, 'rb') as file:
+            lines = file.read().splitlines()
+        offers = Offer.objects.order_by('id').prefetch_related(Prefetch('details', queryset=OfferDetail.objects.order_by('id')))
+        self.assertEqual(lines, [JSONRenderer().render(OfferSerializer(offer).data) for offer in offers])
+
+    def test_import_round_trip(self):
+        path = self.export()
+        with open(path, 'a', encoding='utf-8') as file:
+            file.write('{"title": "Broken", "description": "-", "details": []}\n')
+        base_info = BaseInfo.load()
+        version = offer_list_cache.get_version(f'creator:{self.importer.id}')
+        stdout, stderr = io.StringIO(), io.StringIO()
+        call_command('import_offers', path, '--user', str(self.importer.id), '--batch-size', '2', stdout=stdout, stderr=stderr)
+
+        self.assertIn('Imported 5 offers, skipped 1', stdout.getvalue())
+        self.assertIn('Line 6: skipped', stderr.getvalue())
+        imported = Offer.objects.filter(user=self.importer).order_by('id')
+        originals = Offer.objects.filter(user=self.business).order_by('id')
+        fields = ['title', 'description', 'image', 'min_price', 'min_delivery_time']
+        self.assertEqual(list(imported.values_list(*fields)), list(originals.values_list(*fields)))
+        self.assertEqual(OfferDetail.objects.filter(offer__user=self.importer).count(), 15)
+        self.assertEqual(BaseInfo.load().offer_count, base_info.offer_count + 5)
+        self.assertNotEqual(offer_list_cache.get_version(f'creator:{self.importer.id}'), version)
+        response = self.client.get(reverse('offer-create'), {'search': 'Logo', 'creator_id': self.importer.id})
+        self.assertEqual(response.data['count'], 5)
+
+
+class OfferSearchTests(APITestCase):
+    """
+    The search filter ranks title matches first and returns nothing for terms without tokens.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        business = CustomUser.objects.create_user(username='business', password='pw', type='business')
+        Offer.objects.create(user=business, title='Website', description='Logo included')
+        Offer.objects.create(user=business, title='Logo design', description='Vector files')
+        Offer.objects.create(user=business, title='Backend', description='Django API')
+
+    def setUp(self):
+        cache.clear()
+
+    def test_title_matches_rank_first(self):
+        response = self.client.get(reverse('offer-create'), {'search': 'logo'})
+        self.assertEqual([offer['title'] for offer in response.data['results']], ['Logo design', 'Website'])
+
+    def test_terms_without_tokens_return_no_results(self):
+        for search in ('"', "'", '" -'):
+            response = self.client.get(reverse('offer-create'), {'search': search})
+            self.assertEqual(response.data['count'], 0, search)
+
+
+class OfferKeysetPaginationTests(APITestCase):
+    """
+    Cursor pages of the offer list cover every offer exactly once, in both directions.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        business = CustomUser.objects.create_user(username='business', password='pw', type='business')
+        for i, min_price in enumerate(['10.00', '20.00', '10.00', None, '30.00', '10.00', '20.00']):
+            Offer.objects.create(user=business, title=f'Logo {i}', description='Design', min_price=min_price)
+
+    def setUp(self):
+        cache.clear()
+
+    def walk(self, url, link):
+        pages = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            pages.append([offer['id'] for offer in response.data['results']])
+            url = response.data[link]
+        return pages, response
+
+    def test_next_and_previous_links_with_ties_and_nulls(self):
+        orderings = {
+            'min_price': (F('min_price').asc(nulls_last=True), 'id'),
+            '-min_price': (F('min_price').desc(nulls_last=True), '-id'),
+        }
+        for ordering, order_by in orderings.items():
+            expected = list(Offer.objects.order_by(*order_by).values_list('id', flat=True))
+            url = reverse('offer-create') + f'?ordering={ordering}&page_size=3&cursor='
+            pages, last_response = self.walk(url, 'next')
+            self.assertEqual([pk for page in pages for pk in page], expected)
+            self.assertEqual([len(page) for page in pages], [3, 3, 1])
+
+            backwards, first_response = self.walk(last_response.data['previous'], 'previous')
+            self.assertEqual(backwards, pages[-2::-1])
+            self.assertIsNone(first_response.data['previous'])
+
+    def test_invalid_cursor_returns_not_found(self):
+        response = self.client.get(reverse('offer-create'), {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, 404)
+
+    def test_search_with_cursor_uses_keyset_ordering(self):
+        response = self.client.get(reverse('offer-create'), {'search': 'logo', 'cursor': '', 'page_size': 10})
+        expected = Offer.objects.order_by('-updated_at', '-id').values_list('id', flat=True)
+        self.assertEqual([offer['id'] for offer in response.data['results']], list(expected))
+
+
+class FeatureGetOrCreateManyTests(TestCase):
+    """
+    Feature.get_or_create_many resolves any number of names with a fixed number of queries.
+    """
+
+    def test_query_count_does_not_grow_with_names(self):
+        with self.assertNumQueries(3):
+            Feature.get_or_create_many(['Logo', 'Source files'])
+        with self.assertNumQueries(3):
+            Feature.get_or_create_many([f'Feature {i}' for i in range(20)] + ['Logo'])
+        with self.assertNumQueries(1):
+            Feature.get_or_create_many(['Logo', 'Feature 3', 'Source files'])
+        with self.assertNumQueries(0):
+            self.assertEqual(Feature.get_or_create_many([]), [])
+
+    def test_duplicate_names_keep_input_order(self):
+        features = Feature.get_or_create_many(['Logo', 'Print', 'Logo', 'Print'])
+        self.assertEqual([feature.name for feature in features], ['Logo', 'Print'])
+        self.assertEqual(Feature.objects.count(), 2)
+
+    def test_returns_existing_rows(self):
+        existing = Feature.objects.create(name='Logo')
+        with transaction.atomic(), self.assertRaises(IntegrityError):
+            Feature.objects.create(name='Logo')
+        features = Feature.get_or_create_many(['Print', 'Logo'])
+        self.assertEqual([feature.name for feature in features], ['Print', 'Logo'])
+        self.assertEqual(features[1].pk, existing.pk)
+        self.assertEqual(Feature.objects.filter(name='Logo').count(), 1)
+
+    def test_row_inserted_concurrently_is_returned(self):
+        bulk_create = Feature.objects.bulk_create
+
+        def insert_first(features, **kwargs):
+            concurrent = Feature.objects.create(name='Logo')
+            bulk_create(features, **kwargs)
+            return [concurrent]
+
+        with mock.patch.object(Feature.objects, 'bulk_create', side_effect=insert_first):
+            features = Feature.get_or_create_many(['Logo'])
+        self.assertEqual(features[0].pk, Feature.objects.get(name='Logo').pk)
@@ -1,5 +1,6 @@
 from rest_framework import serializers
-from ..models import Order
+from core.fast_serializers import FastSerializer
+from ..models import BusinessOrderStats, Order
 from offers_app.api.serializers import FeatureSerializer
 
 class OrderSerializer(serializers.ModelSerializer):
@@ -25,6 +26,24 @@ class OrderSerializer(serializers.ModelSerializer):
             "created_at",
             "updated_at",
         ]
+
+
+
+class FastOrderSerializer(FastSerializer):
+    """
+    Fast read-only variant of OrderSerializer for the order list.
+    - features are loaded with one values_list() query per page, ordered by feature id.
+
+    """
+    serializer_class = OrderSerializer
+    related_fields = ('features',)
+
+    def load_related(self, rows):
+        features = {}
+        through_rows = Order.features.through.objects.filter(order_id__in=[row['id'] for row in rows])
+        for order_id, name in through_rows.order_by('order_id', 'feature_id').values_list('order_id', 'feature__name'):
+            features.setdefault(order_id, []).append(name)
+        return {'features': lambda row: features.get(row['id'], [])}
         
 
 class OrderCreateInputSerializer(serializers.Serializer):
@@ -32,4 +51,50 @@ class OrderCreateInputSerializer(serializers.Serializer):
     Serializer for the Order Patch.
 
     """
-    offer_detail_id = serializers.IntegerField()
\ No newline at end of file
+    offer_detail_id = serializers.IntegerField()
+
+
+class OrderBulkCreateInputSerializer(serializers.Serializer):
+    """
+    Serializer for the bulk order creation.
+    - offer_detail_ids: 1 to 50 distinct OfferDetail IDs
+
+    """
+    offer_detail_ids = serializers.ListField(child=serializers.IntegerField(), allow_empty=False, max_length=50)
+
+    def validate_offer_detail_ids(self, value):
+        if len(set(value)) != len(value):
+            raise serializers.ValidationError("Each OfferDetail ID may only be given once.")
+        return value
+
+
+
+class BusinessOrderStatsSerializer(serializers.ModelSerializer):
+    """
+    Serializer for the order counts of a business user by status.
+
+    """
+    class Meta:
+        model = BusinessOrderStats
+        fields = ["business_user", "in_progress_count", "delivered_count", "completed_count"]
+
+
+
+class BusinessStatsQuerySerializer(serializers.Serializer):
+    """
+    Serializer for the query params of the batched business stats.
+    - ids: comma separated business user IDs (at most 100)
+
+    """
+    ids = serializers.CharField()
+
+    def validate_ids(self, value):
+        try:
+            ids = list(dict.fromkeys(int(part) for part in value.split(',') if part.strip()))
+        except ValueError:
+            raise serializers.ValidationError("ids must be a comma separated list of integers.")
+        if not ids:
+            raise serializers.ValidationError("at least one id is required.")
+        if len(ids) > 100:
+            raise serializers.ValidationError("at most 100 ids are allowed.")
+        return ids
@@ -1,9 +1,12 @@
 from django.urls import path
-from .views import BusinessOrderCountView, CompletedOrderCountView, OrderListCreateView, OrderRetrieveUpdateDestroyView
+from .views import BusinessOrderCountView, BusinessStatsView, CompletedOrderCountView, OrderBulkCreateView, OrderListCreateView, OrderRetrieveUpdateDestroyView, OrderStatsView
 
 urlpatterns=[
     path('orders/',OrderListCreateView.as_view(), name="orders"),
+    path('orders/bulk/', OrderBulkCreateView.as_view(), name="orders-bulk"),
     path('orders/<int:pk>/', OrderRetrieveUpdateDestroyView.as_view(), name="order-detail"),
     path('order-count/<int:business_user_id>/', BusinessOrderCountView.as_view(), name="business-order-count"),
     path('completed-order-count/<int:business_user_id>/', CompletedOrderCountView.as_view(), name="completed-order-count"),
+    path('order-stats/<int:business_user_id>/', OrderStatsView.as_view(), name="order-stats"),
+    path('business-stats/', BusinessStatsView.as_view(), name="business-stats"),
 ]
\ No newline at end of file
@@ -1,24 +1,69 @@
-from django.db.models import Q
+from django.db import transaction
+from django.db.models import Avg, Count, Q
 from rest_framework import status, generics
+from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.exceptions import ValidationError
 from auth_app.models import CustomUser
+from core.conditional import ConditionalListMixin
+from core.fast_serializers import FastListMixin
 from offers_app.models import Feature, OfferDetail
-from orders_app.models import Order
+from orders_app.models import BusinessOrderStats, Order
+from reviews_app.models import Review
 from .permissions import OrderPermission
-from .serializers import OrderSerializer, OrderCreateInputSerializer
+from .serializers import FastOrderSerializer, BusinessOrderStatsSerializer, BusinessStatsQuerySerializer, OrderSerializer, OrderCreateInputSerializer, OrderBulkCreateInputSerializer
 
 
-class OrderListCreateView(generics.ListCreateAPIView):
+class OrderPagination(PageNumberPagination):
+    """
+
+    Opt-in pagination class for the order list.
+    - Only active if 'page' or 'page_size' is given, otherwise the full list is returned
+    - Default page size: 10
+    - Maximum allowed page size: 100
+
+    """
+    page_size = 10
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.page_query_param not in request.query_params and self.page_size_query_param not in request.query_params:
+            return None
+        return super().paginate_queryset(queryset, request, view)
+
+
+def build_order(customer_user, offer_detail):
+    """
+    Returns an unsaved Order for the given customer, copying the relevant fields from the OfferDetail.
+    The OfferDetail must be fetched with select_related('offer').
+    """
+    return Order(
+        customer_user=customer_user,
+        business_user_id=offer_detail.offer.user_id,
+        title=offer_detail.title,
+        revisions=offer_detail.revisions,
+        delivery_time_in_days=offer_detail.delivery_time_in_days,
+        price=offer_detail.price,
+        offer_type=offer_detail.offer_type,
+        offer_detail=offer_detail,
+        status="in_progress",
+    )
+
+
+class OrderListCreateView(ConditionalListMixin, FastListMixin, generics.ListCreateAPIView):
     """
     API endpoint to list all orders (GET) and create a new order (POST).
 
     GET:
-        - Returns a list of all orders.
+        - Returns a list of all orders of the user (as customer or business), newest first.
         - Requires the user to be authenticated.
-        - Uses OrderSerializer for response data.
+        - Uses OrderSerializer for response data, served by FastOrderSerializer.
+        - Paginated with OrderPagination if 'page' or 'page_size' is given.
+        - Streamed with '?stream=1' or '?stream=ndjson' (see StreamingListMixin).
+        - ETag for conditional GETs (see ConditionalListMixin).
 
     POST:
         - Creates a new order based on a given OfferDetail.
@@ -27,6 +72,7 @@ class OrderListCreateView(generics.ListCreateAPIView):
         - Automatically copies relevant fields from the OfferDetail:
             - title, revisions, delivery_time_in_days, price, offer_type
         - Features from the OfferDetail are added to the order (created if necessary).
+          All feature names are resolved in bulk and the order is written in one transaction.
         - Returns the full created order using OrderSerializer.
 
     Permissions:
@@ -35,11 +81,16 @@ class OrderListCreateView(generics.ListCreateAPIView):
     """
     # queryset = Order.objects.all()
     permission_classes = [IsAuthenticated, OrderPermission]
-
+    pagination_class = OrderPagination
+    fast_serializer_class = FastOrderSerializer
 
     def get_queryset(self):
         user = self.request.user
-        return Order.objects.filter(Q(customer_user=user) | Q(business_user=user))
+        return (
+            Order.objects.filter(Q(customer_user=user) | Q(business_user=user))
+            .prefetch_related('features')
+            .order_by('-created_at', '-id')
+        )
 
       
 
@@ -63,29 +114,67 @@ class OrderListCreateView(generics.ListCreateAPIView):
             raise ValidationError({"offer_detail_id": "OfferDetail with this ID does not exist."})
         
 
-        feature_objects = []
-        for name in offer_detail.features:
-            feature, _ = Feature.objects.get_or_create(name=name)
-            feature_objects.append(feature)
-
-        order = Order.objects.create(
-            customer_user=request.user,
-            business_user=offer_detail.offer.user,
-            title=offer_detail.title,
-            revisions=offer_detail.revisions,
-            delivery_time_in_days=offer_detail.delivery_time_in_days,
-            price=offer_detail.price,
-            offer_type=offer_detail.offer_type,
-            offer_detail=offer_detail,
-            status="in_progress",
-        )
-        order.features.set(feature_objects)
+        with transaction.atomic():
+            feature_objects = Feature.get_or_create_many(offer_detail.features)
+
+            order = build_order(request.user, offer_detail)
+            order.save()
+            order.features.add(*feature_objects)
 
         output_serializer = OrderSerializer(order)
         return Response(output_serializer.data, status=status.HTTP_201_CREATED)
     
 
 
+class OrderBulkCreateView(generics.GenericAPIView):
+    """
+    API endpoint to create several orders in one request (POST).
+
+    POST:
+        - Request body must include: {"offer_detail_ids": [<int>, ...]}
+        - Creates one order per given id; duplicate ids reject the whole request.
+        - All OfferDetails are fetched in one query; unknown ids reject the whole request.
+        - All feature names of the batch are resolved at once.
+        - Orders and their feature rows are inserted with bulk_create in one transaction.
+        - BusinessOrderStats are updated in the same transaction.
+        - Returns the created orders using OrderSerializer, in request order.
+
+    Permissions:
+        - User must be authenticated.
+        - OrderPermission ensures only 'customer' users can create orders.
+    """
+    permission_classes = [IsAuthenticated, OrderPermission]
+    serializer_class = OrderBulkCreateInputSerializer
+
+    def post(self, request, *args, **kwargs):
+        input_serializer = self.get_serializer(data=request.data)
+        input_serializer.is_valid(raise_exception=True)
+        offer_detail_ids = input_serializer.validated_data['offer_detail_ids']
+
+        offer_details = OfferDetail.objects.select_related('offer').in_bulk(offer_detail_ids)
+        missing_ids = sorted(set(offer_detail_ids) - offer_details.keys())
+        if missing_ids:
+            raise ValidationError({"offer_detail_ids": f"OfferDetails with these IDs do not exist: {missing_ids}"})
+
+        feature_names = [name for offer_detail in offer_details.values() for name in offer_detail.features]
+
+        with transaction.atomic():
+            features = {feature.name: feature for feature in Feature.get_or_create_many(feature_names)}
+            orders = Order.objects.bulk_create([
+                build_order(request.user, offer_details[offer_detail_id]) for offer_detail_id in offer_detail_ids
+            ])
+            Order.features.through.objects.bulk_create([
+                Order.features.through(order_id=order.id, feature_id=features[name].id)
+                for order in orders
+                for name in dict.fromkeys(order.offer_detail.features)
+            ])
+            BusinessOrderStats.add_orders(orders)
+
+        orders = Order.objects.filter(id__in=[order.id for order in orders]).prefetch_related('features').order_by('id')
+        output_serializer = OrderSerializer(orders, many=True)
+        return Response(output_serializer.data, status=status.HTTP_201_CREATED)
+
+
 class OrderRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
     """
     API view to retrieve, partially update, or delete an individual order by ID.
@@ -105,14 +194,38 @@ class OrderRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
     Permissions:
         - User must be authenticated.
         - Permission class OrderPermission enforces method- and object-level permissions.
+
+    Updates and deletes run in a transaction together with the BusinessOrderStats update.
     """
     queryset = Order.objects.all()
     serializer_class = OrderSerializer
     permission_classes = [IsAuthenticated, OrderPermission]
 
+    def perform_update(self, serializer):
+        with transaction.atomic():
+            serializer.save()
+
+    def perform_destroy(self, instance):
+        with transaction.atomic():
+            instance.delete()
+
 
 
 
+def get_business_order_stats(business_user_id):
+    """
+    Returns the BusinessOrderStats of a business user, or None if no such business user exists.
+    The user and the stats row are fetched in one query; a missing row is recomputed.
+    """
+    business_user = CustomUser.objects.filter(id=business_user_id, type='business').select_related('order_stats').first()
+    if business_user is None:
+        return None
+    try:
+        return business_user.order_stats
+    except BusinessOrderStats.DoesNotExist:
+        return BusinessOrderStats.recompute(business_user.id)
+
+
 class BusinessOrderCountView(APIView):
     """
 
@@ -126,20 +239,19 @@ class BusinessOrderCountView(APIView):
 
     Behavior:
     - Validates that the business user exists and has type 'business'.
-    - Returns the count of orders assigned to the business user with status 'in progress'.
+    - Returns the count of orders assigned to the business user with status 'in progress',
+      read from BusinessOrderStats.
     - If the business user does not exist or is not of type 'business', returns 404 error.
 
     """
     permission_classes = [IsAuthenticated]
 
     def get(self, request, business_user_id):
-        try:
-            business_user = CustomUser.objects.get(id=business_user_id, type='business')
-        except CustomUser.DoesNotExist:
+        stats = get_business_order_stats(business_user_id)
+        if stats is None:
             return Response({"error": "Business user not found."}, status=status.HTTP_404_NOT_FOUND)
 
-        count = Order.objects.filter(business_user=business_user, status='in progress').count()
-        return Response({"order_count": count}, status=status.HTTP_200_OK)
+        return Response({"order_count": stats.in_progress_count}, status=status.HTTP_200_OK)
     
 
 class CompletedOrderCountView(APIView):
@@ -155,17 +267,100 @@ class CompletedOrderCountView(APIView):
 
     Behavior:
     - Validates that the business user exists and has type 'business'.
-    - Returns the count of orders assigned to the business user with status 'completed'.
+    - Returns the count of orders assigned to the business user with status 'completed',
+      read from BusinessOrderStats.
     - If the business user does not exist or is not of type 'business', returns 404 error.
 
     """
     permission_classes = [IsAuthenticated]
 
     def get(self, request, business_user_id):
-        try:
-            business_user = CustomUser.objects.get(id=business_user_id, type='business')
-        except CustomUser.DoesNotExist:
+        stats = get_business_order_stats(business_user_id)
+        if stats is None:
             return Response({"error": "Business user not found."}, status=status.HTTP_404_NOT_FOUND)
 
-        count = Order.objects.filter(business_user=business_user, status='completed').count()
-        return Response({"completed_order_count": count}, status=status.HTTP_200_OK)
\ No newline at end of file
+        return Response({"completed_order_count": stats.completed_count}, status=status.HTTP_200_OK)
+
+
+class OrderStatsView(APIView):
+    """
+
+    API endpoint to retrieve the order counts of all statuses for a specific business user.
+
+    URL Parameter:
+    - business_user_id (int): The ID of the business user.
+
+    Permissions:
+    - Requires authenticated user.
+
+    Behavior:
+    - Validates that the business user exists and has type 'business'.
+    - Returns the in progress, delivered and completed order counts from BusinessOrderStats.
+    - If the business user does not exist or is not of type 'business', returns 404 error.
+
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, business_user_id):
+        stats = get_business_order_stats(business_user_id)
+        if stats is None:
+            return Response({"error": "Business user not found."}, status=status.HTTP_404_NOT_FOUND)
+
+        serializer = BusinessOrderStatsSerializer(stats)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+class BusinessStatsView(APIView):
+    """
+
+    API endpoint to retrieve the card statistics of several business users in one request.
+
+    Query Parameter:
+    - ids (str): Comma separated business user IDs, e.g. ?ids=1,2,3 (at most 100).
+
+    Permissions:
+    - Requires authenticated user (same as the single count endpoints).
+
+    Behavior:
+    - Returns one entry per existing business user, in the order of the given IDs:
+      order_count (in progress), completed_order_count, review_count and average_rating.
+    - IDs that do not belong to a business user are left out.
+    - A missing BusinessOrderStats row is recomputed from the Order table, like in the
+      single count endpoints.
+    - Order counts are read from BusinessOrderStats in one query; review counts and
+      averages are computed with one query grouped by business_user.
+
+    """
+    permission_classes = [IsAuthenticated, OrderPermission]
+
+    def get(self, request):
+        query_serializer = BusinessStatsQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        ids = query_serializer.validated_data['ids']
+
+        business_users = CustomUser.objects.filter(id__in=ids, type='business').select_related('order_stats').in_bulk()
+        reviews = {
+            row['business_user_id']: row
+            for row in Review.objects.filter(business_user_id__in=business_users.keys())
+            .values('business_user_id')
+            .annotate(review_count=Count('id'), average_rating=Avg('rating'))
+        }
+
+        results = []
+        for business_user_id in ids:
+            business_user = business_users.get(business_user_id)
+            if business_user is None:
+                continue
+            try:
+                stats = business_user.order_stats
+            except BusinessOrderStats.DoesNotExist:
+                stats = BusinessOrderStats.recompute(business_user_id)
+            review = reviews.get(business_user_id, {'review_count': 0, 'average_rating': None})
+            results.append({
+                "business_user": business_user_id,
+                "order_count": stats.in_progress_count,
+                "completed_order_count": stats.completed_count,
+                "review_count": review['review_count'],
+                "average_rating": round(review['average_rating'], 1) if review['average_rating'] is not None else 0,
+            })
+        return Response(results, status=status.HTTP_200_OK)
\ No newline at end of file
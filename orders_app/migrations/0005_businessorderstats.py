@@ -0,0 +1,40 @@
+# Generated by Django 5.2.7 on 2026-10-18 17:31
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_business_order_stats(apps, schema_editor):
+    Order = apps.get_model('orders_app', 'Order')
+    BusinessOrderStats = apps.get_model('orders_app', 'BusinessOrderStats')
+
+    stats = {}
+    for row in Order.objects.values('business_user_id', 'status').annotate(total=Count('id')):
+        counts = stats.setdefault(row['business_user_id'], {})
+        counts[f"{row['status']}_count"] = row['total']
+    BusinessOrderStats.objects.bulk_create([
+        BusinessOrderStats(business_user_id=business_user_id, **counts) for business_user_id, counts in stats.items()
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth_app', '0001_initial'),
+        ('orders_app', '0004_order_user_created_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BusinessOrderStats',
+            fields=[
+                ('business_user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='order_stats', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('in_progress_count', models.IntegerField(default=0)),
+                ('delivered_count', models.IntegerField(default=0)),
+                ('completed_count', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(backfill_business_order_stats, migrations.RunPython.noop),
+    ]
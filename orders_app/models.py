@@ -1,4 +1,6 @@
+from collections import Counter
 from django.db import models
+from django.db.models import Count, F
 from django.conf import settings
 from offers_app.models import Offer, OfferDetail, Feature
 
@@ -8,8 +10,9 @@ class Order(models.Model):
         ('delivered', 'Delivered'),
         ('completed', 'Completed'),
     ]
-    customer_user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='customer_orders')
-    business_user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='business_orders')
+    # Indexed by the composite (customer_user | business_user, ...) indexes below.
+    customer_user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='customer_orders', db_index=False)
+    business_user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='business_orders', db_index=False)
     offer_detail = models.ForeignKey(OfferDetail, on_delete=models.PROTECT, related_name='orders')
     title = models.CharField(max_length=255)
     revisions = models.IntegerField()
@@ -21,5 +24,79 @@ class Order(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     features = models.ManyToManyField(Feature, related_name='orders')
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['customer_user', 'created_at'], name='order_customer_created_idx'),
+            models.Index(fields=['business_user', 'created_at'], name='order_business_created_idx'),
+            # Covers the per-status counts of a business user (BusinessOrderStats.recompute).
+            models.Index(fields=['business_user', 'status'], name='order_business_status_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.created_at.date()} - {self.customer_user.username} ordered '{self.title}'"
+
+
+class BusinessOrderStats(models.Model):
+    """
+    Per-business order counts by status, backing the order count endpoints.
+
+    The counts are maintained by the signal handlers in orders_app.signals and by
+    OrderBulkCreateView for bulk inserts. A missing row is recomputed from the Order table.
+    """
+    business_user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, primary_key=True, related_name='order_stats')
+    in_progress_count = models.IntegerField(default=0)
+    delivered_count = models.IntegerField(default=0)
+    completed_count = models.IntegerField(default=0)
+
     def __str__(self):
-        return f"{self.created_at.date()} - {self.customer_user.username} ordered '{self.title}'"
\ No newline at end of file
+        return f"{self.business_user_id}: {self.in_progress_count} in progress - {self.delivered_count} delivered - {self.completed_count} completed"
+
+    @staticmethod
+    def count_field(status):
+        return f"{status}_count"
+
+    @classmethod
+    def apply_deltas(cls, business_user_id, deltas, recompute_missing=True):
+        """
+        Adds the given {status: delta} changes to the row of the business user in one UPDATE.
+        If the row does not exist yet it is recomputed, unless recompute_missing is False.
+        """
+        deltas = {cls.count_field(status): delta for status, delta in deltas.items() if delta}
+        if not deltas:
+            return
+        updated = cls.objects.filter(pk=business_user_id).update(**{field: F(field) + delta for field, delta in deltas.items()})
+        if not updated and recompute_missing:
+            cls.recompute(business_user_id)
+
+    @classmethod
+    def add_orders(cls, orders):
+        """
+        Counts newly created orders that bypassed the model signals, e.g. from bulk_create.
+        """
+        per_business_user = {}
+        for order in orders:
+            per_business_user.setdefault(order.business_user_id, Counter())[order.status] += 1
+        for business_user_id, deltas in per_business_user.items():
+            cls.apply_deltas(business_user_id, deltas)
+
+    @classmethod
+    def rebuild_all(cls):
+        """
+        Recomputes the rows of all business users from the Order table.
+        """
+        stats = {}
+        for row in Order.objects.values('business_user_id', 'status').annotate(total=Count('id')):
+            stats.setdefault(row['business_user_id'], {})[cls.count_field(row['status'])] = row['total']
+        cls.objects.all().delete()
+        cls.objects.bulk_create([cls(business_user_id=business_user_id, **counts) for business_user_id, counts in stats.items()])
+
+    @classmethod
+    def recompute(cls, business_user_id):
+        """
+        Recomputes the row of the business user from the Order table.
+        """
+        counts = {cls.count_field(status): 0 for status, _ in Order.STATUS_CHOICES}
+        for row in Order.objects.filter(business_user_id=business_user_id).values('status').annotate(total=Count('id')):
+            counts[cls.count_field(row['status'])] = row['total']
+        stats, _ = cls.objects.update_or_create(business_user_id=business_user_id, defaults=counts)
+        return stats
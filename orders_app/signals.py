@@ -0,0 +1,24 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from core.signals import get_previous, stash_previous
+from .models import BusinessOrderStats, Order
+
+
+@receiver(pre_save, sender=Order)
+def stash_previous_order(sender, instance, **kwargs):
+    stash_previous(sender, instance, ['business_user_id', 'status'], 'order_stats')
+
+
+@receiver(post_save, sender=Order)
+def count_order_on_save(sender, instance, created, **kwargs):
+    previous = get_previous(instance, 'order_stats')
+    if previous is not None:
+        if (previous['business_user_id'], previous['status']) == (instance.business_user_id, instance.status):
+            return
+        BusinessOrderStats.apply_deltas(previous['business_user_id'], {previous['status']: -1})
+    BusinessOrderStats.apply_deltas(instance.business_user_id, {instance.status: 1})
+
+
+@receiver(post_delete, sender=Order)
+def count_order_on_delete(sender, instance, **kwargs):
+    BusinessOrderStats.apply_deltas(instance.business_user_id, {instance.status: -1}, recompute_missing=False)
@@ -1,3 +1,240 @@
-from django.test import TestCase
+from django.db import connection
+from django.db.models import Prefetch
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+from auth_app.models import CustomUser
+from offers_app.models import Feature, Offer, OfferDetail
+from .models import BusinessOrderStats, Order
+from .api.serializers import FastOrderSerializer, OrderSerializer
+from .api.views import build_order
 
-# Create your tests here.
+
+class OrderListQueryCountTests(APITestCase):
+    """
+    Guards the order list against N+1 queries: the number of queries must not
+    depend on the number of orders or the page size.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.business = CustomUser.objects.create_user(username='business', password='pw', type='business')
+        cls.customer = CustomUser.objects.create_user(username='customer', password='pw', type='customer')
+        offer = Offer.objects.create(user=cls.business, title='Offer', description='Offer')
+        details = [
+            OfferDetail.objects.create(
+                offer=offer, title=offer_type, revisions=1, delivery_time_in_days=3, price='10.00',
+                features=[f'{offer_type} {i}' for i in range(3)], offer_type=offer_type,
+            )
+            for offer_type in ('basic', 'standard', 'premium')
+        ]
+        for i in range(30):
+            detail = OfferDetail.objects.select_related('offer').get(pk=details[i % 3].pk)
+            order = build_order(cls.customer, detail)
+            order.save()
+            order.features.add(*Feature.get_or_create_many(detail.features))
+
+    def setUp(self):
+        self.client.force_authenticate(self.customer)
+
+    def test_unpaginated_list_has_constant_query_count(self):
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('orders'))
+        self.assertEqual(len(response.data), 30)
+        self.assertEqual(len(response.data[0]['features']), 3)
+
+    def test_paginated_list_has_constant_query_count(self):
+        for page_size in (5, 20):
+            with self.assertNumQueries(3):
+                response = self.client.get(reverse('orders'), {'page_size': page_size})
+            self.assertEqual(response.data['count'], 30)
+            self.assertEqual(len(response.data['results']), page_size)
+
+    def test_business_user_sees_own_orders(self):
+        self.client.force_authenticate(self.business)
+        with self.assertNumQueries(3):
+            response = self.client.get(reverse('orders'), {'page': 2})
+        self.assertEqual(len(response.data['results']), 10)
+        self.assertEqual(Order.objects.filter(business_user=self.business).count(), 30)
+
+    def test_unchanged_list_returns_not_modified(self):
+        etag = self.client.get(reverse('orders')).headers['ETag']
+        response = self.client.get(reverse('orders'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertNotIn('Last-Modified', response.headers)
+
+        # A delete moves no timestamp but changes the list.
+        Order.objects.filter(pk=Order.objects.first().pk).delete()
+        response = self.client.get(reverse('orders'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+
+class BusinessStatsTests(APITestCase):
+    """
+    Business users without a BusinessOrderStats row get their counts recomputed, not zeros.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.business = CustomUser.objects.create_user(username='business', password='pw', type='business')
+        cls.customer = CustomUser.objects.create_user(username='customer', password='pw', type='customer')
+        offer = Offer.objects.create(user=cls.business, title='Offer', description='Offer')
+        detail = OfferDetail.objects.create(
+            offer=offer, title='basic', revisions=1, delivery_time_in_days=3, price='10.00',
+            features=[], offer_type='basic',
+        )
+        for _ in range(2):
+            build_order(cls.customer, detail).save()
+
+    def test_missing_stats_row_is_recomputed(self):
+        BusinessOrderStats.objects.all().delete()
+        self.client.force_authenticate(self.customer)
+        response = self.client.get(reverse('business-stats'), {'ids': f'{self.business.id}'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data[0]['order_count'], 2)
+        self.assertEqual(BusinessOrderStats.objects.get(pk=self.business.id).in_progress_count, 2)
+
+
+class BusinessOrderStatsSignalTests(APITestCase):
+    """
+    The BusinessOrderStats counters follow order creates, status changes and deletes.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.business = CustomUser.objects.create_user(username='business', password='pw', type='business')
+        cls.customer = CustomUser.objects.create_user(username='customer', password='pw', type='customer')
+        cls.admin = CustomUser.objects.create_user(username='admin', password='pw', type='customer', is_staff=True)
+        offer = Offer.objects.create(user=cls.business, title='Offer', description='Offer')
+        cls.detail = OfferDetail.objects.create(
+            offer=offer, title='basic', revisions=1, delivery_time_in_days=3, price='10.00',
+            features=[], offer_type='basic',
+        )
+
+    def get_counts(self):
+        stats = BusinessOrderStats.objects.get(business_user=self.business)
+        return stats.in_progress_count, stats.delivered_count, stats.completed_count
+
+    def test_counts_follow_create_update_and_delete(self):
+        self.client.force_authenticate(self.customer)
+        order_ids = [
+            self.client.post(reverse('orders'), {'offer_detail_id': self.detail.id}, format='json').data['id']
+            for _ in range(2)
+        ]
+        self.assertEqual(self.get_counts(), (2, 0, 0))
+
+        self.client.force_authenticate(self.business)
+        response = self.client.patch(reverse('order-detail', args=[order_ids[0]]), {'status': 'completed'}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.get_counts(), (1, 0, 1))
+
+        self.client.force_authenticate(self.admin)
+        response = self.client.delete(reverse('order-detail', args=[order_ids[1]]))
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(self.get_counts(), (0, 0, 1))
+
+    def test_order_count_endpoints_read_the_counters(self):
+        # The order count used to filter on the misspelt status 'in progress' and was always 0.
+        for _ in range(2):
+            build_order(self.customer, self.detail).save()
+        Order.objects.filter(pk=Order.objects.first().pk).update(status='completed')
+        BusinessOrderStats.recompute(self.business.id)
+
+        self.client.force_authenticate(self.customer)
+        response = self.client.get(reverse('business-order-count', args=[self.business.id]))
+        self.assertEqual(response.data, {'order_count': 1})
+        response = self.client.get(reverse('completed-order-count', args=[self.business.id]))
+        self.assertEqual(response.data, {'completed_order_count': 1})
+
+
+class OrderBulkCreateTests(APITestCase):
+    """
+    The bulk endpoint inserts all orders of a request with a fixed number of queries, or none at all.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.business = CustomUser.objects.create_user(username='business', password='pw', type='business')
+        cls.customer = CustomUser.objects.create_user(username='customer', password='pw', type='customer')
+        offer = Offer.objects.create(user=cls.business, title='Offer', description='Offer')
+        cls.details = [
+            OfferDetail.objects.create(
+                offer=offer, title=f'Detail {i}', revisions=1, delivery_time_in_days=3, price='10.00',
+                features=[f'Feature {i}a', f'Feature {i}b'], offer_type='basic',
+            )
+            for i in range(7)
+        ]
+
+    def setUp(self):
+        self.client.force_authenticate(self.customer)
+
+    def bulk_create(self, details):
+        return self.client.post(reverse('orders-bulk'), {'offer_detail_ids': [detail.id for detail in details]}, format='json')
+
+    def test_query_count_does_not_depend_on_batch_size(self):
+        # An existing stats row, so neither request recomputes it.
+        BusinessOrderStats.recompute(self.business.id)
+        query_counts = []
+        for details in (self.details[:2], self.details[2:7]):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.bulk_create(details)
+            self.assertEqual(response.status_code, 201)
+            self.assertEqual([order['title'] for order in response.data], [detail.title for detail in details])
+            self.assertEqual(len(response.data[0]['features']), 2)
+            query_counts.append(len(queries))
+        self.assertEqual(query_counts[0], query_counts[1])
+
+    def test_duplicate_and_unknown_ids_write_nothing(self):
+        for offer_detail_ids in ([self.details[0].id, self.details[0].id], [self.details[0].id, 999999]):
+            response = self.client.post(reverse('orders-bulk'), {'offer_detail_ids': offer_detail_ids}, format='json')
+            self.assertEqual(response.status_code, 400)
+            self.assertIn('offer_detail_ids', response.data)
+        self.assertFalse(Order.objects.exists())
+        self.assertFalse(BusinessOrderStats.objects.filter(in_progress_count__gt=0).exists())
+
+    def test_only_customers_can_create_orders(self):
+        self.client.force_authenticate(self.business)
+        self.assertEqual(self.bulk_create(self.details[:2]).status_code, 403)
+        self.assertFalse(Order.objects.exists())
+
+    def test_business_order_stats_count_bulk_orders(self):
+        self.bulk_create(self.details[:3])
+        stats = BusinessOrderStats.objects.get(business_user=self.business)
+        self.assertEqual((stats.in_progress_count, stats.delivered_count, stats.completed_count), (3, 0, 0))
+
+
+class FastOrderSerializerTests(APITestCase):
+    """
+    The fast order serializer must render byte-identical JSON to OrderSerializer.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.business = CustomUser.objects.create_user(username='business', password='pw', type='business')
+        cls.customer = CustomUser.objects.create_user(username='customer', password='pw', type='customer')
+        offer = Offer.objects.create(user=cls.business, title='Offer', description='Offer')
+        for price, features in (('10.00', ['Logo', 'Icons']), ('1234.5', []), ('99.99', ['Prüfung'])):
+            detail = OfferDetail.objects.create(
+                offer=offer, title='Paket', revisions=-1, delivery_time_in_days=3, price=price,
+                features=features, offer_type='basic',
+            )
+            detail.offer = offer
+            order = build_order(cls.customer, detail)
+            order.save()
+            order.features.add(*Feature.get_or_create_many(features))
+        Order.objects.filter(pk=order.pk).update(status='completed')
+
+    def test_output_is_byte_identical(self):
+        queryset = Order.objects.order_by('-created_at', '-id')
+        slow_queryset = queryset.prefetch_related(Prefetch('features', queryset=Feature.objects.order_by('id')))
+        slow = JSONRenderer().render(OrderSerializer(slow_queryset, many=True).data)
+        fast_serializer = FastOrderSerializer()
+        fast = JSONRenderer().render(fast_serializer.serialize(fast_serializer.get_rows(queryset)))
+        self.assertEqual(slow, fast)
+
+    def test_list_endpoint_matches_model_serializer(self):
+        self.client.force_authenticate(self.customer)
+        response = self.client.get(reverse('orders'))
+        queryset = Order.objects.order_by('-created_at', '-id').prefetch_related('features')
+        self.assertEqual(response.content, JSONRenderer().render(OrderSerializer(queryset, many=True).data))
@@ -1,6 +1,7 @@
 from rest_framework import serializers
 from ..models import Profile
 from auth_app.models import CustomUser
+from reviews_app.api.serializers import get_rating_summary
 class ProfileSerializer(serializers.ModelSerializer):
 
     """
@@ -56,11 +57,15 @@ class BusinessProfileSerializer(serializers.ModelSerializer):
     This serializer is optimized for public views or listings of business profiles.
     It excludes private fields such as email and created_at for privacy and simplicity.
 
+    - rating_summary: review count, rating sum, average and star histogram of the user,
+      read from BusinessRatingSummary (select_related 'user__rating_summary').
+
     """
 
     username = serializers.CharField(source='user.username', read_only=True)
     type = serializers.CharField(source='user.type', read_only=True)
     file = serializers.ImageField(required=False, allow_null=True)
+    rating_summary = serializers.SerializerMethodField()
    
 
     class Meta:
@@ -76,8 +81,12 @@ class BusinessProfileSerializer(serializers.ModelSerializer):
             'description', 
             'working_hours',
             'type',
+            'rating_summary',
         ]
 
+    def get_rating_summary(self, obj):
+        return get_rating_summary(obj.user)
+
 
 
 class CustomerProfileSerializer(serializers.ModelSerializer):
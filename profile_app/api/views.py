@@ -3,13 +3,52 @@ from rest_framework.exceptions import NotFound
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from core.conditional import ConditionalListMixin, ConditionalRetrieveMixin
+from core.pagination import KeysetPagination
+from core.streaming import StreamingListMixin
+from reviews_app.models import BusinessRatingSummary
 from ..models import Profile
 from .permissions import IsProfileOwner
 from .serializers import BusinessProfileSerializer, CustomerProfileSerializer, ProfileSerializer
 
+# Columns loaded for the profile lists: the serialized fields plus the cursor column.
+LIST_FIELDS = {
+    'business': [
+        'user__username', 'user__type', 'first_name', 'last_name', 'file', 'location',
+        'tel', 'description', 'working_hours', 'created_at',
+        *(f'user__rating_summary__{field}' for field in BusinessRatingSummary.counter_fields()),
+    ],
+    'customer': ['user__username', 'user__type', 'first_name', 'last_name', 'file', 'created_at'],
+}
+# Relations joined for the profile lists; business profiles embed the rating summary.
+LIST_RELATED = {
+    'business': ['user__rating_summary'],
+    'customer': ['user'],
+}
+
+
+class ProfilePagination(KeysetPagination):
+    """
+
+    Opt-in keyset pagination for the profile lists.
+    - Only active if 'cursor' (empty for the first page) or 'page_size' is given,
+      otherwise the full list is returned
+    - Ordering: 'created_at' (ascending or descending), 'id' as tie-breaker
+    - Default ordering: newest profiles first
+    - Default page size: 10, maximum: 100
+
+    """
+    ordering_fields = ['created_at']
+    default_ordering = '-created_at'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.cursor_query_param not in request.query_params and self.page_size_query_param not in request.query_params:
+            return None
+        return super().paginate_queryset(queryset, request, view)
+
      
 
-class BusinessAndCustomerProfileView(generics.ListAPIView):
+class BusinessAndCustomerProfileView(ConditionalListMixin, StreamingListMixin, generics.ListAPIView):
     """
     View: BusinessAndCustomerProfileView
 
@@ -17,16 +56,32 @@ class BusinessAndCustomerProfileView(generics.ListAPIView):
     Returns a list of user profiles filtered by type ('customer' or 'business').
     The serializer used depends on the type provided via the URL parameter.
 
+    Behavior:
+    - Uses the (type, created_at, id) index for filtering and ordering.
+    - Loads the user (and for business profiles the rating summary) in the same query
+      and only the serialized columns.
+    - Paginated with ProfilePagination when 'cursor' or 'page_size' is given.
+    - Streamed with '?stream=1' or '?stream=ndjson' (see StreamingListMixin).
+    - ETag for conditional GETs (see ConditionalListMixin); streamed responses get none.
+
     Permissions:
     - Only accessible to authenticated users.
 
 
     """
     permission_classes = [IsAuthenticated]
+    pagination_class = ProfilePagination
 
     def get_queryset(self):
         type = self.kwargs.get('type')
-        return Profile.objects.filter(type=type)
+        if type not in LIST_FIELDS:
+            raise NotFound("Profile type not found")
+        return (
+            Profile.objects.filter(type=type)
+            .select_related(*LIST_RELATED[type])
+            .only(*LIST_FIELDS[type])
+            .order_by('-created_at', '-id')
+        )
     
     def get_serializer_class(self):
         profile_type = self.kwargs.get('type')
@@ -36,7 +91,7 @@ class BusinessAndCustomerProfileView(generics.ListAPIView):
             return BusinessProfileSerializer
 
   
-class SingleProfileView(generics.RetrieveUpdateAPIView):
+class SingleProfileView(ConditionalRetrieveMixin, generics.RetrieveUpdateAPIView):
     """
     View: SingleProfileView
 
@@ -48,6 +103,10 @@ class SingleProfileView(generics.RetrieveUpdateAPIView):
     - User must be authenticated (IsAuthenticated).
     - User must be the owner of the profile (IsProfileOwner).
 
+    Conditional GET:
+    - ETag from the profile columns plus username and type of the user (no Last-Modified,
+      Profile has no update timestamp).
+
     """
     queryset = Profile.objects.all()
     serializer_class = ProfileSerializer
@@ -56,11 +115,14 @@ class SingleProfileView(generics.RetrieveUpdateAPIView):
     def get_object(self):
         pk = self.kwargs.get('pk')
         try:
-            profile =  Profile.objects.get(user=pk)
+            profile =  Profile.objects.select_related('user').get(user=pk)
         except Profile.DoesNotExist:
            raise NotFound("Profile not found")
         
         self.check_object_permissions(self.request, profile)
                                       
         return profile
+
+    def get_etag_parts(self, instance):
+        return [*super().get_etag_parts(instance), instance.user.username, instance.user.type]
     
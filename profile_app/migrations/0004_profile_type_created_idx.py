@@ -0,0 +1,24 @@
+# Generated by Django 5.2.7 on 2026-10-18 17:41
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profile_app', '0003_remove_profile_uploaded_at'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='profile',
+            name='file',
+            field=models.CharField(blank=True, default='', max_length=255, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='profile',
+            index=models.Index(fields=['type', 'created_at', 'id'], name='profile_type_created_idx'),
+        ),
+    ]
@@ -15,7 +15,12 @@ class Profile(models.Model):
     type = models.CharField()
     email = models.EmailField(max_length=50, blank=True, default="")
     created_at = models.DateTimeField(auto_now_add=True)
- 
+
+    class Meta:
+        indexes = [
+            # Serves the type filter and the keyset ordering of the profile lists.
+            models.Index(fields=['type', 'created_at', 'id'], name='profile_type_created_idx'),
+        ]
 
     def __str__(self):
         return f"{self.user.username}"
@@ -1,3 +1,96 @@
-from django.test import TestCase
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from auth_app.models import CustomUser
+from reviews_app.models import Review
+from .models import Profile
 
-# Create your tests here.
+
+def create_profile(username, type):
+    user = CustomUser.objects.create_user(username=username, type=type)
+    return Profile.objects.create(user=user, username=username, type=type)
+
+
+class ProfileListConditionalTests(APITestCase):
+    """
+    The profile lists answer a matching If-None-Match with 304 until a profile changes.
+    """
+
+    def setUp(self):
+        self.profile = create_profile('shop', 'business')
+        self.client.force_authenticate(self.profile.user)
+        self.url = reverse('business-profile', kwargs={'type': 'business'})
+
+    def test_etag_changes_with_profile(self):
+        etag = self.client.get(self.url).headers['ETag']
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        self.profile.location = 'Berlin'
+        self.profile.save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers['ETag'], etag)
+
+    def test_streamed_list_has_no_etag(self):
+        response = self.client.get(self.url, {'stream': 'ndjson'})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('ETag', response.headers)
+
+
+class ProfileListTests(APITestCase):
+    """
+    The profile lists page with a cursor on request and load only the serialized columns.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        for i in range(5):
+            create_profile(f'shop{i}', 'business')
+            create_profile(f'buyer{i}', 'customer')
+        cls.customer = CustomUser.objects.get(username='buyer0')
+        Review.objects.create(business_user=CustomUser.objects.get(username='shop0'), reviewer=cls.customer, rating=5, description='Gut')
+
+    def setUp(self):
+        self.client.force_authenticate(self.customer)
+
+    def url(self, type):
+        return reverse('business-profile', kwargs={'type': type})
+
+    def test_without_pagination_params_returns_the_full_list(self):
+        response = self.client.get(self.url('customer'))
+        self.assertIsInstance(response.data, list)
+        self.assertEqual(len(response.data), 5)
+
+    def test_page_size(self):
+        response = self.client.get(self.url('business'), {'page_size': 2})
+        self.assertEqual(len(response.data['results']), 2)
+        self.assertIsNotNone(response.data['next'])
+        self.assertIsNone(response.data['previous'])
+
+    def test_cursor_walks_every_profile_once(self):
+        for ordering, order_by in (('', ('-created_at', '-id')), ('created_at', ('created_at', 'id'))):
+            url = self.url('business') + f'?cursor=&page_size=2&ordering={ordering}'
+            users = []
+            while url:
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                users += [profile['user'] for profile in response.data['results']]
+                url = response.data['next']
+            expected = Profile.objects.filter(type='business').order_by(*order_by).values_list('user_id', flat=True)
+            self.assertEqual(users, list(expected))
+
+    def test_invalid_cursor_returns_not_found(self):
+        self.assertEqual(self.client.get(self.url('business'), {'cursor': 'x'}).status_code, 404)
+
+    def test_query_count_is_constant_without_deferred_loads(self):
+        for type in ('business', 'customer'):
+            with self.assertNumQueries(1):
+                first = self.client.get(self.url(type))
+            for i in range(5):
+                create_profile(f'{type}-extra{i}', type)
+            with self.assertNumQueries(1), CaptureQueriesContext(connection) as queries:
+                response = self.client.get(self.url(type))
+            self.assertEqual(len(response.data), len(first.data) + 5)
+            self.assertNotIn('"email"', queries.captured_queries[0]['sql'])
@@ -1,5 +1,6 @@
 from rest_framework import serializers
-from ..models import Review
+from core.fast_serializers import FastSerializer
+from ..models import BusinessRatingSummary, Review
 
 class ReviewSerializer(serializers.ModelSerializer):
     """
@@ -11,9 +12,8 @@ class ReviewSerializer(serializers.ModelSerializer):
     - Automatically sets fields like 'reviewer', 'created_at', and 'updated_at' as read-only.
 
     Validation:
-    - On creation (POST), it checks whether the currently authenticated user (reviewer)
-      has already submitted a review for the same business user (business_user).
-    - If such a review already exists, a validation error is raised to prevent duplicate reviews.
+    - One review per reviewer and business user is enforced by the
+      'review_reviewer_business_unique' constraint on insert, see save_review() in the views.
 
     """
     class Meta:
@@ -30,15 +30,44 @@ class ReviewSerializer(serializers.ModelSerializer):
         
         read_only_fields = ['reviewer', 'created_at', 'updated_at']
 
-    def validate(self, data):
-        request = self.context.get('request')
-        reviewer = request.user
-        business_user = data.get('business_user')
 
-        if self.instance is None:
-            already_exists = Review.objects.filter(reviewer=reviewer, business_user=business_user).exists()
+class FastReviewSerializer(FastSerializer):
+    """
 
-            if already_exists:
-                raise serializers.ValidationError("you have already left a review for this business user.")
-        
-        return data
\ No newline at end of file
+    Fast read-only variant of ReviewSerializer for the review list.
+    All fields are plain columns, so a page is built from a single values() query.
+
+    """
+    serializer_class = ReviewSerializer
+
+
+def rating_summary_data(counters):
+    """
+    Output of a business rating summary from its counter columns.
+
+    - counters maps the BusinessRatingSummary counter fields to their values; missing or
+      None values (no summary row) count as zero.
+    - average is rounded to one decimal place, 0 without reviews (like /api/base-info/).
+    - histogram maps the star ratings '1' to '5' to their review counts.
+    """
+    count = counters.get('review_count') or 0
+    rating_sum = counters.get('rating_sum') or 0
+    return {
+        'count': count,
+        'sum': rating_sum,
+        'average': round(rating_sum / count, 1) if count else 0,
+        'histogram': {
+            str(rating): counters.get(BusinessRatingSummary.count_field(rating)) or 0 for rating in BusinessRatingSummary.RATINGS
+        },
+    }
+
+
+def get_rating_summary(user):
+    """
+    Rating summary output of a user; load 'rating_summary' with select_related or
+    prefetch_related to avoid a query per user.
+    """
+    summary = getattr(user, 'rating_summary', None)
+    if summary is None:
+        return rating_summary_data({})
+    return rating_summary_data({field: getattr(summary, field) for field in BusinessRatingSummary.counter_fields()})
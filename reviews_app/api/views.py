@@ -1,23 +1,71 @@
+from django.db import IntegrityError, transaction
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters, generics
+from rest_framework.exceptions import ValidationError
+from rest_framework.settings import api_settings
 from rest_framework.permissions import IsAuthenticated
+from core.conditional import ConditionalListMixin
+from core.fast_serializers import FastListMixin
+from core.pagination import KeysetPagination
 from .filters import ReviewFilter
 from .permissions import ReviewPermission
-from .serializers import ReviewSerializer
+from .serializers import FastReviewSerializer, ReviewSerializer
 from ..models import Review
 
-class ReviewListCreateView(generics.ListCreateAPIView):
+DUPLICATE_REVIEW_MESSAGE = "you have already left a review for this business user."
+
+
+def save_review(serializer, **kwargs):
+    """
+    Saves the review without a pre-check; the unique (reviewer, business_user) constraint
+    rejects duplicates and the IntegrityError becomes the duplicate review error.
+    """
+    try:
+        with transaction.atomic():
+            serializer.save(**kwargs)
+    except IntegrityError:
+        raise ValidationError({api_settings.NON_FIELD_ERRORS_KEY: [DUPLICATE_REVIEW_MESSAGE]})
+
+
+class ReviewPagination(KeysetPagination):
+    """
+
+    Opt-in keyset pagination for the review list.
+    - Only active if 'cursor' (empty for the first page) or 'page_size' is given,
+      otherwise the full list is returned
+    - Ordering: 'updated_at' or 'rating' (ascending or descending), 'id' as tie-breaker
+    - Default ordering: newest updated_at first
+    - Filtered by business_user_id or reviewer_id, a page is a range scan of the matching
+      (user, ordering field, id) index; unfiltered lists use the (ordering field, id) indexes
+    - Default page size: 10, maximum: 100
+
+    """
+    ordering_fields = ['updated_at', 'rating']
+    default_ordering = '-updated_at'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.cursor_query_param not in request.query_params and self.page_size_query_param not in request.query_params:
+            return None
+        return super().paginate_queryset(queryset, request, view)
+
+
+class ReviewListCreateView(ConditionalListMixin, FastListMixin, generics.ListCreateAPIView):
     """
     API endpoint that allows reviews to be listed or created.
 
     Features:
     - Lists all reviews, optionally filtered by 'business_user_id' or 'reviewer_id' via query parameters.
-    - Supports ordering by 'updated_at' and 'rating' fields.
+    - Supports ordering by 'updated_at' and 'rating' fields, newest updated_at first by default.
+    - Cursor-paginated with ReviewPagination when 'cursor' or 'page_size' is given.
+    - Can be streamed with '?stream=1' or '?stream=ndjson' (see StreamingListMixin).
+    - Lists are serialized by FastReviewSerializer from .values() rows.
+    - ETag for conditional GETs (see ConditionalListMixin).
     - Only authenticated users can access this endpoint.
     - Permission restrictions:
         - Only users with type 'customer' can create reviews.
         - Only the reviewer who created a review can update or delete it.
     - When creating a review, the 'reviewer' field is automatically set to the current authenticated user.
+    - A second review of the same business user is rejected by the unique constraint (see save_review).
 
     """
     queryset = Review.objects.all()
@@ -26,9 +74,12 @@ class ReviewListCreateView(generics.ListCreateAPIView):
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_class= ReviewFilter
     ordering_fields = ['updated_at', 'rating']
+    ordering = ['-updated_at', '-id']
+    pagination_class = ReviewPagination
+    fast_serializer_class = FastReviewSerializer
 
     def perform_create(self, serializer):
-        serializer.save(reviewer=self.request.user)
+        save_review(serializer, reviewer=self.request.user)
 
 
 
@@ -51,3 +102,6 @@ class ReviewUpdateDeleteView(generics.RetrieveUpdateDestroyAPIView):
     serializer_class = ReviewSerializer
     permission_classes = [IsAuthenticated, ReviewPermission]
 
+    def perform_update(self, serializer):
+        save_review(serializer)
+
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.7 on 2026-10-18 17:51
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, F, Max, Sum
+
+
+def delete_duplicate_reviews(apps, schema_editor):
+    """
+    Keeps the most recent review per reviewer and business user and corrects the BaseInfo counters.
+    """
+    Review = apps.get_model('reviews_app', 'Review')
+    BaseInfo = apps.get_model('base_info_app', 'BaseInfo')
+
+    duplicates = (
+        Review.objects.values('reviewer', 'business_user')
+        .annotate(keep_id=Max('id'), total=Count('id')).filter(total__gt=1)
+    )
+    for duplicate in duplicates:
+        drop = Review.objects.filter(
+            reviewer=duplicate['reviewer'], business_user=duplicate['business_user'],
+        ).exclude(id=duplicate['keep_id'])
+        removed = drop.aggregate(count=Count('id'), rating_sum=Sum('rating'))
+        drop.delete()
+        BaseInfo.objects.filter(pk=1).update(
+            review_count=F('review_count') - removed['count'],
+            rating_sum=F('rating_sum') - removed['rating_sum'],
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base_info_app', '0001_initial'),
+        ('reviews_app', '0002_list_filter_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(delete_duplicate_reviews, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='review',
+            constraint=models.UniqueConstraint(fields=('reviewer', 'business_user'), name='review_reviewer_business_unique'),
+        ),
+    ]
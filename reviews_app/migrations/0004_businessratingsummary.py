@@ -0,0 +1,49 @@
+# Generated by Django 5.2.7 on 2026-10-18 17:54
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def backfill_business_rating_summaries(apps, schema_editor):
+    Review = apps.get_model('reviews_app', 'Review')
+    BusinessRatingSummary = apps.get_model('reviews_app', 'BusinessRatingSummary')
+
+    summaries = {}
+    rows = Review.objects.values('business_user_id', 'rating').annotate(total=Count('id'), rating_total=Sum('rating'))
+    for row in rows:
+        counters = summaries.setdefault(row['business_user_id'], {'review_count': 0, 'rating_sum': 0})
+        counters['review_count'] += row['total']
+        counters['rating_sum'] += row['rating_total']
+        if 1 <= row['rating'] <= 5:
+            counters[f"rating_{row['rating']}_count"] = row['total']
+    BusinessRatingSummary.objects.bulk_create([
+        BusinessRatingSummary(business_user_id=business_user_id, **counters) for business_user_id, counters in summaries.items()
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth_app', '0002_customuser_email_unique'),
+        ('reviews_app', '0003_review_reviewer_business_unique'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BusinessRatingSummary',
+            fields=[
+                ('business_user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='rating_summary', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('review_count', models.IntegerField(default=0)),
+                ('rating_sum', models.IntegerField(default=0)),
+                ('rating_1_count', models.IntegerField(default=0)),
+                ('rating_2_count', models.IntegerField(default=0)),
+                ('rating_3_count', models.IntegerField(default=0)),
+                ('rating_4_count', models.IntegerField(default=0)),
+                ('rating_5_count', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.RunPython(backfill_business_rating_summaries, migrations.RunPython.noop),
+    ]
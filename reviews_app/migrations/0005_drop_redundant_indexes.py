@@ -0,0 +1,34 @@
+# Generated by Django 5.2.7 on 2026-10-18 18:16
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews_app', '0004_businessratingsummary'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='review',
+            name='review_reviewer_updated_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='review',
+            name='review_reviewer_rating_idx',
+        ),
+        migrations.AlterField(
+            model_name='review',
+            name='business_user',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='offer_reviews', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='review',
+            name='reviewer',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='offer_reviewer', to=settings.AUTH_USER_MODEL),
+        ),
+    ]
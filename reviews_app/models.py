@@ -1,13 +1,129 @@
 from django.db import models
+from django.db.models import Count, F, Sum
 from django.conf import settings
+from django.utils import timezone
 
 class Review(models.Model):
-    business_user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="offer_reviews")
-    reviewer = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="offer_reviewer")
+    # No single column FK indexes: the composite indexes and the unique constraint lead with these columns.
+    business_user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="offer_reviews", db_index=False)
+    reviewer = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="offer_reviewer", db_index=False)
     rating = models.IntegerField()
     description = models.CharField(max_length=255)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # The business_user_id filter combined with each ordering field, and the ordering
+            # fields alone. 'id' makes the order stable. The reviewer_id filter uses the unique
+            # constraint; a customer's few reviews are sorted without an index.
+            models.Index(fields=['business_user', 'updated_at', 'id'], name='review_business_updated_idx'),
+            models.Index(fields=['business_user', 'rating', 'id'], name='review_business_rating_idx'),
+            models.Index(fields=['updated_at', 'id'], name='review_updated_idx'),
+            models.Index(fields=['rating', 'id'], name='review_rating_idx'),
+        ]
+        constraints = [
+            # One review per customer and business user; also the index of the reviewer_id filter.
+            models.UniqueConstraint(fields=['reviewer', 'business_user'], name='review_reviewer_business_unique'),
+        ]
+
     def __str__(self):
         return f"{self.created_at.date()} reviewed by {self.reviewer.username} "
+
+
+class BusinessRatingSummary(models.Model):
+    """
+    Per-business review count, rating sum and 1-5 star histogram, embedded in the
+    business profiles and the offer list.
+
+    The counters are maintained by the signal handlers in reviews_app.signals.
+    A missing row means the business user has no reviews yet; rows missing for
+    reviewed users are recomputed from the Review table.
+    """
+    RATINGS = range(1, 6)
+
+    business_user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, primary_key=True, related_name='rating_summary')
+    review_count = models.IntegerField(default=0)
+    rating_sum = models.IntegerField(default=0)
+    rating_1_count = models.IntegerField(default=0)
+    rating_2_count = models.IntegerField(default=0)
+    rating_3_count = models.IntegerField(default=0)
+    rating_4_count = models.IntegerField(default=0)
+    rating_5_count = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.business_user_id}: {self.review_count} reviews - {self.average_rating} average"
+
+    @property
+    def average_rating(self):
+        if not self.review_count:
+            return 0
+        return round(self.rating_sum / self.review_count, 1)
+
+    @staticmethod
+    def count_field(rating):
+        return f"rating_{rating}_count"
+
+    @classmethod
+    def counter_fields(cls):
+        return ['review_count', 'rating_sum', *(cls.count_field(rating) for rating in cls.RATINGS)]
+
+    @classmethod
+    def review_deltas(cls, rating, sign=1):
+        """
+        Counter changes for adding (sign 1) or removing (sign -1) one review.
+        Ratings outside 1-5 are counted and summed but not part of the histogram.
+        """
+        deltas = {'review_count': sign, 'rating_sum': sign * rating}
+        if rating in cls.RATINGS:
+            deltas[cls.count_field(rating)] = sign
+        return deltas
+
+    @classmethod
+    def apply_deltas(cls, business_user_id, deltas, recompute_missing=True):
+        """
+        Adds the given {field: delta} changes to the row of the business user in one UPDATE.
+        If the row does not exist yet it is recomputed, unless recompute_missing is False.
+        """
+        deltas = {field: delta for field, delta in deltas.items() if delta}
+        if not deltas:
+            return
+        updates = {field: F(field) + delta for field, delta in deltas.items()}
+        updated = cls.objects.filter(pk=business_user_id).update(updated_at=timezone.now(), **updates)
+        if not updated and recompute_missing:
+            cls.recompute(business_user_id)
+
+    @classmethod
+    def aggregate_reviews(cls, reviews):
+        """
+        Returns {business_user_id: counters} for the given Review queryset.
+        """
+        summaries = {}
+        rows = reviews.values('business_user_id', 'rating').annotate(total=Count('id'), rating_total=Sum('rating'))
+        for row in rows:
+            counters = summaries.setdefault(row['business_user_id'], dict.fromkeys(cls.counter_fields(), 0))
+            counters['review_count'] += row['total']
+            counters['rating_sum'] += row['rating_total']
+            if row['rating'] in cls.RATINGS:
+                counters[cls.count_field(row['rating'])] += row['total']
+        return summaries
+
+    @classmethod
+    def rebuild_all(cls):
+        """
+        Recomputes the rows of all business users from the Review table.
+        """
+        summaries = cls.aggregate_reviews(Review.objects.all())
+        cls.objects.all().delete()
+        cls.objects.bulk_create([cls(business_user_id=business_user_id, **counters) for business_user_id, counters in summaries.items()])
+
+    @classmethod
+    def recompute(cls, business_user_id):
+        """
+        Recomputes the row of the business user from the Review table.
+        """
+        summaries = cls.aggregate_reviews(Review.objects.filter(business_user_id=business_user_id))
+        counters = summaries.get(business_user_id, dict.fromkeys(cls.counter_fields(), 0))
+        summary, _ = cls.objects.update_or_create(business_user_id=business_user_id, defaults=counters)
+        return summary
@@ -0,0 +1,30 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from core.signals import get_previous, stash_previous
+from .models import BusinessRatingSummary, Review
+
+
+@receiver(pre_save, sender=Review)
+def stash_previous_review(sender, instance, **kwargs):
+    """
+    Stores business_user_id and rating of a review being saved. Shared by all Review
+    post_save handlers (also in base_info_app and offers_app) via get_previous(instance, 'review').
+    """
+    stash_previous(sender, instance, ['business_user_id', 'rating'], 'review')
+
+
+@receiver(post_save, sender=Review)
+def count_review_on_save(sender, instance, created, **kwargs):
+    previous = get_previous(instance, 'review')
+    if previous is not None:
+        if (previous['business_user_id'], previous['rating']) == (instance.business_user_id, instance.rating):
+            return
+        BusinessRatingSummary.apply_deltas(previous['business_user_id'], BusinessRatingSummary.review_deltas(previous['rating'], -1))
+    BusinessRatingSummary.apply_deltas(instance.business_user_id, BusinessRatingSummary.review_deltas(instance.rating))
+
+
+@receiver(post_delete, sender=Review)
+def count_review_on_delete(sender, instance, **kwargs):
+    BusinessRatingSummary.apply_deltas(
+        instance.business_user_id, BusinessRatingSummary.review_deltas(instance.rating, -1), recompute_missing=False,
+    )
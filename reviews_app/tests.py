@@ -1,3 +1,172 @@
-from django.test import TestCase
+import base64
+import json
+from django.urls import reverse
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+from auth_app.models import CustomUser
+from profile_app.models import Profile
+from .models import BusinessRatingSummary, Review
+from .api.serializers import FastReviewSerializer, ReviewSerializer, rating_summary_data
 
-# Create your tests here.
+
+class FastReviewSerializerTests(APITestCase):
+    """
+    The fast review serializer must render byte-identical JSON to ReviewSerializer.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.customer = CustomUser.objects.create_user(username='customer', password='pw', type='customer')
+        for i in range(3):
+            business = CustomUser.objects.create_user(username=f'business{i}', password='pw', type='business')
+            Review.objects.create(business_user=business, reviewer=cls.customer, rating=i + 3, description=f'Gut "{i}" ✓')
+
+    def test_output_is_byte_identical(self):
+        queryset = Review.objects.order_by('-rating')
+        slow = JSONRenderer().render(ReviewSerializer(queryset, many=True).data)
+        fast_serializer = FastReviewSerializer()
+        fast = JSONRenderer().render(fast_serializer.serialize(fast_serializer.get_rows(queryset)))
+        self.assertEqual(slow, fast)
+
+    def test_list_endpoint_matches_model_serializer(self):
+        self.client.force_authenticate(self.customer)
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('reviews'), {'ordering': 'rating'})
+        queryset = Review.objects.order_by('rating')
+        self.assertEqual(response.content, JSONRenderer().render(ReviewSerializer(queryset, many=True).data))
+
+
+class DuplicateReviewTests(APITestCase):
+    """
+    A second review of the same business user is rejected by the unique constraint.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.customer = CustomUser.objects.create_user(username='customer', password='pw', type='customer')
+        cls.business = CustomUser.objects.create_user(username='business', password='pw', type='business')
+        cls.other_business = CustomUser.objects.create_user(username='other', password='pw', type='business')
+        Review.objects.create(business_user=cls.business, reviewer=cls.customer, rating=4, description='Gut')
+
+    def setUp(self):
+        self.client.force_authenticate(self.customer)
+
+    def test_duplicate_create_returns_validation_error(self):
+        response = self.client.post(reverse('reviews'), {'business_user': self.business.id, 'rating': 5, 'description': 'Nochmal'})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {'non_field_errors': ['you have already left a review for this business user.']})
+        self.assertEqual(Review.objects.filter(reviewer=self.customer).count(), 1)
+
+    def test_update_to_reviewed_business_returns_validation_error(self):
+        review = Review.objects.create(business_user=self.other_business, reviewer=self.customer, rating=3, description='Ok')
+        response = self.client.patch(reverse('review-delete-update', args=[review.id]), {'business_user': self.business.id})
+        self.assertEqual(response.status_code, 400)
+        review.refresh_from_db()
+        self.assertEqual(review.business_user, self.other_business)
+
+
+class BusinessRatingSummaryTests(APITestCase):
+    """
+    The rating summary follows review creates, rating changes and deletes and is embedded
+    in the business profile list without per-row queries.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.customer = CustomUser.objects.create_user(username='customer', password='pw', type='customer')
+        cls.businesses = []
+        for i in range(3):
+            business = CustomUser.objects.create_user(username=f'business{i}', password='pw', type='business')
+            Profile.objects.create(user=business, username=f'business{i}', type='business')
+            cls.businesses.append(business)
+
+    def setUp(self):
+        self.client.force_authenticate(self.customer)
+
+    def get_summary(self, business):
+        return rating_summary_data(
+            BusinessRatingSummary.objects.filter(business_user=business).values(*BusinessRatingSummary.counter_fields()).first() or {}
+        )
+
+    def test_summary_follows_create_update_and_delete(self):
+        business = self.businesses[0]
+        other = CustomUser.objects.create_user(username='other', password='pw', type='customer')
+        Review.objects.create(business_user=business, reviewer=other, rating=2, description='Naja')
+        response = self.client.post(reverse('reviews'), {'business_user': business.id, 'rating': 5, 'description': 'Top'})
+        self.assertEqual(self.get_summary(business), {
+            'count': 2, 'sum': 7, 'average': 3.5, 'histogram': {'1': 0, '2': 1, '3': 0, '4': 0, '5': 1},
+        })
+
+        self.client.patch(reverse('review-delete-update', args=[response.data['id']]), {'rating': 3})
+        self.assertEqual(self.get_summary(business)['histogram'], {'1': 0, '2': 1, '3': 1, '4': 0, '5': 0})
+
+        self.client.delete(reverse('review-delete-update', args=[response.data['id']]))
+        self.assertEqual(self.get_summary(business), {
+            'count': 1, 'sum': 2, 'average': 2.0, 'histogram': {'1': 0, '2': 1, '3': 0, '4': 0, '5': 0},
+        })
+
+    def test_update_reads_the_previous_review_once(self):
+        review = Review.objects.create(business_user=self.businesses[0], reviewer=self.customer, rating=4, description='Gut')
+        review.rating = 2
+        # One SELECT of the previous values, the review UPDATE, two rating summary
+        # and one BaseInfo counter UPDATE.
+        with self.assertNumQueries(5):
+            review.save(update_fields=['rating'])
+        self.assertEqual(self.get_summary(self.businesses[0])['sum'], 2)
+
+    def test_missing_row_is_recomputed(self):
+        business = self.businesses[1]
+        Review.objects.create(business_user=business, reviewer=self.customer, rating=4, description='Gut')
+        BusinessRatingSummary.objects.filter(business_user=business).delete()
+        other = CustomUser.objects.create_user(username='other', password='pw', type='customer')
+        Review.objects.create(business_user=business, reviewer=other, rating=1, description='Schlecht')
+        self.assertEqual(self.get_summary(business)['sum'], 5)
+
+    def test_business_profile_list_embeds_summary_in_one_query(self):
+        Review.objects.create(business_user=self.businesses[2], reviewer=self.customer, rating=5, description='Top')
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/profiles/business/')
+        summaries = {profile['user']: profile['rating_summary'] for profile in response.json()}
+        self.assertEqual(summaries[self.businesses[2].id]['count'], 1)
+        self.assertEqual(summaries[self.businesses[0].id], rating_summary_data({}))
+
+
+class ReviewPaginationTests(APITestCase):
+    """
+    Cursor pages of the review list cover every review exactly once, in order.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.business = CustomUser.objects.create_user(username='business', password='pw', type='business')
+        other_business = CustomUser.objects.create_user(username='other', password='pw', type='business')
+        for i in range(7):
+            customer = CustomUser.objects.create_user(username=f'customer{i}', password='pw', type='customer')
+            Review.objects.create(business_user=cls.business, reviewer=customer, rating=i % 3 + 1, description=f'{i}')
+            Review.objects.create(business_user=other_business, reviewer=customer, rating=5, description=f'{i}')
+        cls.customer = customer
+
+    def setUp(self):
+        self.client.force_authenticate(self.customer)
+
+    def test_pages_follow_rating_ordering(self):
+        url = reverse('reviews') + f'?business_user_id={self.business.id}&ordering=-rating&page_size=3'
+        ids = []
+        while url:
+            with self.assertNumQueries(1):
+                response = self.client.get(url)
+            self.assertLessEqual(len(response.data['results']), 3)
+            ids += [review['id'] for review in response.data['results']]
+            url = response.data['next']
+        expected = Review.objects.filter(business_user=self.business).order_by('-rating', '-id')
+        self.assertEqual(ids, list(expected.values_list('id', flat=True)))
+
+    def test_malformed_cursor_returns_not_found(self):
+        for ordering, value in (('-updated_at', [1]), ('-updated_at', 'yesterday'), ('-rating', {'a': 1})):
+            cursor = base64.urlsafe_b64encode(json.dumps({'o': ordering, 'v': value, 'id': 1}).encode()).decode()
+            response = self.client.get(reverse('reviews'), {'ordering': ordering, 'page_size': 3, 'cursor': cursor})
+            self.assertEqual(response.status_code, 404, value)
+
+    def test_unpaginated_list_is_unchanged(self):
+        response = self.client.get(reverse('reviews'), {'business_user_id': self.business.id})
+        self.assertEqual(len(response.data), 7)